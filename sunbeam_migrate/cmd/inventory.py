@@ -0,0 +1,94 @@
+# SPDX-FileCopyrightText: 2025 - Canonical Ltd
+# SPDX-License-Identifier: Apache-2.0
+
+import collections
+import json
+import logging
+import typing
+
+import click
+import prettytable
+
+from sunbeam_migrate import config
+from sunbeam_migrate.db import api as db_api
+from sunbeam_migrate.utils import connection_pool, inventory
+
+CONFIG = config.get_config()
+LOG = logging.getLogger()
+
+
+@click.group("inventory")
+def inventory_group():
+    """Manage the source inventory snapshot.
+
+    The snapshot is used to resolve resource dependencies without issuing
+    per-resource API requests.
+    """
+
+
+@inventory_group.command("sync")
+def sync_inventory():
+    """Refresh the source inventory snapshot.
+
+    All the supported resources are listed in bulk and stored in the
+    local database, along with their relations (e.g. port subnets,
+    router interfaces, volume attachments).
+    """
+    if not CONFIG.source_cloud_name:
+        raise click.ClickException("No source cloud specified.")
+
+    session = connection_pool.get_connection_pool().get_connection(
+        CONFIG.source_cloud_name
+    )
+    resources = inventory.sync_inventory(session, CONFIG.source_cloud_name)
+
+    table = prettytable.PrettyTable()
+    table.title = "Source inventory"
+    table.field_names = ["Resource type", "Count"]
+    table.sortby = "Resource type"
+    counts = collections.Counter(resource["resource_type"] for resource in resources)
+    for resource_type, count in counts.items():
+        table.add_row([resource_type, count])
+    print(table)
+
+
+@inventory_group.command("list")
+@click.option("--resource-type", help="Filter by resource type.")
+@click.option("--project-id", help="Filter by owner project id.")
+@click.option(
+    "--format",
+    "-f",
+    "output_format",
+    type=click.Choice(["json", "table"]),
+    default="table",
+    help="Set the output format.",
+)
+def list_inventory(output_format: str, resource_type: str, project_id: str):
+    """List the resources from the source inventory snapshot."""
+    if not CONFIG.source_cloud_name:
+        raise click.ClickException("No source cloud specified.")
+
+    filters: dict[str, typing.Any] = {}
+    if resource_type:
+        filters["resource_type"] = resource_type
+    if project_id:
+        filters["project_id"] = project_id
+
+    resources = db_api.get_inventory_resources(CONFIG.source_cloud_name, **filters)
+    if output_format == "json":
+        print(json.dumps([resource.to_dict() for resource in resources]))
+        return
+
+    table = prettytable.PrettyTable()
+    table.title = "Source inventory"
+    table.field_names = ["Resource type", "ID", "Name", "Project ID"]
+    for resource in resources:
+        table.add_row(
+            [
+                resource.resource_type,
+                resource.resource_id,
+                resource.name,
+                resource.project_id,
+            ]
+        )
+    print(table)
@@ -82,6 +82,14 @@ def start_migration(
     is_flag=True,
     help="Automatically migrate member resources (contained resources).",
 )
+@click.option(
+    "--workers",
+    type=int,
+    default=1,
+    show_default=True,
+    help="The number of concurrent migrations. Shared dependencies "
+    "are migrated only once.",
+)
 def start_batch_migration(
     resource_type: str,
     resource_filters: tuple[str],
@@ -90,10 +98,13 @@ def start_batch_migration(
     cleanup_source: bool,
     include_dependencies: bool,
     include_members: bool,
+    workers: int,
 ):
     """Migrate multiple resources that match the filters."""
     if not resource_type:
         raise click.ClickException("No resource type specified.")
+    if workers < 1:
+        raise click.ClickException("The number of workers must be positive.")
     if not resource_filters and not migrate_all:
         raise click.ClickException(
             "No filters specified. Specify '--all' to migrate all resources."
@@ -117,4 +128,5 @@ def start_batch_migration(
         cleanup_source=cleanup_source,
         include_dependencies=include_dependencies,
         include_members=include_members,
+        workers=workers,
     )
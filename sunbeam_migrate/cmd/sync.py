@@ -0,0 +1,49 @@
+# SPDX-FileCopyrightText: 2025 - Canonical Ltd
+# SPDX-License-Identifier: Apache-2.0
+
+import logging
+
+import click
+
+from sunbeam_migrate import constants, manager
+from sunbeam_migrate.db import api, models
+
+LOG = logging.getLogger()
+
+
+@click.command("sync")
+@click.option("--resource-type", help="The migrated resource type (e.g. share)")
+@click.argument("resource_id")
+@click.option(
+    "--cleanup-source",
+    is_flag=True,
+    help="Cleanup the resource on the source side if the synchronization succeeds.",
+)
+def sync_migration_data(resource_type: str, resource_id: str, cleanup_source: bool):
+    """Copy the data that changed since the resource was migrated.
+
+    Resources such as shares can be migrated while still in use, performing
+    a final incremental sync once the workloads are stopped.
+    """
+    migration = get_successful_migration(resource_type, resource_id)
+    mgr = manager.SunbeamMigrationManager()
+    mgr.sync_migration_data(migration, cleanup_source=cleanup_source)
+
+
+def get_successful_migration(resource_type: str, resource_id: str) -> models.Migration:
+    """Get the latest successful migration of the specified resource."""
+    if not resource_type:
+        raise click.ClickException("No resource type specified.")
+
+    migrations = [
+        migration
+        for migration in api.get_migrations(
+            source_id=resource_id, resource_type=resource_type
+        )
+        if migration.status in constants.LIST_STATUS_MIGRATED
+    ]
+    if not migrations:
+        raise click.ClickException(
+            f"Could not find a successful {resource_type} migration: {resource_id}"
+        )
+    return migrations[0]
@@ -0,0 +1,26 @@
+# SPDX-FileCopyrightText: 2025 - Canonical Ltd
+# SPDX-License-Identifier: Apache-2.0
+
+import logging
+
+import click
+
+from sunbeam_migrate import manager
+from sunbeam_migrate.cmd import sync
+
+LOG = logging.getLogger()
+
+
+@click.command("verify")
+@click.option("--resource-type", help="The migrated resource type (e.g. share)")
+@click.argument("resource_id")
+def verify_migration_data(resource_type: str, resource_id: str):
+    """Verify the data of a migrated resource.
+
+    Share files are verified using the manifest recorded while copying the
+    share data, only reading the destination share. The file checksums are
+    only checked if "share_copy_checksums" was enabled.
+    """
+    migration = sync.get_successful_migration(resource_type, resource_id)
+    mgr = manager.SunbeamMigrationManager()
+    mgr.verify_migration_data(migration)
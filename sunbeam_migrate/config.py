@@ -39,6 +39,11 @@ class SunbeamMigrateConfig(BaseModel):
     temporary_migration_dir: Path = Path(
         os.path.expandvars("$HOME/.local/share/sunbeam-migrate/migration_dir")
     )
+    # The directory used to store the manifests of the copied share files,
+    # used for incremental share data synchronization.
+    share_manifest_dir: Path = Path(
+        os.path.expandvars("$HOME/.local/share/sunbeam-migrate/share_manifests")
+    )
     # The multitenant mode allows identifying and migrating resources owned by
     # another tenant. This requires admin privileges.
     # The identity resources (domain, project, user) will be treated as
@@ -46,10 +51,97 @@ class SunbeamMigrateConfig(BaseModel):
     multitenant_mode: bool = True
 
     image_transfer_chunk_size: int = 32 * 1024 * 1024  # 32MB
+    # The number of reusable image chunk buffers used by the single stream
+    # transfer pipeline.
+    image_transfer_buffer_count: int = 4
+    # The number of concurrent ranged downloads used when transferring Glance
+    # images. If higher than 1, the images are uploaded using the Glance
+    # "glance-direct" import method.
+    image_transfer_streams: int = 1
+    # The maximum amount of image data buffered in memory when using
+    # multiple image transfer streams.
+    image_transfer_memory_limit: int = 512 * 1024 * 1024  # 512MB
+    # How long to wait for Glance image imports to complete (seconds).
+    image_import_timeout: int = 3600
+    # Let the destination cloud pull the images using the Glance
+    # "web-download" import method. The image data is served through a
+    # short-lived, single-use HTTP endpoint. Note that the data is still
+    # relayed by the migration host, this is not a direct transfer between
+    # the clouds.
+    image_web_download: bool = False
+    # The address and port used by the image HTTP endpoint. The address
+    # defaults to the local IP used to reach the destination image service.
+    # The port must be set when using "image_web_download" and allowed by
+    # the destination Glance "[import_filtering_opts] allowed_ports" option,
+    # which only allows ports 80 and 443 by default. Use 0 to select a
+    # random port, for example when the endpoint is reached through a proxy.
+    image_web_download_bind_address: str | None = None
+    image_web_download_port: int | None = None
+    # The base URL used by the destination cloud to reach the image HTTP
+    # endpoint, for example "http://10.0.0.5:8090". Defaults to the
+    # endpoint address and port.
+    image_web_download_url: str | None = None
+    # Spool the transferred images to "temporary_migration_dir", allowing
+    # interrupted downloads to be resumed and uploads to be retried without
+    # downloading the image again.
+    image_transfer_spool: bool = False
+    # The number of times to retry spooled image downloads and uploads.
+    image_transfer_retries: int = 3
+    # Skip the zero blocks of raw images when spooling them, creating sparse
+    # spool files. Implies "image_transfer_spool".
+    sparse_image_transfer: bool = False
+    # Convert raw images to sparse qcow2 images before uploading them when
+    # performing sparse transfers, avoiding the upload of zero blocks. The
+    # migrated images use the "qcow2" disk format instead of "raw", which
+    # may not suit the destination storage backend (e.g. Ceph).
+    sparse_image_transfer_qcow2: bool = False
+    # The image converter used for qcow2 sparse image transfers: "qemu-img",
+    # "python" or "auto", which prefers qemu-img if available.
+    image_converter: str = "auto"
 
     volume_upload_timeout: int = 1800
+    # The disk and container formats of the temporary Glance images used
+    # to transfer Cinder volumes, for example "qcow2" or the "compressed"
+    # container format. The Cinder defaults are used if unset.
+    volume_upload_disk_format: str | None = None
+    volume_upload_container_format: str | None = None
+    # The number of concurrent disk transfers (attached volumes and root
+    # disk) performed for each migrated instance.
+    instance_transfer_concurrency: int = 4
     # How much to wait for OpenStack resource provisioning.
     resource_creation_timeout: int = 300
+    # Create load balancers along with their listeners, pools, health
+    # monitors and members using a single fully-populated request, waiting
+    # once for the load balancer to become active. Falls back to creating
+    # the components one by one if the Octavia provider doesn't support it.
+    load_balancer_single_request_creation: bool = True
+    # The number of concurrent requests used to gather the source load
+    # balancer pools, members and health monitors.
+    load_balancer_source_concurrency: int = 8
+    # The maximum number of resources created using a single bulk request
+    # (e.g. Neutron networks, subnets and ports). Set to 1 to create the
+    # resources individually.
+    bulk_migration_chunk_size: int = 100
+    # Copy primary DNS zones using a Designate zone export and import,
+    # creating the recordsets in a single asynchronous task. The recordsets
+    # are copied individually if the zone import fails.
+    dns_zone_import: bool = True
+    # How long to cache the retrieved source resources (seconds), avoiding
+    # duplicate requests. Set to 0 to disable the cache.
+    source_object_cache_ttl: int = 300
+    # The resource status polling interval (seconds). The resources that
+    # are being waited for are polled together, the interval increasing
+    # up to "status_poll_max_interval" while no status changes occur.
+    status_poll_interval: float = 2
+    status_poll_max_interval: float = 15
+    # Estimate how long the resources take to become available based on
+    # previous migrations, polling sparsely until the expected completion
+    # time approaches.
+    adaptive_status_polling: bool = True
+    # The maximum age of the source inventory snapshot (seconds). Handlers
+    # resolve dependencies using the snapshot, if available, instead of issuing
+    # API requests. Set to 0 to ignore the snapshot.
+    inventory_max_age: int = 3600
 
     # Preserve the volume type when migrating volumes. Defaults to "false" for
     # increased compatibility. If enabled, the volume types will be migrated and
@@ -89,6 +181,19 @@ class SunbeamMigrateConfig(BaseModel):
     # share that's being migrated. If not provided, it will be detected
     # automatically.
     manila_local_access_ip: str | None = None
+    # The number of Manila share access rules that are created or deleted
+    # concurrently, used when migrating shares in batches.
+    share_access_rule_concurrency: int = 8
+    # The number of concurrent workers used to copy Manila share files.
+    share_copy_workers: int = 16
+    # Compute the file checksums while copying Manila share files, allowing
+    # the destination files to be verified later on. The data is hashed in
+    # the same read pass, however the in-kernel copy methods (copy_file_range,
+    # sendfile) can no longer be used, which reduces the copy throughput.
+    share_copy_checksums: bool = False
+    # The number of concurrent directory scanners used when copying Manila
+    # share files.
+    share_copy_scanners: int = 4
 
     # The name of the "member" Keystone role. When migrating certain resources
     # to other tenants (e.g. instances, volumes, shares), we need to a project
@@ -97,6 +202,9 @@ class SunbeamMigrateConfig(BaseModel):
     # sunbeam-migrate will transparently assign the member role to the user
     # that initiated the migration.
     member_role_name: str = "member"
+    # Revoke the role assignments created by sunbeam-migrate when the
+    # command completes. Pre-existing role assignments are preserved.
+    revoke_temporary_role_assignments: bool = False
 
     def load_config(self, path: Path):
         """Load the configuration from the specified file."""
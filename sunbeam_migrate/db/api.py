@@ -2,7 +2,9 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import logging
+import uuid
 
+from sqlalchemy import delete, insert
 from sqlalchemy.sql.expression import asc, desc
 
 from sunbeam_migrate import config
@@ -49,6 +51,19 @@ def get_migrations(
     )
 
 
+@session_utils.ensure_session
+def create_migrations(
+    migrations: list[models.Migration], session=None
+) -> list[models.Migration]:
+    """Save multiple migrations within a single transaction."""
+    for migration in migrations:
+        if not migration.uuid:
+            migration.uuid = str(uuid.uuid4())
+    session.add_all(migrations)
+    session.flush()
+    return migrations
+
+
 @session_utils.ensure_session
 def delete_migrations(session=None, soft_delete=True, **filters):
     """Delete migrations.
@@ -73,3 +88,122 @@ def restore_migrations(session=None, soft_delete=True, **filters):
     session.query(models.Migration).filter_by(**filters).update(
         {"archived": False},
     )
+
+
+@session_utils.ensure_session
+def replace_inventory(
+    cloud: str,
+    resources: list[dict],
+    links: list[dict],
+    session=None,
+):
+    """Replace the inventory snapshot of the specified cloud.
+
+    The records are inserted in bulk, within a single transaction.
+
+    :param cloud: the cloud name.
+    :param resources: a list of dicts describing InventoryResource records.
+    :param links: a list of dicts describing InventoryLink records.
+    """
+    LOG.debug(
+        "Replacing %s inventory: %s resources, %s links.",
+        cloud,
+        len(resources),
+        len(links),
+    )
+    for model in (
+        models.InventorySnapshot,
+        models.InventoryResource,
+        models.InventoryLink,
+    ):
+        session.execute(delete(model).where(model.cloud == cloud))
+
+    if resources:
+        session.execute(
+            insert(models.InventoryResource),
+            [dict(resource, cloud=cloud) for resource in resources],
+        )
+    if links:
+        session.execute(
+            insert(models.InventoryLink),
+            [dict(link, cloud=cloud) for link in links],
+        )
+    models.InventorySnapshot(cloud=cloud).save(session=session)
+
+
+@session_utils.ensure_session
+def get_inventory_snapshot(cloud: str, session=None) -> models.InventorySnapshot | None:
+    """Retrieve the latest inventory snapshot of the specified cloud."""
+    return (
+        session.query(models.InventorySnapshot)
+        .filter_by(cloud=cloud)
+        .order_by(desc("created_at"))
+        .first()
+    )
+
+
+@session_utils.ensure_session
+def get_inventory_resources(
+    cloud: str, session=None, **filters
+) -> list[models.InventoryResource]:
+    """Retrieve inventory resources."""
+    return (
+        session.query(models.InventoryResource)
+        .filter_by(cloud=cloud, **filters)
+        .order_by(asc("resource_type"), asc("resource_id"))
+        .all()
+    )
+
+
+@session_utils.ensure_session
+def get_inventory_links(
+    cloud: str, link_type: str, session=None, **filters
+) -> list[models.InventoryLink]:
+    """Retrieve inventory relations of a given type.
+
+    Filter by "resource_id" or "related_id" to resolve the relation
+    in either direction.
+    """
+    return (
+        session.query(models.InventoryLink)
+        .filter_by(cloud=cloud, link_type=link_type, **filters)
+        .order_by(asc("id"))
+        .all()
+    )
+
+
+@session_utils.ensure_session
+def get_wait_timings(
+    resource_type: str,
+    operation: str,
+    size_bucket: int,
+    limit: int | None = None,
+    session=None,
+) -> list[models.WaitTiming]:
+    """Retrieve the most recent wait timings of the specified operation."""
+    query = (
+        session.query(models.WaitTiming)
+        .filter_by(
+            resource_type=resource_type, operation=operation, size_bucket=size_bucket
+        )
+        .order_by(desc("created_at"), desc("id"))
+    )
+    if limit:
+        query = query.limit(limit)
+    return query.all()
+
+
+@session_utils.ensure_session
+def prune_wait_timings(
+    resource_type: str, operation: str, size_bucket: int, keep: int, session=None
+):
+    """Delete all but the most recent wait timings of the specified operation."""
+    recent_ids = [
+        timing.id
+        for timing in get_wait_timings(
+            resource_type, operation, size_bucket, limit=keep, session=session
+        )
+    ]
+    session.query(models.WaitTiming).filter_by(
+        resource_type=resource_type, operation=operation, size_bucket=size_bucket
+    ).filter(models.WaitTiming.id.not_in(recent_ids)).delete(synchronize_session=False)
@@ -5,7 +5,7 @@ import datetime
 import typing
 import uuid
 
-from sqlalchemy import Boolean, Column, DateTime, Integer, String, Text
+from sqlalchemy import Boolean, Column, DateTime, Index, Integer, String, Text
 from sqlalchemy.ext.declarative import as_declarative
 
 from sunbeam_migrate.db import session_utils
@@ -79,3 +79,68 @@ class Migration(BaseModel):
 
     status = Column(Text)
     error_message = Column(Text)
+
+
+class InventorySnapshot(BaseModel):
+    """Source inventory snapshot model.
+
+    Records the time of the last successful inventory sync.
+    """
+
+    __tablename__ = "inventory_snapshots"
+
+    cloud = Column(Text)
+
+
+class InventoryResource(BaseModel):
+    """Source inventory resource model."""
+
+    __tablename__ = "inventory_resources"
+    __table_args__ = (
+        Index("ix_inventory_resources_id", "cloud", "resource_type", "resource_id"),
+        Index("ix_inventory_resources_project", "cloud", "project_id", "resource_type"),
+    )
+
+    cloud = Column(Text)
+    resource_type = Column(Text)
+    resource_id = Column(Text)
+    project_id = Column(Text)
+    name = Column(Text)
+
+
+class InventoryLink(BaseModel):
+    """Source inventory relation model.
+
+    Describes a relation between two source resources, for example
+    "subnet-network" or "router-subnet".
+    """
+
+    __tablename__ = "inventory_links"
+    __table_args__ = (
+        Index("ix_inventory_links_resource", "cloud", "link_type", "resource_id"),
+        Index("ix_inventory_links_related", "cloud", "link_type", "related_id"),
+    )
+
+    cloud = Column(Text)
+    link_type = Column(Text)
+    resource_id = Column(Text)
+    related_id = Column(Text)
+
+
+class WaitTiming(BaseModel):
+    """Observed resource provisioning duration model.
+
+    Used to estimate how long similar resources take to become available.
+    """
+
+    __tablename__ = "wait_timings"
+    __table_args__ = (
+        Index("ix_wait_timings_operation", "resource_type", "operation", "size_bucket"),
+    )
+
+    resource_type = Column(Text)
+    # The operation that was waited for, e.g. "create" or "snapshot".
+    operation = Column(Text)
+    size_bucket = Column(Integer)
+    # The observed duration (milliseconds).
+    duration_ms = Column(Integer)
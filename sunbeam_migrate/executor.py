@@ -0,0 +1,385 @@
+# SPDX-FileCopyrightText: 2025 - Canonical Ltd
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Dependency aware batch migration executor.
+
+Batch migrations used to be performed serially, one resource at a time, even
+though most of the time is spent waiting for the clouds (e.g. volume uploads,
+instance snapshots).
+
+The executor builds a dependency graph (DAG) based on the associated resources
+reported by the migration handlers and migrates independent resources
+concurrently using a thread pool. A resource is only scheduled once all of its
+dependencies have been migrated, which ensures that shared dependencies (e.g.
+networks, projects) are migrated only once.
+
+Resources of the same type that become ready at the same time are migrated
+using bulk requests, if supported by the migration handlers (e.g. Neutron
+ports).
+
+Member resources are still handled by the parent resource migration, after
+the parent resource is migrated.
+"""
+
+import concurrent.futures
+import logging
+import threading
+
+import pydantic
+
+from sunbeam_migrate import config, exception
+from sunbeam_migrate.db import models
+from sunbeam_migrate.handlers import base
+
+CONF = config.get_config()
+LOG = logging.getLogger()
+
+NodeKey = tuple[str, str]
+
+
+class MigrationNode(pydantic.BaseModel):
+    """A resource that is part of the batch migration graph."""
+
+    resource_type: str
+    source_id: str
+    # Whether the resource was explicitly requested, as opposed to being
+    # a dependency of another requested resource.
+    requested: bool = False
+    # Dependencies that haven't been migrated yet.
+    dependencies: list[base.Resource] = []
+
+    @property
+    def key(self) -> NodeKey:
+        """The (resource type, source id) tuple identifying this node."""
+        return (self.resource_type, self.source_id)
+
+
+def _get_key(resource: base.Resource) -> NodeKey:
+    return (resource.resource_type, resource.source_id)
+
+
+class BatchMigrationExecutor:
+    """Migrate resources concurrently, respecting their dependencies."""
+
+    def __init__(self, manager, workers: int):
+        if workers < 1:
+            raise exception.InvalidInput("The number of workers must be positive.")
+        self._manager = manager
+        self._workers = workers
+
+        self._nodes: dict[NodeKey, MigrationNode] = {}
+        self._dependants: dict[NodeKey, list[NodeKey]] = {}
+        self._remaining_dependencies: dict[NodeKey, set[NodeKey]] = {}
+        self._completed: dict[NodeKey, models.Migration] = {}
+        self._failed: dict[NodeKey, Exception] = {}
+        self._bulk_migration_support: dict[str, bool] = {}
+        # Dependencies shared by multiple requested resources must only be
+        # cleaned up once.
+        self._cleaned_up: set[NodeKey] = set()
+        self._cleanup_lock = threading.Lock()
+
+    def run(
+        self,
+        resource_type: str,
+        resource_ids: list[str],
+        cleanup_source: bool = False,
+        include_dependencies: bool = False,
+        include_members: bool = False,
+    ):
+        """Migrate the specified resources along with their dependencies.
+
+        Raises an exception after processing all the resources if any of the
+        migrations failed.
+        """
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self._workers, thread_name_prefix="migration"
+        ) as pool:
+            self._build_graph(pool, resource_type, resource_ids, include_dependencies)
+            self._execute(pool, cleanup_source, include_dependencies, include_members)
+
+        unprocessed = set(self._nodes) - set(self._completed) - set(self._failed)
+        for key in unprocessed:
+            self._failed[key] = exception.SunbeamMigrateException(
+                "Unresolved dependencies: %s" % self._remaining_dependencies[key]
+            )
+
+        LOG.info(
+            "Batch migration finished. Succeeded: %s, failed: %s.",
+            len(self._completed),
+            len(self._failed),
+        )
+        if self._failed:
+            raise exception.SunbeamMigrateException(
+                "%s migration(s) failed: %s"
+                % (
+                    len(self._failed),
+                    ", ".join(
+                        "%s %s (%r)" % (key[0], key[1], ex)
+                        for key, ex in self._failed.items()
+                    ),
+                )
+            )
+
+    def _build_graph(
+        self,
+        pool: concurrent.futures.Executor,
+        resource_type: str,
+        resource_ids: list[str],
+        include_dependencies: bool,
+    ):
+        frontier: list[MigrationNode] = []
+        for resource_id in resource_ids:
+            node = MigrationNode(
+                resource_type=resource_type, source_id=resource_id, requested=True
+            )
+            if node.key not in self._nodes:
+                self._nodes[node.key] = node
+                frontier.append(node)
+
+        # Without "--include-dependencies", the migrations are going to fail
+        # if there are pending dependencies, same as the serial migrations.
+        while include_dependencies and frontier:
+            LOG.debug("Identifying the dependencies of %s resources.", len(frontier))
+            results = pool.map(self._get_pending_dependencies, frontier)
+
+            next_frontier: list[MigrationNode] = []
+            for node, (dependencies, error) in zip(frontier, results):
+                if error:
+                    self._failed[node.key] = error
+                    continue
+
+                node.dependencies = dependencies
+                for dependency in dependencies:
+                    dependency_key = _get_key(dependency)
+                    if dependency_key not in self._nodes:
+                        dependency_node = MigrationNode(
+                            resource_type=dependency.resource_type,
+                            source_id=dependency.source_id,
+                        )
+                        self._nodes[dependency_key] = dependency_node
+                        next_frontier.append(dependency_node)
+            frontier = next_frontier
+
+        for key, node in self._nodes.items():
+            dependency_keys = {_get_key(dep) for dep in node.dependencies}
+            # Drop self references, if any.
+            dependency_keys.discard(key)
+            self._remaining_dependencies[key] = dependency_keys
+            for dependency_key in dependency_keys:
+                self._dependants.setdefault(dependency_key, []).append(key)
+
+        LOG.info(
+            "Batch migration graph: %s resources, %s requested.",
+            len(self._nodes),
+            len(resource_ids),
+        )
+
+    def _get_pending_dependencies(
+        self, node: MigrationNode
+    ) -> tuple[list[base.Resource], Exception | None]:
+        try:
+            associated_resources = self._manager._get_associated_resources(
+                node.resource_type, node.source_id
+            )
+            return list(associated_resources["pending"]), None
+        except Exception as ex:
+            LOG.error(
+                "Unable to determine the dependencies of %s %s: %r",
+                node.resource_type,
+                node.source_id,
+                ex,
+            )
+            return [], ex
+
+    def _execute(
+        self,
+        pool: concurrent.futures.Executor,
+        cleanup_source: bool,
+        include_dependencies: bool,
+        include_members: bool,
+    ):
+        futures: dict[concurrent.futures.Future, list[NodeKey]] = {}
+
+        def _submit(keys: list[NodeKey]):
+            for group in self._group_nodes(keys):
+                LOG.debug("Scheduling migration: %s", group)
+                future = pool.submit(
+                    self._migrate_nodes,
+                    [self._nodes[key] for key in group],
+                    cleanup_source=cleanup_source,
+                    include_dependencies=include_dependencies,
+                    include_members=include_members,
+                )
+                futures[future] = group
+
+        # Resources whose dependencies couldn't be identified.
+        for key in list(self._failed):
+            self._fail_dependants(key)
+
+        _submit(
+            [
+                key
+                for key, dependencies in self._remaining_dependencies.items()
+                if not dependencies and key not in self._failed
+            ]
+        )
+
+        while futures:
+            done, _ = concurrent.futures.wait(
+                futures, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            ready_keys: list[NodeKey] = []
+            for future in done:
+                keys = futures.pop(future)
+                try:
+                    results = future.result()
+                except Exception as ex:
+                    results = dict.fromkeys(keys, ex)
+
+                for key, result in results.items():
+                    if isinstance(result, Exception):
+                        LOG.error("Failed to migrate %s %s: %r", key[0], key[1], result)
+                        self._failed[key] = result
+                        self._fail_dependants(key)
+                        continue
+
+                    self._completed[key] = result
+                    for dependant_key in self._dependants.get(key, []):
+                        remaining = self._remaining_dependencies[dependant_key]
+                        remaining.discard(key)
+                        if not remaining and dependant_key not in self._failed:
+                            ready_keys.append(dependant_key)
+            _submit(ready_keys)
+
+    def _group_nodes(self, keys: list[NodeKey]) -> list[list[NodeKey]]:
+        """Group the resources that can be migrated using bulk requests.
+
+        Resources of the same type are grouped if the migration handler
+        supports bulk requests, up to "bulk_migration_chunk_size" resources
+        per group.
+        """
+        chunk_size = CONF.bulk_migration_chunk_size
+        groups: dict[tuple[str, bool], list[NodeKey]] = {}
+        individual_groups: list[list[NodeKey]] = []
+        for key in keys:
+            node = self._nodes[key]
+            if chunk_size > 1 and self._supports_bulk_migration(node.resource_type):
+                # The requested resources are cleaned up separately.
+                groups.setdefault((node.resource_type, node.requested), []).append(key)
+            else:
+                individual_groups.append([key])
+
+        for group in groups.values():
+            for idx in range(0, len(group), chunk_size):
+                individual_groups.append(group[idx : idx + chunk_size])
+        return individual_groups
+
+    def _supports_bulk_migration(self, resource_type: str) -> bool:
+        if resource_type not in self._bulk_migration_support:
+            handler = self._manager._get_migration_handler(resource_type)
+            self._bulk_migration_support[resource_type] = (
+                handler.supports_bulk_migration()
+            )
+        return self._bulk_migration_support[resource_type]
+
+    def _fail_dependants(self, key: NodeKey):
+        for dependant_key in self._dependants.get(key, []):
+            if dependant_key in self._failed:
+                continue
+            LOG.error(
+                "Skipping %s %s migration, dependency failed: %s %s",
+                dependant_key[0],
+                dependant_key[1],
+                key[0],
+                key[1],
+            )
+            self._failed[dependant_key] = exception.SunbeamMigrateException(
+                "Dependency migration failed: %s %s" % key
+            )
+            self._fail_dependants(dependant_key)
+
+    def _migrate_nodes(
+        self,
+        nodes: list[MigrationNode],
+        cleanup_source: bool,
+        include_dependencies: bool,
+        include_members: bool,
+    ) -> dict[NodeKey, models.Migration | Exception]:
+        """Migrate a group of resources.
+
+        Groups of resources having the same type are migrated using bulk
+        requests. The manager falls back to individual migrations if the
+        bulk requests fail, so the failures are not retried here.
+        """
+        results: dict[NodeKey, models.Migration | Exception] = {}
+        if len(nodes) > 1:
+            # The groups contain either requested or dependency resources.
+            cleanup_nodes = cleanup_source and nodes[0].requested
+            try:
+                migrations = self._manager.perform_bulk_migration(
+                    nodes[0].resource_type,
+                    [node.source_id for node in nodes],
+                    cleanup_source=cleanup_nodes,
+                    include_dependencies=include_dependencies,
+                    include_members=include_members,
+                )
+            except Exception as ex:
+                for node in nodes:
+                    results[node.key] = ex
+                return results
+
+            for node, migration in zip(nodes, migrations):
+                if cleanup_nodes:
+                    self._cleanup_dependencies(node)
+                results[node.key] = migration
+            return results
+
+        for node in nodes:
+            try:
+                results[node.key] = self._migrate_node(
+                    node,
+                    cleanup_source=cleanup_source,
+                    include_dependencies=include_dependencies,
+                    include_members=include_members,
+                )
+            except Exception as ex:
+                results[node.key] = ex
+        return results
+
+    def _migrate_node(
+        self,
+        node: MigrationNode,
+        cleanup_source: bool,
+        include_dependencies: bool,
+        include_members: bool,
+    ) -> models.Migration:
+        # Same as the serial migrations, only the requested resources and
+        # their direct dependencies are cleaned up.
+        cleanup_node = cleanup_source and node.requested
+        migration = self._manager.perform_individual_migration(
+            node.resource_type,
+            node.source_id,
+            cleanup_source=cleanup_node,
+            include_dependencies=include_dependencies,
+            include_members=include_members,
+        )
+
+        if cleanup_node:
+            self._cleanup_dependencies(node)
+
+        return migration
+
+    def _cleanup_dependencies(self, node: MigrationNode):
+        for dependency in node.dependencies:
+            if not dependency.should_cleanup:
+                continue
+            dependency_key = _get_key(dependency)
+            with self._cleanup_lock:
+                if dependency_key in self._cleaned_up:
+                    continue
+                self._cleaned_up.add(dependency_key)
+            # The dependencies have already been processed.
+            dependency_migration = self._completed.get(dependency_key)
+            if dependency_migration and not dependency_migration.source_removed:
+                self._manager.cleanup_migration_source(dependency_migration)
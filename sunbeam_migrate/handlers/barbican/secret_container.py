@@ -22,7 +22,7 @@ class SecretContainerHandler(base.BaseMigrationHandler):
     def get_associated_resources(self, resource_id: str) -> list[base.Resource]:
         """Get a list of associated resources."""
         container_id = barbican_utils.parse_barbican_url(resource_id)
-        container = self._source_session.key_manager.get_container(container_id)
+        container = self._get_source("secret-container", container_id)
         if not (container and container.id):
             raise exception.NotFound(f"Secret not found: {resource_id}")
 
@@ -52,9 +52,7 @@ class SecretContainerHandler(base.BaseMigrationHandler):
         Return the resulting resource id.
         """
         source_container_id = barbican_utils.parse_barbican_url(resource_id)
-        source_container = self._source_session.key_manager.get_container(
-            source_container_id
-        )
+        source_container = self._get_source("secret-container", source_container_id)
         if not source_container:
             raise exception.NotFound(f"Secret not found: {resource_id}")
 
@@ -2,17 +2,42 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import abc
+import contextlib
 import logging
-import os
+from collections.abc import Generator
+from concurrent import futures
 
-import openstack
 import pydantic
 
-from sunbeam_migrate import config, constants, exception
+from sunbeam_migrate import config, exception
+from sunbeam_migrate.utils import cache, connection_pool, inventory, status_poller
 
 CONF = config.get_config()
 LOG = logging.getLogger()
 
+# The SDK methods used to retrieve source resources of a given kind,
+# relative to the OpenStack connection.
+SOURCE_RESOURCE_GETTERS = {
+    "domain": "identity.get_domain",
+    "floating-ip": "network.get_ip",
+    "image": "get_image",
+    "instance": "compute.get_server",
+    "load-balancer": "load_balancer.get_load_balancer",
+    "network": "network.get_network",
+    "pool": "load_balancer.get_pool",
+    "port": "network.get_port",
+    "project": "identity.get_project",
+    "role": "identity.get_role",
+    "router": "network.get_router",
+    "secret-container": "key_manager.get_container",
+    "security-group": "network.get_security_group",
+    "security-group-rule": "network.get_security_group_rule",
+    "share": "shared_file_system.get_share",
+    "subnet": "network.get_subnet",
+    "user": "identity.get_user",
+    "volume": "block_storage.get_volume",
+}
+
 
 class Resource(pydantic.BaseModel):
     """Resource class.
@@ -78,6 +103,7 @@ class BaseMigrationHandler(abc.ABC):
     def delete_source_resource(self, resource_id: str):
         """Delete the specified resource on the source cloud side."""
         self._delete_resource(resource_id, self._source_session)
+        self._invalidate_source(None, resource_id)
 
     def delete_destination_resource(self, resource_id: str):
         """Delete the specified resource on the destination cloud side."""
@@ -106,6 +132,112 @@ class BaseMigrationHandler(abc.ABC):
         """
         return []
 
+    @contextlib.contextmanager
+    def batch_migration_context(self, resource_ids: list[str]) -> Generator[None]:
+        """Wrap the migration of a batch of resources.
+
+        Allows handlers to prepare the resources concurrently and keep state
+        for the duration of the batch, releasing it at the end.
+
+        :param resource_ids: the resources that are going to be migrated.
+        """
+        yield
+
+    def supports_bulk_migration(self) -> bool:
+        """Whether multiple resources can be created using bulk requests.
+
+        See "perform_bulk_migration".
+        """
+        return False
+
+    def perform_bulk_migration(
+        self,
+        resource_ids: list[str],
+        migrated_associated_resources: list[MigratedResource],
+    ) -> list[str]:
+        """Migrate multiple resources of this type using bulk requests.
+
+        The associated resources of all the specified resources are
+        expected to be migrated already.
+
+        This method is expected to only issue the bulk create requests,
+        the resources being migrated individually if it fails. Any
+        subsequent steps belong to "finalize_bulk_migration", which is
+        called after the migrations are recorded.
+
+        :param resource_ids: the resources to be migrated
+        :param migrated_associated_resources: a list of MigratedResource
+            objects describing the migrated dependencies of the specified
+            resources.
+
+        Return the resulting resource ids, in the same order.
+        """
+        raise exception.NotSupported(
+            f"Bulk migrations are not supported by {type(self).__name__}."
+        )
+
+    def finalize_bulk_migration(
+        self,
+        resource_id: str,
+        destination_id: str,
+        migrated_associated_resources: list[MigratedResource],
+    ):
+        """Perform the remaining steps for a resource that was created in bulk.
+
+        :param resource_id: the source resource id
+        :param destination_id: the destination resource id
+        :param migrated_associated_resources: a list of MigratedResource
+            objects describing the migrated dependencies.
+        """
+
+    def sync_resource_data(self, resource_id: str, destination_id: str):
+        """Copy the data that changed since the resource was migrated.
+
+        Allows migrating resources while they are still in use, performing
+        a final incremental sync once the workloads are stopped.
+
+        :param resource_id: the source resource id
+        :param destination_id: the migrated resource id
+        """
+        raise exception.NotSupported(
+            f"Data synchronization is not supported by {type(self).__name__}."
+        )
+
+    def verify_resource_data(self, resource_id: str, destination_id: str):
+        """Verify the data of a migrated resource.
+
+        :param resource_id: the source resource id
+        :param destination_id: the migrated resource id
+        """
+        raise exception.NotSupported(
+            f"Data verification is not supported by {type(self).__name__}."
+        )
+
+    def perform_member_batch_migration(
+        self,
+        resource_id: str,
+        destination_id: str,
+        member_resources: list[Resource],
+        migrated_associated_resources: list[MigratedResource],
+    ) -> dict[str, str]:
+        """Migrate multiple member resources using bulk requests.
+
+        Handlers may override this method to avoid issuing separate requests
+        for each member resource. The members that are not included in the
+        result are migrated individually.
+
+        :param resource_id: the source parent resource ID
+        :param destination_id: the destination parent resource ID
+        :param member_resources: the pending member resources
+        :param migrated_associated_resources: a list of MigratedResource
+            objects describing the migrated parent resource and its
+            dependencies.
+
+        Return a dict mapping the source IDs of the migrated member
+        resources to the destination IDs.
+        """
+        return {}
+
     def get_associated_resource_types(self) -> list[str]:
         """Get a list of associated resource types.
 
@@ -126,6 +258,44 @@ class BaseMigrationHandler(abc.ABC):
         """
         return []
 
+    def get_associated_resource_concurrency(self) -> int:
+        """Get the number of associated resources migrated concurrently.
+
+        Handlers may return a value higher than 1 if some of the associated
+        resources do not have to be migrated in a specific order, see
+        "get_concurrent_associated_resource_types". The limit also applies
+        to the work started by "prepare_individual_migration".
+        """
+        return 1
+
+    def get_concurrent_associated_resource_types(self) -> list[str]:
+        """Get the associated resource types that can be migrated concurrently.
+
+        The other associated resources, which are often shared with other
+        resources (e.g. networks or projects), are migrated in order first.
+        """
+        return []
+
+    def prepare_individual_migration(
+        self, resource_id: str, executor: futures.Executor
+    ):
+        """Start the migration steps that don't need the associated resources.
+
+        Called once the associated resources that are migrated in order are
+        available, before migrating the concurrent ones. Handlers may submit
+        work to the provided executor, which runs concurrently with the
+        associated resource migrations, and then wait for it when
+        "perform_individual_migration" is called.
+        """
+        pass
+
+    def abort_individual_migration(self, resource_id: str):
+        """Clean up the work started by "prepare_individual_migration".
+
+        Called if the migration fails.
+        """
+        pass
+
     def get_supported_resource_filters(self) -> list[str]:
         """Get a list of supported resource filters.
 
@@ -150,64 +320,96 @@ class BaseMigrationHandler(abc.ABC):
         pass
 
     def _get_openstack_session(self, cloud_name: str):
-        if not CONF.cloud_config_file:
-            raise exception.InvalidInput("No cloud config provided.")
-
-        os.environ["OS_CLIENT_CONFIG_FILE"] = str(CONF.cloud_config_file)
-        return openstack.connect(
-            cloud=cloud_name,
-            compute_api_version=constants.NOVA_MICROVERSION,
-            share_api_version=constants.MANILA_MICROVERSION,
+        # The connections are shared across handler instances.
+        return connection_pool.get_connection_pool().get_connection(cloud_name)
+
+    def _owner_scoped_session(self, session, role_names: list[str], project_id: str):
+        # The role assignments and scoped sessions are cached, avoiding
+        # redundant Keystone requests when migrating multiple resources
+        # owned by the same project.
+        return connection_pool.get_connection_pool().get_owner_scoped_connection(
+            session.config.name, role_names, project_id
         )
 
-    def _assign_project_role_to_current_user(
+    def _get_source(self, kind: str, resource_id: str):
+        """Retrieve a source resource.
+
+        The resources are cached for the duration of the run (bounded by
+        "source_object_cache_ttl"), avoiding duplicate requests when the same
+        resource is needed to determine dependencies and perform migrations.
+
+        :param kind: the resource kind, see SOURCE_RESOURCE_GETTERS.
+        :param resource_id: the source resource id.
+        """
+        if kind not in SOURCE_RESOURCE_GETTERS:
+            raise exception.InvalidInput(f"Unsupported source resource kind: {kind}")
+
+        def _fetch():
+            getter = self._source_session
+            for attr in SOURCE_RESOURCE_GETTERS[kind].split("."):
+                getter = getattr(getter, attr)
+            return getter(resource_id)
+
+        return cache.get_source_object_cache().get(kind, resource_id, _fetch)
+
+    @property
+    def _source_inventory(self) -> inventory.Inventory | None:
+        """The source inventory snapshot, if available.
+
+        See the "inventory sync" command.
+        """
+        if not CONF.source_cloud_name:
+            return None
+        return inventory.get_inventory(CONF.source_cloud_name)
+
+    def _invalidate_source(self, kind: str | None, resource_id: str):
+        """Invalidate a cached source resource after modifying it.
+
+        If no kind is specified, all the cached resources that have the
+        specified id are invalidated.
+        """
+        cache.get_source_object_cache().invalidate(kind, resource_id)
+
+    def _wait_for_status(
         self,
         session,
-        role_name: str,
-        project_id: str,
+        resource_type: str,
+        resource_id: str,
+        status: str,
+        failures: list[str] | None = None,
+        wait: float | None = None,
+        size: int | None = None,
+        operation: str | None = None,
     ):
-        LOG.debug(
-            "Ensuring that user %s has role %s in project %s.",
-            session.current_user_id,
-            project_id,
-            role_name,
-        )
-        session.grant_role(
-            role_name,
-            session.current_user_id,
-            project=project_id,
-            wait=True,
-        )
+        """Wait for the resource status using the shared status poller.
 
-    def _owner_scoped_session(self, session, role_names: list[str], project_id: str):
-        for role_name in role_names:
-            self._assign_project_role_to_current_user(session, role_name, project_id)
-        project = session.identity.get_project(project_id)
-        return session.connect_as_project(project)
+        The operation name (e.g. "create") and the resource size (bytes)
+        are used to estimate the expected duration.
+        """
+        return status_poller.get_status_poller().wait_for_status(
+            session,
+            resource_type,
+            resource_id,
+            status=status,
+            failures=failures,
+            wait=wait,
+            size=size,
+            operation=operation,
+        )
 
     @property
     def _source_session(self):
         if not CONF.source_cloud_name:
             raise exception.InvalidInput("No source cloud specified.")
 
-        if not getattr(self, "_cached_source_session", None):
-            self._cached_source_session = self._get_openstack_session(
-                CONF.source_cloud_name
-            )
-
-        return self._cached_source_session
+        return self._get_openstack_session(CONF.source_cloud_name)
 
     @property
     def _destination_session(self):
         if not CONF.destination_cloud_name:
             raise exception.InvalidInput("No destination cloud specified.")
 
-        if not getattr(self, "_cached_destinaton_session", None):
-            self._cached_destinaton_session = self._get_openstack_session(
-                CONF.destination_cloud_name
-            )
-
-        return self._cached_destinaton_session
+        return self._get_openstack_session(CONF.destination_cloud_name)
 
     def _report_identity_dependencies(
         self,
@@ -30,14 +30,25 @@ There are multiple ways in which an Openstack volume can be migrated:
 
 import logging
 import os
+import re
 from typing import Any
 
+from openstack import exceptions as openstack_exc
+
 from sunbeam_migrate import config, exception
 from sunbeam_migrate.handlers import base
+from sunbeam_migrate.utils import status_poller
 
 CONF = config.get_config()
 LOG = logging.getLogger()
 
+# Matches the Cinder and Glance errors about unsupported image formats.
+_IMAGE_FORMAT_ERROR_RE = re.compile(r"(disk|container)[ _-]?format", re.IGNORECASE)
+
+
+def _is_image_format_error(ex: openstack_exc.HttpException) -> bool:
+    return bool(_IMAGE_FORMAT_ERROR_RE.search(f"{ex} {ex.details or ''}"))
+
 
 class VolumeHandler(base.BaseMigrationHandler):
     """Handle Cinder volume type migrations."""
@@ -79,7 +90,7 @@ class VolumeHandler(base.BaseMigrationHandler):
         """Get a list of associated resources."""
         associated_resources: list[base.Resource] = []
 
-        source_volume = self._source_session.block_storage.get_volume(resource_id)
+        source_volume = self._get_source("volume", resource_id)
         if not source_volume:
             raise exception.NotFound(f"Volume not found: {resource_id}")
 
@@ -105,18 +116,41 @@ class VolumeHandler(base.BaseMigrationHandler):
         rand = int.from_bytes(os.urandom(4))
         image_name = f"volmigr-{source_volume.id}-{rand}"
         LOG.info("Uploading %s volume to image: %s", source_volume.id, image_name)
-        response = owner_source_session.block_storage.upload_volume_to_image(
-            source_volume, image_name, force=True
-        )
+        image_formats = {}
+        if CONF.volume_upload_disk_format:
+            image_formats["disk_format"] = CONF.volume_upload_disk_format
+        if CONF.volume_upload_container_format:
+            image_formats["container_format"] = CONF.volume_upload_container_format
+        try:
+            response = owner_source_session.block_storage.upload_volume_to_image(
+                source_volume, image_name, force=True, **image_formats
+            )
+        except openstack_exc.BadRequestException as ex:
+            if not image_formats or not _is_image_format_error(ex):
+                raise
+            # Older Cinder releases may not support the requested formats
+            # (e.g. the "compressed" container format).
+            LOG.warning(
+                "Volume upload using %s failed: %s. Retrying using the "
+                "default image formats.",
+                image_formats,
+                ex,
+            )
+            response = owner_source_session.block_storage.upload_volume_to_image(
+                source_volume, image_name, force=True
+            )
         image_id = response["image_id"]
         LOG.info("Waiting for volume upload to complete. Image id: %s", image_id)
         image = self._source_session.get_image(image_id)
-        self._source_session.image.wait_for_status(
-            image,
+        self._wait_for_status(
+            self._source_session,
+            "image",
+            image.id,
             status="active",
             failures=["error"],
-            interval=5,
             wait=CONF.volume_upload_timeout,
+            operation="volume-upload",
+            size=(source_volume.size or 0) * status_poller.GiB,
         )
         LOG.info("Finished uploading source volume to Glance.")
         return self._source_session.get_image(image.id)
@@ -134,7 +168,7 @@ class VolumeHandler(base.BaseMigrationHandler):
 
         Return the resulting resource id.
         """
-        source_volume = self._source_session.block_storage.get_volume(resource_id)
+        source_volume = self._get_source("volume", resource_id)
         if not source_volume:
             raise exception.NotFound(f"Volume not found: {resource_id}")
 
@@ -177,12 +211,15 @@ class VolumeHandler(base.BaseMigrationHandler):
                 **volume_kwargs
             )
             LOG.info("Waiting for volume provisioning: %s", destination_volume.id)
-            self._destination_session.block_storage.wait_for_status(
-                destination_volume,
+            self._wait_for_status(
+                self._destination_session,
+                "volume",
+                destination_volume.id,
                 status="available",
                 failures=["error"],
-                interval=5,
                 wait=CONF.volume_upload_timeout,
+                operation="create-from-image",
+                size=(source_volume.size or 0) * status_poller.GiB,
             )
             if source_volume.volume_image_metadata:
                 self._destination_session.block_storage.set_volume_image_metadata(
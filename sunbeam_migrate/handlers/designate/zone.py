@@ -4,6 +4,8 @@
 import logging
 from typing import Any
 
+from openstack import exceptions as openstack_exc
+
 from sunbeam_migrate import config, exception
 from sunbeam_migrate.handlers import base
 
@@ -84,6 +86,23 @@ class ZoneHandler(base.BaseMigrationHandler):
             )
             return existing.id
 
+        dest_zone_id = None
+        if CONF.dns_zone_import and (source_zone.type or "PRIMARY") == "PRIMARY":
+            dest_zone_id = self._import_destination_zone(
+                source_zone, owner_destination_session
+            )
+
+        if dest_zone_id:
+            # Create the recordsets that were rejected by the zone import.
+            self._copy_recordsets(
+                resource_id,
+                dest_zone_id,
+                migrated_associated_resources,
+                source_zone.project_id,
+                skip_existing=True,
+            )
+            return dest_zone_id
+
         # Create zone on destination
         dest_zone = self._create_destination_zone(
             source_zone, migrated_associated_resources
@@ -204,14 +223,135 @@ class ZoneHandler(base.BaseMigrationHandler):
         )
         return dest_zone
 
+    def _export_source_zone(self, source_zone: Any) -> str:
+        """Export the source zone, returning the BIND zone file."""
+        if CONF.multitenant_mode:
+            source_session = self._owner_scoped_session(
+                self._source_session,
+                [CONF.member_role_name],
+                source_zone.project_id,
+            )
+        else:
+            source_session = self._source_session
+
+        LOG.info("Exporting source zone %s", source_zone.name)
+        zone_export = source_session.dns.create_zone_export(source_zone.id)
+        try:
+            self._wait_for_status(
+                source_session,
+                "dns-zone-export",
+                zone_export.id,
+                status="COMPLETE",
+                failures=["ERROR"],
+                wait=CONF.resource_creation_timeout,
+                operation="export",
+            )
+            # The SDK zone export resource uses an outdated API path.
+            response = source_session.dns.get(
+                f"/zones/tasks/exports/{zone_export.id}/export",
+                headers={"Accept": "text/dns"},
+                raise_exc=False,
+            )
+            openstack_exc.raise_from_response(response)
+            return response.text
+        finally:
+            source_session.dns.delete(
+                f"/zones/tasks/exports/{zone_export.id}", raise_exc=False
+            )
+
+    def _import_destination_zone(self, source_zone: Any, dest_session) -> str | None:
+        """Recreate the zone along with its recordsets using a zone import.
+
+        A single asynchronous Designate task is used instead of creating the
+        recordsets one by one. Returns None if the zone could not be imported,
+        in which case the caller is expected to fall back to copying the
+        recordsets individually.
+
+        :param source_zone: the source zone
+        :param dest_session: the (owner scoped) destination session
+        """
+        try:
+            zone_file = self._export_source_zone(source_zone)
+        except (openstack_exc.SDKException, exception.SunbeamMigrateException) as ex:
+            LOG.warning(
+                "Unable to export zone %s, copying the recordsets "
+                "individually. Error: %s",
+                source_zone.name,
+                ex,
+            )
+            return None
+
+        LOG.info("Importing zone %s on destination", source_zone.name)
+        # The SDK doesn't pass the zone file when creating zone imports.
+        response = dest_session.dns.post(
+            "/zones/tasks/imports",
+            data=zone_file.encode(),
+            headers={"Content-Type": "text/dns"},
+            raise_exc=False,
+        )
+        try:
+            openstack_exc.raise_from_response(response)
+        except openstack_exc.SDKException as ex:
+            LOG.warning(
+                "Unable to import zone %s, copying the recordsets "
+                "individually. Error: %s",
+                source_zone.name,
+                ex,
+            )
+            return None
+
+        import_id = response.json()["id"]
+        try:
+            zone_import = self._wait_for_status(
+                dest_session,
+                "dns-zone-import",
+                import_id,
+                status="COMPLETE",
+                failures=["ERROR"],
+                wait=CONF.resource_creation_timeout,
+                operation="import",
+            )
+        except (openstack_exc.SDKException, exception.SunbeamMigrateException) as ex:
+            zone_import = dest_session.dns.get_zone_import(import_id)
+            LOG.warning(
+                "Zone %s import failed, copying the recordsets individually. "
+                "Error: %s %s",
+                source_zone.name,
+                ex,
+                zone_import.message,
+            )
+            if zone_import.zone_id:
+                dest_session.dns.delete_zone(zone_import.zone_id, ignore_missing=True)
+            return None
+        finally:
+            dest_session.dns.delete_zone_import(import_id, ignore_missing=True)
+
+        # The zone file doesn't include the zone description.
+        if source_zone.description:
+            dest_session.dns.update_zone(
+                zone_import.zone_id, description=source_zone.description
+            )
+
+        LOG.info(
+            "Imported zone %s on destination (id: %s)",
+            source_zone.name,
+            zone_import.zone_id,
+        )
+        return zone_import.zone_id
+
     def _copy_recordsets(
         self,
         source_zone_id: str,
         dest_zone_id: str,
         migrated_associated_resources: list[base.MigratedResource],
         source_project_id: str,
+        skip_existing: bool = False,
     ):
-        """Copy all recordsets from source zone to destination zone."""
+        """Copy all recordsets from source zone to destination zone.
+
+        :param skip_existing: skip the recordsets that already exist on the
+            destination (e.g. created through a zone import).
+        """
         LOG.info(
             "Copying recordsets from source zone %s to destination zone %s",
             source_zone_id,
@@ -240,8 +380,17 @@ class ZoneHandler(base.BaseMigrationHandler):
             dest_session = self._destination_session
 
         source_recordsets = list(source_session.dns.recordsets(zone=source_zone_id))
+        existing_recordsets = set()
+        if skip_existing:
+            existing_recordsets = {
+                (recordset.name, recordset.type)
+                for recordset in dest_session.dns.recordsets(zone=dest_zone_id)
+            }
 
         for recordset in source_recordsets:
+            if (recordset.name, recordset.type) in existing_recordsets:
+                continue
+
             # Skip NS and SOA records at the zone apex - these are created automatically
             if recordset.type in ["NS", "SOA"]:
                 LOG.debug(
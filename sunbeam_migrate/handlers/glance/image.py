@@ -1,11 +1,17 @@
 # SPDX-FileCopyrightText: 2025 - Canonical Ltd
 # SPDX-License-Identifier: Apache-2.0
 
-import hashlib
 import logging
+from typing import Any
 
 from sunbeam_migrate import config, exception
 from sunbeam_migrate.handlers import base
+from sunbeam_migrate.utils import (
+    image_conversion,
+    image_server,
+    image_transfer,
+    net_utils,
+)
 
 CONF = config.get_config()
 LOG = logging.getLogger()
@@ -37,7 +43,7 @@ class ImageHandler(base.BaseMigrationHandler):
 
     def get_associated_resources(self, resource_id: str) -> list[base.Resource]:
         """Return the source resources this image depends on."""
-        source_image = self._source_session.get_image(resource_id)
+        source_image = self._get_source("image", resource_id)
         if not source_image:
             raise exception.NotFound(f"Image not found: {resource_id}")
 
@@ -61,7 +67,7 @@ class ImageHandler(base.BaseMigrationHandler):
 
         Return the resulting resource id.
         """
-        source_image = self._source_session.get_image(resource_id)
+        source_image = self._get_source("image", resource_id)
         if not source_image:
             raise exception.NotFound(f"Image not found: {resource_id}")
 
@@ -131,35 +137,236 @@ class ImageHandler(base.BaseMigrationHandler):
         )
         kwargs.update(identity_kwargs)
 
-        destination_image = self._destination_session.create_image(
-            data=self._chunked_image_reader(
-                source_image, CONF.image_transfer_chunk_size
-            ),
-            **kwargs,
-        )
+        spool = None
+        expected_checksum = source_image.checksum
+        sparse = self._use_sparse_transfer(source_image)
+        # Converting the image changes its disk format, which must be
+        # explicitly allowed.
+        convert = sparse and CONF.sparse_image_transfer_qcow2
+        if CONF.image_transfer_spool or sparse:
+            spool = image_transfer.ImageSpool(
+                self._source_session,
+                source_image,
+                spool_dir=CONF.temporary_migration_dir / "images",
+                chunk_size=CONF.image_transfer_chunk_size,
+                sparse=sparse,
+            )
+            destination_image, converted_checksum = self._spooled_image_transfer(
+                spool, kwargs, convert=convert
+            )
+            expected_checksum = converted_checksum or source_image.checksum
+        elif CONF.image_web_download:
+            destination_image = self._web_download_image_transfer(source_image, kwargs)
+        elif self._use_parallel_transfer(source_image):
+            destination_image = self._parallel_image_transfer(source_image, kwargs)
+        else:
+            destination_image = self._destination_session.create_image(
+                data=self._chunked_image_reader(
+                    source_image, CONF.image_transfer_chunk_size
+                ),
+                **kwargs,
+            )
 
         # Refresh the image to get all the information, including checksums.
         destination_image = self._destination_session.get_image(destination_image.id)
-        if not destination_image.checksum or not source_image.checksum:
+        if not destination_image.checksum or not expected_checksum:
             LOG.warning(
                 "The Glance image doesn’t contain a checksum, skipping validation."
             )
-        elif destination_image.checksum != source_image.checksum:
+        elif destination_image.checksum != expected_checksum:
             raise exception.Invalid("Checksum mismatch in transferred image.")
 
+        if spool:
+            spool.remove()
         return destination_image.id
 
     def _chunked_image_reader(self, source_image, chunk_size: int):
-        if not chunk_size:
-            raise exception.InvalidInput("No image transfer chunk size provided.")
-        response = self._source_session.image.download_image(source_image, stream=True)
-        md5 = hashlib.md5(usedforsecurity=False)
-        for chunk in response.iter_content(chunk_size=chunk_size):
-            md5.update(chunk)
-            yield chunk
-
-        if source_image.checksum and md5.hexdigest() != response.headers["Content-MD5"]:
-            raise exception.Invalid("Checksum mismatch in downloaded image.")
+        # The download, hashing and upload are performed concurrently.
+        return iter(
+            image_transfer.PipelinedImageReader(
+                self._source_session,
+                source_image,
+                chunk_size=chunk_size,
+                buffer_count=CONF.image_transfer_buffer_count,
+            )
+        )
+
+    def _spooled_image_transfer(
+        self, spool, image_kwargs: dict, convert: bool = False
+    ) -> tuple[Any, str | None]:
+        """Transfer the image through a local spool file.
+
+        The download is resumed from the last checkpoint, while the upload
+        is retried using the spooled data.
+
+        If requested, raw images are converted to sparse qcow2 images,
+        avoiding the upload of zero blocks. Note that this changes the
+        disk format of the destination image.
+
+        Return the destination image along with the converted image checksum,
+        if applicable.
+        """
+        upload_path = spool.download(retries=CONF.image_transfer_retries)
+        converted_checksum = None
+        if convert:
+            LOG.info("Converting image %s to qcow2.", upload_path.name)
+            converter = image_conversion.get_image_converter(CONF.image_converter)
+            converter.convert(upload_path, spool.converted_path)
+            upload_path = spool.converted_path
+            image_kwargs = dict(image_kwargs, disk_format="qcow2")
+            # The source image hashes no longer apply.
+            image_kwargs.pop("hash_algo", None)
+            image_kwargs.pop("hash_value", None)
+            converted_checksum = image_transfer.get_file_checksum(upload_path)
+
+        def _upload():
+            with upload_path.open("rb") as upload_file:
+                return self._destination_session.create_image(
+                    data=upload_file, **image_kwargs
+                )
+
+        destination_image = image_transfer.retry_on_failure(
+            _upload,
+            CONF.image_transfer_retries,
+            f"Image {upload_path.name} upload",
+        )
+        return destination_image, converted_checksum
+
+    def _use_sparse_transfer(self, source_image) -> bool:
+        return bool(CONF.sparse_image_transfer and source_image.disk_format == "raw")
+
+    def _use_parallel_transfer(self, source_image) -> bool:
+        if CONF.image_transfer_streams <= 1:
+            return False
+        if not source_image.size:
+            LOG.info(
+                "Unknown image size, using a single transfer stream: %s",
+                source_image.id,
+            )
+            return False
+        if not image_transfer.supports_range_requests(
+            self._source_session, source_image
+        ):
+            LOG.warning(
+                "The source image service doesn't support ranged downloads, "
+                "using a single transfer stream."
+            )
+            return False
+        return True
+
+    def _parallel_image_transfer(self, source_image, image_kwargs: dict):
+        """Transfer the image using multiple download streams.
+
+        The image is staged and then imported using the "glance-direct"
+        method.
+        """
+        chunk_size = CONF.image_transfer_chunk_size
+        reader = image_transfer.ParallelImageReader(
+            self._source_session,
+            source_image,
+            chunk_size=chunk_size,
+            streams=CONF.image_transfer_streams,
+            ring_size=CONF.image_transfer_memory_limit // chunk_size,
+        )
+        LOG.info(
+            "Transferring image %s using %s streams.",
+            source_image.id,
+            CONF.image_transfer_streams,
+        )
+        destination_image = self._destination_session.create_image(
+            data=iter(reader),
+            use_import=True,
+            import_method="glance-direct",
+            **image_kwargs,
+        )
+        self._wait_for_status(
+            self._destination_session,
+            "image",
+            destination_image.id,
+            status="active",
+            failures=["killed", "deleted"],
+            wait=CONF.image_import_timeout,
+            operation="glance-direct-import",
+            size=source_image.size,
+        )
+        return destination_image
+
+    def _web_download_image_transfer(self, source_image, image_kwargs: dict):
+        """Let the destination cloud pull the image data.
+
+        The source image is exposed through a short-lived HTTP endpoint and
+        imported using the Glance "web-download" method. The data is still
+        relayed by this host.
+        """
+        if CONF.image_web_download_port is None:
+            # Glance only accepts the ports listed in the
+            # "[import_filtering_opts] allowed_ports" option.
+            raise exception.InvalidInput(
+                "The image_web_download_port setting is required when using "
+                "image_web_download, the port must be allowed by the "
+                "destination Glance service."
+            )
+        if self._use_parallel_transfer(source_image):
+            chunk_size = CONF.image_transfer_chunk_size
+
+            def _get_data():
+                return iter(
+                    image_transfer.ParallelImageReader(
+                        self._source_session,
+                        source_image,
+                        chunk_size=chunk_size,
+                        streams=CONF.image_transfer_streams,
+                        ring_size=CONF.image_transfer_memory_limit // chunk_size,
+                    )
+                )
+        else:
+
+            def _get_data():
+                return self._chunked_image_reader(
+                    source_image, CONF.image_transfer_chunk_size
+                )
+
+        with image_server.ImageServer(
+            _get_data,
+            size=source_image.size,
+            bind_address=(
+                CONF.image_web_download_bind_address
+                or self._get_web_download_bind_address()
+            ),
+            port=CONF.image_web_download_port,
+            public_url=CONF.image_web_download_url,
+            expiry=CONF.image_import_timeout,
+        ) as server:
+            LOG.info(
+                "Importing image %s using the web-download method.",
+                source_image.id,
+            )
+            destination_image = self._destination_session.create_image(
+                use_import=True,
+                import_method="web-download",
+                uri=server.url,
+                **image_kwargs,
+            )
+            self._wait_for_status(
+                self._destination_session,
+                "image",
+                destination_image.id,
+                status="active",
+                failures=["killed", "deleted"],
+                wait=CONF.image_import_timeout,
+                operation="web-download-import",
+                size=source_image.size,
+            )
+        return destination_image
+
+    def _get_web_download_bind_address(self) -> str:
+        """Get the local IP used to reach the destination image service.
+
+        The image HTTP endpoint only listens on this address, instead of
+        being exposed on all the interfaces.
+        """
+        endpoint = self._destination_session.image.get_endpoint()
+        return net_utils.get_local_ip_for_url(endpoint)
 
     def get_source_resource_ids(self, resource_filters: dict[str, str]) -> list[str]:
         """Returns a list of resource ids based on the specified filters.
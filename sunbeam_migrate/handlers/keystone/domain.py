@@ -34,7 +34,7 @@ class DomainHandler(base.BaseMigrationHandler):
 
     def get_member_resources(self, resource_id: str) -> list[base.Resource]:
         """Get a list of member resources."""
-        source_domain = self._source_session.identity.get_domain(resource_id)
+        source_domain = self._get_source("domain", resource_id)
         if not source_domain:
             raise exception.NotFound(f"Domain not found: {resource_id}")
 
@@ -70,7 +70,7 @@ class DomainHandler(base.BaseMigrationHandler):
 
         Return the resulting resource id.
         """
-        source_domain = self._source_session.identity.get_domain(resource_id)
+        source_domain = self._get_source("domain", resource_id)
         if not source_domain:
             raise exception.NotFound(f"Domain not found: {resource_id}")
 
@@ -36,7 +36,7 @@ class ProjectHandler(base.BaseMigrationHandler):
         """Get a list of associated resources."""
         associated_resources = []
 
-        source_project = self._source_session.identity.get_project(resource_id)
+        source_project = self._get_source("project", resource_id)
         if not source_project:
             raise exception.NotFound(f"Project not found: {resource_id}")
 
@@ -54,7 +54,7 @@ class ProjectHandler(base.BaseMigrationHandler):
 
     def get_member_resources(self, resource_id: str) -> list[base.Resource]:
         """Get a list of member resources."""
-        source_project = self._source_session.identity.get_project(resource_id)
+        source_project = self._get_source("project", resource_id)
         if not source_project:
             raise exception.NotFound(f"Project not found: {resource_id}")
 
@@ -84,7 +84,7 @@ class ProjectHandler(base.BaseMigrationHandler):
 
         Return the resulting resource id.
         """
-        source_project = self._source_session.identity.get_project(resource_id)
+        source_project = self._get_source("project", resource_id)
         if not source_project:
             raise exception.NotFound(f"Project not found: {resource_id}")
 
@@ -34,7 +34,7 @@ class RoleHandler(base.BaseMigrationHandler):
         """Get a list of associated resources."""
         associated_resources = []
 
-        source_role = self._source_session.identity.get_role(resource_id)
+        source_role = self._get_source("role", resource_id)
         if not source_role:
             raise exception.NotFound(f"Role not found: {resource_id}")
 
@@ -59,7 +59,7 @@ class RoleHandler(base.BaseMigrationHandler):
 
         Return the resulting resource id.
         """
-        source_role = self._source_session.identity.get_role(resource_id)
+        source_role = self._get_source("role", resource_id)
         if not source_role:
             raise exception.NotFound(f"Role not found: {resource_id}")
 
@@ -37,7 +37,7 @@ class UserHandler(base.BaseMigrationHandler):
         """Get a list of associated resources."""
         associated_resources = []
 
-        source_user = self._source_session.identity.get_user(resource_id)
+        source_user = self._get_source("user", resource_id)
         if not source_user:
             raise exception.NotFound(f"User not found: {resource_id}")
 
@@ -75,7 +75,7 @@ class UserHandler(base.BaseMigrationHandler):
 
         Return the resulting resource id.
         """
-        source_user = self._source_session.identity.get_user(resource_id)
+        source_user = self._get_source("user", resource_id)
         if not source_user:
             raise exception.NotFound(f"User not found: {resource_id}")
 
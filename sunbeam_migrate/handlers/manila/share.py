@@ -1,15 +1,23 @@
 # SPDX-FileCopyrightText: 2025 - Canonical Ltd
 # SPDX-License-Identifier: Apache-2.0
 
+import contextlib
 import logging
-import subprocess
+import os
+from collections.abc import Generator
+from concurrent import futures
 from typing import Any
 
 from openstack import exceptions as openstack_exc
 
 from sunbeam_migrate import config, exception
 from sunbeam_migrate.handlers import base
-from sunbeam_migrate.utils import client_utils, manila_utils
+from sunbeam_migrate.utils import (
+    client_utils,
+    file_copy,
+    manila_utils,
+    status_poller,
+)
 
 CONF = config.get_config()
 LOG = logging.getLogger()
@@ -43,7 +51,7 @@ class ShareHandler(base.BaseMigrationHandler):
         """Get a list of associated resources."""
         associated_resources: list[base.Resource] = []
 
-        source_share = self._source_session.shared_file_system.get_share(resource_id)
+        source_share = self._get_source("share", resource_id)
         if not source_share:
             raise exception.NotFound(f"Share not found: {resource_id}")
 
@@ -60,6 +68,33 @@ class ShareHandler(base.BaseMigrationHandler):
 
         return associated_resources
 
+    @contextlib.contextmanager
+    def batch_migration_context(self, resource_ids: list[str]) -> Generator[None]:
+        """Wrap the migration of a batch of shares.
+
+        The source share access rules are added concurrently upfront. The
+        share mounts and access rules are kept until the batch completes.
+        """
+        mount_manager = manila_utils.get_mount_manager()
+        with mount_manager.batch():
+            concurrency = max(1, CONF.share_access_rule_concurrency)
+            with futures.ThreadPoolExecutor(max_workers=concurrency) as pool:
+                source_shares = pool.map(self._get_source_nfs_share, resource_ids)
+            mount_manager.prepare_share_access(
+                self._source_session, [share for share in source_shares if share]
+            )
+            yield
+
+    def _get_source_nfs_share(self, resource_id: str):
+        try:
+            share = self._get_source("share", resource_id)
+        except Exception as ex:
+            LOG.warning("Unable to retrieve share %s: %r", resource_id, ex)
+            return None
+        if share and share.share_protocol == "NFS":
+            return share
+        return None
+
     def perform_individual_migration(
         self,
         resource_id: str,
@@ -73,7 +108,7 @@ class ShareHandler(base.BaseMigrationHandler):
 
         Return the resulting resource id.
         """
-        source_share = self._source_session.shared_file_system.get_share(resource_id)
+        source_share = self._get_source("share", resource_id)
         if not source_share:
             raise exception.NotFound(f"Share not found: {resource_id}")
 
@@ -107,12 +142,15 @@ class ShareHandler(base.BaseMigrationHandler):
         )
 
         LOG.info("Waiting for share provisioning: %s", destination_share.id)
-        self._destination_session.shared_file_system.wait_for_status(
-            destination_share,
+        self._wait_for_status(
+            self._destination_session,
+            "share",
+            destination_share.id,
             status="available",
             failures=["error"],
-            interval=5,
             wait=CONF.resource_creation_timeout,
+            operation="create",
+            size=(source_share.size or 0) * status_poller.GiB,
         )
 
         if CONF.preserve_share_access_rules:
@@ -219,7 +257,67 @@ class ShareHandler(base.BaseMigrationHandler):
                 # Continue with other rules even if one fails
                 continue
 
-    def _migrate_share_data(self, source_share, destination_share):
+    def sync_resource_data(self, resource_id: str, destination_id: str):
+        """Copy the share data that changed since the share was migrated.
+
+        :param resource_id: the source share id
+        :param destination_id: the migrated share id
+        """
+        source_share = self._get_source("share", resource_id)
+        if not source_share:
+            raise exception.NotFound(f"Share not found: {resource_id}")
+        destination_share = self._destination_session.shared_file_system.get_share(
+            destination_id
+        )
+        self._migrate_share_data(source_share, destination_share, incremental=True)
+
+    def verify_resource_data(self, resource_id: str, destination_id: str):
+        """Verify the migrated share files.
+
+        The destination files are compared against the checksums recorded
+        while copying the share data, without accessing the source share.
+
+        :param resource_id: the source share id
+        :param destination_id: the migrated share id
+        """
+        manifest_path = self._get_share_manifest_path(resource_id)
+        if not os.path.exists(manifest_path):
+            raise exception.NotFound(f"No file manifest found for share: {resource_id}")
+        destination_share = self._destination_session.shared_file_system.get_share(
+            destination_id
+        )
+        with manila_utils.mounted_nfs_share(
+            self._destination_session, destination_share
+        ) as destination_mountpoint:
+            LOG.info("Verifying share data: %s", destination_mountpoint)
+            file_copy.verify_tree(
+                destination_mountpoint,
+                manifest_path,
+                workers=CONF.share_copy_workers,
+            )
+
+    def _get_share_manifest_path(self, source_share_id: str) -> str:
+        os.makedirs(CONF.share_manifest_dir, exist_ok=True)
+        return str(CONF.share_manifest_dir / f"{source_share_id}.sqlite")
+
+    def _migrate_share_data(self, source_share, destination_share, incremental=False):
+        """Copy the share data.
+
+        The copied files are recorded in a manifest. Incremental copies
+        only transfer the files that changed since the previous copy and
+        remove the files that were deleted from the source share.
+        """
+        manifest_path = self._get_share_manifest_path(source_share.id)
+        if not incremental and os.path.exists(manifest_path):
+            # Leftover from a previous migration, the destination share
+            # is new.
+            os.unlink(manifest_path)
+        elif incremental and not os.path.exists(manifest_path):
+            LOG.warning(
+                "No file manifest found for share %s, copying all files.",
+                source_share.id,
+            )
+
         with (
             manila_utils.mounted_nfs_share(
                 self._source_session, source_share
@@ -233,18 +331,14 @@ class ShareHandler(base.BaseMigrationHandler):
                 source_mountpoint,
                 destination_mountpoint,
             )
-            cmd = [
-                "sudo",
-                "cp",
-                "-r",
-                "--preserve=timestamps",
-                "--preserve=xattr",
-                "--preserve=links",
-                "--preserve=ownership",
-                f"{source_mountpoint}/.",
-                f"{destination_mountpoint}/",
-            ]
-            subprocess.check_call(cmd, text=True)
+            file_copy.copy_tree(
+                source_mountpoint,
+                destination_mountpoint,
+                workers=CONF.share_copy_workers,
+                scanners=CONF.share_copy_scanners,
+                manifest_path=manifest_path,
+                checksums=CONF.share_copy_checksums,
+            )
 
     def get_source_resource_ids(self, resource_filters: dict[str, Any]) -> list[str]:
         """Returns a list of resource ids based on the specified filters.
@@ -268,6 +362,9 @@ class ShareHandler(base.BaseMigrationHandler):
         return resource_ids
 
     def _delete_resource(self, resource_id: str, openstack_session):
+        # The share may still be mounted and have our temporary access rule
+        # if the current batch is still in progress.
+        manila_utils.get_mount_manager().release_share(resource_id)
         openstack_session.shared_file_system.delete_share(
             resource_id, ignore_missing=True
         )
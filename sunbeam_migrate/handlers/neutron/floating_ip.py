@@ -38,7 +38,7 @@ class FloatingIPHandler(base.BaseMigrationHandler):
 
     def get_associated_resources(self, resource_id: str) -> list[base.Resource]:
         """Return the network and subnet this floating IP depends on."""
-        source_fip = self._source_session.network.get_ip(resource_id)
+        source_fip = self._get_source("floating-ip", resource_id)
         if not source_fip:
             raise exception.NotFound(f"Floating IP not found: {resource_id}")
 
@@ -125,7 +125,7 @@ class FloatingIPHandler(base.BaseMigrationHandler):
 
         Return the resulting resource id.
         """
-        source_fip = self._source_session.network.get_ip(resource_id)
+        source_fip = self._get_source("floating-ip", resource_id)
         if not source_fip:
             raise exception.NotFound(f"Floating IP not found: {resource_id}")
 
@@ -234,27 +234,32 @@ class FloatingIPHandler(base.BaseMigrationHandler):
     def _get_router_from_floating_ip(
         self, floating_ip
     ) -> tuple[str | None, str | None]:
-        """Get the router ID associated with a subnet.
+        """Get the router connected to the floating IP port network.
 
         :param floating_ip: the floating IP object
 
-        Return the router ID or None if not found.
+        Return a (router_id, subnet_id) tuple or (None, None) if not found.
         """
         # Get network id for the port from floating IP
         port_details = floating_ip.port_details or {}
         port_network_id = port_details.get("network_id")
 
-        # Search for routers with interfaces on the subnets
-        # of the port_network_id
-        for router in self._source_session.network.routers():
-            for port in self._source_session.network.ports(
-                device_id=router.id,
-                device_owner="network:router_interface",
+        if not port_network_id:
+            return (None, None)
+
+        source_inventory = self._source_inventory
+        if source_inventory:
+            for subnet_id in source_inventory.get_reverse_related(
+                "subnet-network", port_network_id
             ):
-                fixed_ips = getattr(port, "fixed_ips", None) or []
-                for fixed_ip in fixed_ips:
-                    subnet_id = fixed_ip.get("subnet_id")
-                    subnet = self._source_session.network.get_subnet(subnet_id)
-                    if subnet and subnet.network_id == port_network_id:
-                        return (router.id, subnet_id)
-        return (None, None)
+                router_ids = source_inventory.get_reverse_related(
+                    "router-subnet", subnet_id
+                )
+                if router_ids:
+                    return (router_ids[0], subnet_id)
+            return (None, None)
+
+        # Look for routers with interfaces on the subnets of the port network.
+        return neutron_utils.get_router_interface_index(
+            self._source_session
+        ).get_network_router(port_network_id)
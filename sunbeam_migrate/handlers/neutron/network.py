@@ -1,8 +1,10 @@
 # SPDX-FileCopyrightText: 2025 - Canonical Ltd
 # SPDX-License-Identifier: Apache-2.0
 
+from openstack.network.v2 import network as _network
+
 from sunbeam_migrate import config, exception
-from sunbeam_migrate.handlers import base
+from sunbeam_migrate.handlers import base, factory
 
 CONF = config.get_config()
 
@@ -33,7 +35,7 @@ class NetworkHandler(base.BaseMigrationHandler):
 
     def get_associated_resources(self, resource_id: str) -> list[base.Resource]:
         """Return the source resources this network depends on."""
-        source_network = self._source_session.network.get_network(resource_id)
+        source_network = self._get_source("network", resource_id)
         if not source_network:
             raise exception.NotFound(f"Network not found: {resource_id}")
 
@@ -53,7 +55,7 @@ class NetworkHandler(base.BaseMigrationHandler):
 
     def get_member_resources(self, resource_id: str) -> list[base.Resource]:
         """Return the subnets that belong to this network."""
-        source_network = self._source_session.network.get_network(resource_id)
+        source_network = self._get_source("network", resource_id)
         if not source_network:
             raise exception.NotFound(f"Network not found: {resource_id}")
 
@@ -79,10 +81,98 @@ class NetworkHandler(base.BaseMigrationHandler):
 
         Return the resulting resource id.
         """
-        source_network = self._source_session.network.get_network(resource_id)
+        source_network = self._get_source("network", resource_id)
         if not source_network:
             raise exception.NotFound(f"Network not found: {resource_id}")
 
+        kwargs = self._get_network_kwargs(source_network, migrated_associated_resources)
+        dest_network = self._destination_session.network.create_network(**kwargs)
+
+        return dest_network.id
+
+    def supports_bulk_migration(self) -> bool:
+        """Networks may be created using Neutron bulk requests."""
+        return True
+
+    def perform_bulk_migration(
+        self,
+        resource_ids: list[str],
+        migrated_associated_resources: list[base.MigratedResource],
+    ) -> list[str]:
+        """Migrate multiple networks using a single bulk request.
+
+        :param resource_ids: the networks to be migrated
+        :param migrated_associated_resources: a list of MigratedResource
+            objects describing migrated dependencies.
+
+        Return the resulting network ids, in the same order.
+        """
+        networks_data = []
+        for resource_id in resource_ids:
+            source_network = self._get_source("network", resource_id)
+            if not source_network:
+                raise exception.NotFound(f"Network not found: {resource_id}")
+            networks_data.append(
+                self._get_network_kwargs(source_network, migrated_associated_resources)
+            )
+
+        dest_networks = _network.Network.bulk_create(
+            self._destination_session.network, networks_data
+        )
+        return [dest_network.id for dest_network in dest_networks]
+
+    def perform_member_batch_migration(
+        self,
+        resource_id: str,
+        destination_id: str,
+        member_resources: list[base.Resource],
+        migrated_associated_resources: list[base.MigratedResource],
+    ) -> dict[str, str]:
+        """Migrate the network subnets using a single bulk request.
+
+        Subnets owned by other projects are left to be migrated
+        individually, along with their dependencies.
+
+        :param resource_id: the source network ID
+        :param destination_id: the destination network ID
+        :param member_resources: the pending member resources
+        :param migrated_associated_resources: a list of MigratedResource
+            objects describing the migrated network and its dependencies.
+
+        Return a dict mapping the source subnet IDs to destination IDs.
+        """
+        migrated_project_ids = {
+            resource.source_id
+            for resource in migrated_associated_resources
+            if resource.resource_type == "project"
+        }
+        subnet_ids = []
+        for resource in member_resources:
+            if resource.resource_type != "subnet":
+                continue
+            source_subnet = self._get_source("subnet", resource.source_id)
+            if not source_subnet or source_subnet.network_id != resource_id:
+                continue
+            if CONF.multitenant_mode and (
+                source_subnet.project_id not in migrated_project_ids
+            ):
+                continue
+            subnet_ids.append(resource.source_id)
+        if not subnet_ids:
+            return {}
+
+        subnet_handler = factory.get_migration_handler("subnet")
+        subnet_handler.set_manager(self._manager)
+        dest_subnet_ids = subnet_handler.perform_bulk_migration(
+            subnet_ids, migrated_associated_resources
+        )
+        return dict(zip(subnet_ids, dest_subnet_ids, strict=True))
+
+    def _get_network_kwargs(
+        self,
+        source_network,
+        migrated_associated_resources: list[base.MigratedResource],
+    ) -> dict:
         fields = [
             "description",
             "dns_domain",
@@ -112,10 +202,7 @@ class NetworkHandler(base.BaseMigrationHandler):
             source_project_id=source_network.project_id,
         )
         kwargs.update(identity_kwargs)
-
-        dest_network = self._destination_session.network.create_network(**kwargs)
-
-        return dest_network.id
+        return kwargs
 
     def get_source_resource_ids(self, resource_filters: dict[str, str]) -> list[str]:
         """Returns a list of resource ids based on the specified filters.
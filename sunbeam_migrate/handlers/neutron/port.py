@@ -3,6 +3,8 @@
 
 import logging
 
+from openstack.network.v2 import port as _port
+
 from sunbeam_migrate import config, exception
 from sunbeam_migrate.handlers import base
 
@@ -39,7 +41,7 @@ class PortHandler(base.BaseMigrationHandler):
 
     def get_associated_resources(self, resource_id: str) -> list[base.Resource]:
         """Return the source resources this port depends on."""
-        source_port = self._source_session.network.get_port(resource_id)
+        source_port = self._get_source("port", resource_id)
         if not source_port:
             raise exception.NotFound(f"Port not found: {resource_id}")
 
@@ -69,12 +71,19 @@ class PortHandler(base.BaseMigrationHandler):
             )
 
         if CONF.preserve_port_floating_ip:
-            fips = self._source_session.network.ips(port_id=resource_id) or []
-            for fip in fips:
+            source_inventory = self._source_inventory
+            if source_inventory:
+                fip_ids = source_inventory.get_reverse_related(
+                    "floating-ip-port", resource_id
+                )
+            else:
+                fips = self._source_session.network.ips(port_id=resource_id) or []
+                fip_ids = [fip.id for fip in fips]
+            for fip_id in fip_ids:
                 associated_resources.append(
                     base.Resource(
                         resource_type="floating-ip",
-                        source_id=fip.id,
+                        source_id=fip_id,
                         should_cleanup=True,
                     )
                 )
@@ -94,10 +103,71 @@ class PortHandler(base.BaseMigrationHandler):
 
         Return the resulting resource id.
         """
-        source_port = self._source_session.network.get_port(resource_id)
+        source_port = self._get_source("port", resource_id)
         if not source_port:
             raise exception.NotFound(f"Port not found: {resource_id}")
 
+        kwargs = self._get_port_kwargs(source_port, migrated_associated_resources)
+        destination_port = self._destination_session.network.create_port(**kwargs)
+        self._reattach_floating_ips(
+            resource_id, destination_port.id, migrated_associated_resources
+        )
+
+        return destination_port.id
+
+    def supports_bulk_migration(self) -> bool:
+        """Ports may be created using Neutron bulk requests."""
+        return True
+
+    def perform_bulk_migration(
+        self,
+        resource_ids: list[str],
+        migrated_associated_resources: list[base.MigratedResource],
+    ) -> list[str]:
+        """Migrate multiple ports using a single bulk request.
+
+        :param resource_ids: the ports to be migrated
+        :param migrated_associated_resources: a list of MigratedResource
+            objects describing migrated dependencies.
+
+        Return the resulting port ids, in the same order.
+        """
+        ports_data = []
+        for resource_id in resource_ids:
+            source_port = self._get_source("port", resource_id)
+            if not source_port:
+                raise exception.NotFound(f"Port not found: {resource_id}")
+            ports_data.append(
+                self._get_port_kwargs(source_port, migrated_associated_resources)
+            )
+
+        destination_ports = _port.Port.bulk_create(
+            self._destination_session.network, ports_data
+        )
+        return [destination_port.id for destination_port in destination_ports]
+
+    def finalize_bulk_migration(
+        self,
+        resource_id: str,
+        destination_id: str,
+        migrated_associated_resources: list[base.MigratedResource],
+    ):
+        """Reattach the floating IPs of a port that was created in bulk.
+
+        :param resource_id: the source port ID
+        :param destination_id: the destination port ID
+        :param migrated_associated_resources: a list of MigratedResource
+            objects describing migrated dependencies.
+        """
+        self._reattach_floating_ips(
+            resource_id, destination_id, migrated_associated_resources
+        )
+
+    def _get_port_kwargs(
+        self,
+        source_port,
+        migrated_associated_resources: list[base.MigratedResource],
+    ) -> dict:
         destination_network_id = self._get_associated_resource_destination_id(
             "network",
             source_port.network_id,
@@ -175,14 +245,19 @@ class PortHandler(base.BaseMigrationHandler):
         )
         kwargs.update(identity_kwargs)
 
-        if CONF.preserve_port_floating_ip:
-            fips = self._source_session.network.ips(port_id=resource_id) or []
-        else:
-            LOG.info("'preserve_port_floating_ip' disabled.")
-            fips = []
+        return kwargs
 
-        destination_port = self._destination_session.network.create_port(**kwargs)
+    def _reattach_floating_ips(
+        self,
+        source_port_id: str,
+        destination_port_id: str,
+        migrated_associated_resources: list[base.MigratedResource],
+    ):
+        if not CONF.preserve_port_floating_ip:
+            LOG.info("'preserve_port_floating_ip' disabled.")
+            return
 
+        fips = self._source_session.network.ips(port_id=source_port_id) or []
         for fip in fips:
             dest_fip_id = self._get_associated_resource_destination_id(
                 "floating-ip", fip.id, migrated_associated_resources
@@ -190,14 +265,12 @@ class PortHandler(base.BaseMigrationHandler):
             LOG.info(
                 "Reattaching floating ip %s to port %s",
                 dest_fip_id,
-                destination_port.id,
+                destination_port_id,
             )
             self._destination_session.network.update_ip(
-                dest_fip_id, port_id=destination_port.id
+                dest_fip_id, port_id=destination_port_id
             )
 
-        return destination_port.id
-
     def get_source_resource_ids(self, resource_filters: dict[str, str]) -> list[str]:
         """Returns a list of resource ids based on the specified filters.
 
@@ -36,7 +36,7 @@ class RouterHandler(base.BaseMigrationHandler):
 
     def get_associated_resources(self, resource_id: str) -> list[base.Resource]:
         """Return the source resources this router depends on."""
-        source_router = self._source_session.network.get_router(resource_id)
+        source_router = self._get_source("router", resource_id)
         if not source_router:
             raise exception.NotFound(f"Router not found: {resource_id}")
 
@@ -78,13 +78,19 @@ class RouterHandler(base.BaseMigrationHandler):
 
     def get_member_resources(self, resource_id: str) -> list[base.Resource]:
         """Return internal subnets connected to this router."""
-        source_router = self._source_session.network.get_router(resource_id)
+        source_router = self._get_source("router", resource_id)
         if not source_router:
             raise exception.NotFound(f"Router not found: {resource_id}")
 
-        member_subnet_ids = neutron_utils.get_router_interface_subnets(
-            self._source_session, resource_id
-        )
+        source_inventory = self._source_inventory
+        if source_inventory:
+            member_subnet_ids = source_inventory.get_related(
+                "router-subnet", resource_id
+            )
+        else:
+            member_subnet_ids = neutron_utils.get_router_interface_index(
+                self._source_session
+            ).get_router_subnets(resource_id)
 
         member_resources: list[base.Resource] = []
         for subnet_id in member_subnet_ids:
@@ -107,7 +113,7 @@ class RouterHandler(base.BaseMigrationHandler):
 
         Return the resulting resource id.
         """
-        source_router = self._source_session.network.get_router(resource_id)
+        source_router = self._get_source("router", resource_id)
         if not source_router:
             raise exception.NotFound(f"Router not found: {resource_id}")
 
@@ -3,8 +3,10 @@
 
 import logging
 
-from sunbeam_migrate import config, exception
+from sunbeam_migrate import config, constants, exception
+from sunbeam_migrate.db import api as db_api
 from sunbeam_migrate.handlers import base
+from sunbeam_migrate.handlers.neutron import security_group_rule
 
 CONF = config.get_config()
 LOG = logging.getLogger()
@@ -36,7 +38,7 @@ class SecurityGroupHandler(base.BaseMigrationHandler):
 
     def get_associated_resources(self, resource_id: str) -> list[base.Resource]:
         """Return the source resources this security group depends on."""
-        source_sg = self._source_session.network.get_security_group(resource_id)
+        source_sg = self._get_source("security-group", resource_id)
         if not source_sg:
             raise exception.NotFound(f"Security Group not found: {resource_id}")
 
@@ -56,7 +58,7 @@ class SecurityGroupHandler(base.BaseMigrationHandler):
 
     def get_member_resources(self, resource_id: str) -> list[base.Resource]:
         """Return the rules belonging to this security group."""
-        source_sg = self._source_session.network.get_security_group(resource_id)
+        source_sg = self._get_source("security-group", resource_id)
         if not source_sg:
             raise exception.NotFound(f"Security Group not found: {resource_id}")
 
@@ -69,6 +71,130 @@ class SecurityGroupHandler(base.BaseMigrationHandler):
             )
         return member_resources
 
+    def perform_member_batch_migration(
+        self,
+        resource_id: str,
+        destination_id: str,
+        member_resources: list[base.Resource],
+        migrated_associated_resources: list[base.MigratedResource],
+    ) -> dict[str, str]:
+        """Migrate the security group rules using a single bulk request.
+
+        Rules that reference security groups which were not migrated yet
+        are skipped, leaving them to be migrated individually along with
+        their dependencies.
+
+        :param resource_id: the source security group ID
+        :param destination_id: the destination security group ID
+        :param member_resources: the pending member resources
+        :param migrated_associated_resources: a list of MigratedResource
+            objects describing the migrated security group and its
+            dependencies.
+
+        Return a dict mapping the source rule IDs to destination IDs.
+        """
+        rule_ids = {
+            resource.source_id
+            for resource in member_resources
+            if resource.resource_type == "security-group-rule"
+        }
+        if not rule_ids:
+            return {}
+
+        source_rules = [
+            rule
+            for rule in self._source_session.network.security_group_rules(
+                security_group_id=resource_id
+            )
+            if rule.id in rule_ids
+        ]
+
+        # Resolve the referenced security groups once.
+        remote_group_ids: dict[str, str | None] = {resource_id: destination_id}
+        for rule in source_rules:
+            if rule.remote_group_id and rule.remote_group_id not in remote_group_ids:
+                remote_group_ids[rule.remote_group_id] = (
+                    self._get_migrated_security_group_id(rule.remote_group_id)
+                )
+
+        # Neutron creates some rules implicitly (e.g. the default egress
+        # rules). Those are reused since bulk requests are atomic and would
+        # fail because of the conflicting rules.
+        existing_rules = {}
+        for rule in self._destination_session.network.security_group_rules(
+            security_group_id=destination_id
+        ):
+            existing_rules[_get_rule_key(rule.to_dict(), rule.remote_group_id)] = (
+                rule.id
+            )
+
+        migrated_rule_ids: dict[str, str] = {}
+        pending_rules = []
+        rules_data = []
+        identity_kwargs: dict[str | None, dict] = {}
+        for rule in source_rules:
+            dest_remote_group_id = None
+            if rule.remote_group_id:
+                dest_remote_group_id = remote_group_ids[rule.remote_group_id]
+                if not dest_remote_group_id:
+                    LOG.debug(
+                        "Security group %s not migrated yet, the rule %s will "
+                        "be migrated individually.",
+                        rule.remote_group_id,
+                        rule.id,
+                    )
+                    continue
+
+            kwargs = security_group_rule.get_rule_kwargs(rule)
+            existing_rule_id = existing_rules.get(
+                _get_rule_key(kwargs, dest_remote_group_id)
+            )
+            if existing_rule_id:
+                LOG.info(
+                    "Security group rule already exists on destination SG %s, "
+                    "reusing rule %s",
+                    destination_id,
+                    existing_rule_id,
+                )
+                migrated_rule_ids[rule.id] = existing_rule_id
+                continue
+
+            if rule.project_id not in identity_kwargs:
+                identity_kwargs[rule.project_id] = self._get_identity_build_kwargs(
+                    migrated_associated_resources,
+                    source_project_id=rule.project_id,
+                )
+            kwargs.update(identity_kwargs[rule.project_id])
+            kwargs["security_group_id"] = destination_id
+            if dest_remote_group_id:
+                kwargs["remote_group_id"] = dest_remote_group_id
+
+            pending_rules.append(rule)
+            rules_data.append(kwargs)
+
+        if rules_data:
+            dest_rules = list(
+                self._destination_session.network.create_security_group_rules(
+                    rules_data
+                )
+            )
+            for rule, dest_rule in zip(pending_rules, dest_rules, strict=True):
+                migrated_rule_ids[rule.id] = dest_rule.id
+            LOG.info(
+                "Created %s rules in security group %s on destination",
+                len(dest_rules),
+                destination_id,
+            )
+        return migrated_rule_ids
+
+    def _get_migrated_security_group_id(self, source_id: str) -> str | None:
+        migrations = db_api.get_migrations(
+            source_id=source_id, resource_type="security-group"
+        )
+        if migrations and migrations[0].status in constants.LIST_STATUS_MIGRATED:
+            return migrations[0].destination_id
+        return None
+
     def perform_individual_migration(
         self,
         resource_id: str,
@@ -82,7 +208,7 @@ class SecurityGroupHandler(base.BaseMigrationHandler):
 
         Return the resulting resource id.
         """
-        source_sg = self._source_session.network.get_security_group(resource_id)
+        source_sg = self._get_source("security-group", resource_id)
         if not source_sg:
             raise exception.NotFound(f"Security Group not found: {resource_id}")
 
@@ -131,3 +257,15 @@ class SecurityGroupHandler(base.BaseMigrationHandler):
         openstack_session.network.delete_security_group(
             resource_id, ignore_missing=True
         )
+
+
+def _get_rule_key(rule: dict, remote_group_id: str | None) -> tuple:
+    """Get the attributes that identify a security group rule."""
+    return (
+        *[
+            rule.get(field)
+            for field in security_group_rule.RULE_FIELDS
+            if field != "description"
+        ],
+        remote_group_id,
+    )
@@ -12,6 +12,29 @@ from sunbeam_migrate.handlers import base
 CONF = config.get_config()
 LOG = logging.getLogger(__name__)
 
+RULE_FIELDS = [
+    "description",
+    "direction",
+    "ether_type",
+    "port_range_min",
+    "port_range_max",
+    "protocol",
+    "remote_ip_prefix",
+]
+
+
+def get_rule_kwargs(source_sg_rule) -> dict:
+    """Get the destination rule arguments, excluding the referenced groups.
+
+    :param source_sg_rule: the source security group rule object
+    """
+    kwargs = {}
+    for field in RULE_FIELDS:
+        value = getattr(source_sg_rule, field, None)
+        if value is not None:
+            kwargs[field] = value
+    return kwargs
+
 
 class SecurityGroupRuleHandler(base.BaseMigrationHandler):
     """Handle Neutron security group rules migrations."""
@@ -36,7 +59,7 @@ class SecurityGroupRuleHandler(base.BaseMigrationHandler):
 
     def get_associated_resources(self, resource_id: str) -> list[base.Resource]:
         """Return the security groups referenced by this rule."""
-        source_rule = self._source_session.network.get_security_group_rule(resource_id)
+        source_rule = self._get_source("security-group-rule", resource_id)
         if not source_rule:
             raise exception.NotFound(f"Security Group Rule not found: {resource_id}")
 
@@ -76,9 +99,7 @@ class SecurityGroupRuleHandler(base.BaseMigrationHandler):
 
         Return the resulting resource id.
         """
-        source_sg_rule = self._source_session.network.get_security_group_rule(
-            resource_id
-        )
+        source_sg_rule = self._get_source("security-group-rule", resource_id)
         if not source_sg_rule:
             raise exception.NotFound(f"Security Group Rule not found: {resource_id}")
 
@@ -88,20 +109,7 @@ class SecurityGroupRuleHandler(base.BaseMigrationHandler):
             migrated_associated_resources,
         )
 
-        fields = [
-            "description",
-            "direction",
-            "ether_type",
-            "port_range_min",
-            "port_range_max",
-            "protocol",
-            "remote_ip_prefix",
-        ]
-        kwargs = {}
-        for field in fields:
-            value = getattr(source_sg_rule, field, None)
-            if value is not None:
-                kwargs[field] = value
+        kwargs = get_rule_kwargs(source_sg_rule)
 
         # Handle remote_group_id (needs resolution)
         if source_sg_rule.remote_group_id:
@@ -1,6 +1,8 @@
 # SPDX-FileCopyrightText: 2025 - Canonical Ltd
 # SPDX-License-Identifier: Apache-2.0
 
+from openstack.network.v2 import subnet as _subnet
+
 from sunbeam_migrate import config, exception
 from sunbeam_migrate.handlers import base
 
@@ -33,7 +35,7 @@ class SubnetHandler(base.BaseMigrationHandler):
 
     def get_associated_resources(self, resource_id: str) -> list[base.Resource]:
         """Return the source resources this subnet depends on."""
-        source_subnet = self._source_session.network.get_subnet(resource_id)
+        source_subnet = self._get_source("subnet", resource_id)
         if not source_subnet:
             raise exception.NotFound(f"Subnet not found: {resource_id}")
 
@@ -67,10 +69,52 @@ class SubnetHandler(base.BaseMigrationHandler):
 
         Return the resulting resource id.
         """
-        source_subnet = self._source_session.network.get_subnet(resource_id)
+        source_subnet = self._get_source("subnet", resource_id)
         if not source_subnet:
             raise exception.NotFound(f"Subnet not found: {resource_id}")
 
+        kwargs = self._get_subnet_kwargs(source_subnet, migrated_associated_resources)
+
+        # TODO: migrate subnet pools
+        destination_subnet = self._destination_session.network.create_subnet(**kwargs)
+        return destination_subnet.id
+
+    def supports_bulk_migration(self) -> bool:
+        """Subnets may be created using Neutron bulk requests."""
+        return True
+
+    def perform_bulk_migration(
+        self,
+        resource_ids: list[str],
+        migrated_associated_resources: list[base.MigratedResource],
+    ) -> list[str]:
+        """Migrate multiple subnets using a single bulk request.
+
+        :param resource_ids: the subnets to be migrated
+        :param migrated_associated_resources: a list of MigratedResource
+               objects describing migrated dependencies.
+
+        Return the resulting subnet ids, in the same order.
+        """
+        subnets_data = []
+        for resource_id in resource_ids:
+            source_subnet = self._get_source("subnet", resource_id)
+            if not source_subnet:
+                raise exception.NotFound(f"Subnet not found: {resource_id}")
+            subnets_data.append(
+                self._get_subnet_kwargs(source_subnet, migrated_associated_resources)
+            )
+
+        destination_subnets = _subnet.Subnet.bulk_create(
+            self._destination_session.network, subnets_data
+        )
+        return [destination_subnet.id for destination_subnet in destination_subnets]
+
+    def _get_subnet_kwargs(
+        self,
+        source_subnet,
+        migrated_associated_resources: list[base.MigratedResource],
+    ) -> dict:
         destination_network_id = self._get_associated_resource_destination_id(
             "network",
             source_subnet.network_id,
@@ -109,10 +153,7 @@ class SubnetHandler(base.BaseMigrationHandler):
             source_project_id=source_subnet.project_id,
         )
         kwargs.update(identity_kwargs)
-
-        # TODO: migrate subnet pools
-        destination_subnet = self._destination_session.network.create_subnet(**kwargs)
-        return destination_subnet.id
+        return kwargs
 
     def get_source_resource_ids(self, resource_filters: dict[str, str]) -> list[str]:
         """Returns a list of resource ids based on the specified filters.
@@ -3,10 +3,12 @@
 
 import logging
 import os
+from concurrent import futures
 from typing import Any
 
 from sunbeam_migrate import config, exception
 from sunbeam_migrate.handlers import base
+from sunbeam_migrate.utils import status_poller
 
 CONF = config.get_config()
 LOG = logging.getLogger()
@@ -15,6 +17,11 @@ LOG = logging.getLogger()
 class InstanceHandler(base.BaseMigrationHandler):
     """Handle Nova instance migrations."""
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Root disk transfers started before migrating the attached volumes.
+        self._root_disk_transfers: dict[str, futures.Future] = {}
+
     def get_service_type(self) -> str:
         """Return the Nova service type identifier."""
         return "nova"
@@ -39,7 +46,7 @@ class InstanceHandler(base.BaseMigrationHandler):
 
     def get_associated_resources(self, resource_id: str) -> list[base.Resource]:
         """Return the source resources this instance depends on."""
-        source_instance = self._source_session.compute.get_server(resource_id)
+        source_instance = self._get_source("instance", resource_id)
         if not source_instance:
             raise exception.NotFound(f"Instance not found: {resource_id}")
 
@@ -57,11 +64,23 @@ class InstanceHandler(base.BaseMigrationHandler):
         #
         # Security groups will also have to be passed to the instance creation request
         # if we choose to no longer create ports manually.
-        for port in self._source_session.network.ports(device_id=source_instance.id):
+        source_inventory = self._source_inventory
+        if source_inventory:
+            port_ids = source_inventory.get_reverse_related(
+                "port-device", source_instance.id
+            )
+        else:
+            port_ids = [
+                port.id
+                for port in self._source_session.network.ports(
+                    device_id=source_instance.id
+                )
+            ]
+        for port_id in port_ids:
             associated_resources.append(
                 base.Resource(
                     resource_type="port",
-                    source_id=port.id,
+                    source_id=port_id,
                     should_cleanup=True,
                 )
             )
@@ -116,6 +135,104 @@ class InstanceHandler(base.BaseMigrationHandler):
 
         return associated_resources
 
+    def get_associated_resource_concurrency(self) -> int:
+        """Get the number of associated resources migrated concurrently.
+
+        The attached volumes and the root disk are transferred concurrently.
+        """
+        return max(1, CONF.instance_transfer_concurrency)
+
+    def get_concurrent_associated_resource_types(self) -> list[str]:
+        """Get the associated resource types that can be migrated concurrently.
+
+        Only the attached volumes are migrated concurrently, the ports,
+        flavor, keypair and identity resources are migrated in order.
+        """
+        return ["volume"]
+
+    def prepare_individual_migration(
+        self, resource_id: str, executor: futures.Executor
+    ):
+        """Start the root disk transfer.
+
+        The root disk is transferred while migrating the attached volumes,
+        once the other associated resources are migrated.
+        """
+        if self.get_associated_resource_concurrency() <= 1:
+            return
+
+        source_instance = self._get_source("instance", resource_id)
+        if source_instance and self._is_image_booted(source_instance):
+            self._root_disk_transfers[resource_id] = executor.submit(
+                self._transfer_root_disk, source_instance
+            )
+
+    def abort_individual_migration(self, resource_id: str):
+        """Clean up the root disk transfer, if any."""
+        root_disk_transfer = self._root_disk_transfers.pop(resource_id, None)
+        if not root_disk_transfer:
+            return
+
+        try:
+            source_image, destination_image_id = root_disk_transfer.result()
+        except Exception:
+            # Failed transfers are cleaned up by "_transfer_root_disk".
+            return
+        self._delete_temporary_images(source_image, destination_image_id)
+
+    @staticmethod
+    def _is_image_booted(source_instance) -> bool:
+        return bool(source_instance.image and source_instance.image.get("id"))
+
+    def _get_owner_source_session(self, source_instance):
+        if CONF.multitenant_mode:
+            return self._owner_scoped_session(
+                self._source_session,
+                [CONF.member_role_name],
+                source_instance.project_id,
+            )
+        return self._source_session
+
+    def _transfer_root_disk(self, source_instance) -> tuple[Any, str]:
+        """Upload the instance root disk to Glance and migrate the image.
+
+        Return the temporary source image and the destination image id.
+        """
+        source_image = self._upload_instance_to_image(
+            self._get_owner_source_session(source_instance), source_instance
+        )
+        try:
+            image_migration = self.manager.perform_individual_migration(
+                resource_type="image",
+                resource_id=source_image.id,
+                cleanup_source=True,
+                include_dependencies=True,
+            )
+        except Exception as ex:
+            LOG.error("Failed to migrate instance image: %r", ex)
+            # Clean up source image on error
+            self._source_session.image.delete_image(
+                source_image.id, ignore_missing=True
+            )
+            raise
+        return source_image, image_migration.destination_id
+
+    def _delete_temporary_images(self, source_image, destination_image_id):
+        if source_image:
+            LOG.info("Deleting temporary image on source side: %s", source_image.id)
+            self._source_session.image.delete_image(
+                source_image.id, ignore_missing=True
+            )
+
+        if destination_image_id:
+            LOG.info(
+                "Deleting temporary image on destination side: %s",
+                destination_image_id,
+            )
+            self._destination_session.image.delete_image(
+                destination_image_id, ignore_missing=True
+            )
+
     def _upload_instance_to_image(self, owner_source_session, source_instance):
         """Upload instance to Glance image."""
         rand = int.from_bytes(os.urandom(4))
@@ -126,12 +243,16 @@ class InstanceHandler(base.BaseMigrationHandler):
         )
         LOG.info("Waiting for instance upload to complete. Image id: %s", image.id)
         glance_image = self._source_session.get_image(image.id)
-        self._source_session.image.wait_for_status(
-            glance_image,
+        self._wait_for_status(
+            self._source_session,
+            "image",
+            glance_image.id,
             status="active",
             failures=["error"],
-            interval=5,
             wait=CONF.volume_upload_timeout,
+            operation="instance-snapshot",
+            size=(getattr(source_instance.flavor, "disk", None) or 0)
+            * status_poller.GiB,
         )
         LOG.info("Finished uploading instance to Glance.")
         return self._source_session.get_image(glance_image.id)
@@ -180,7 +301,7 @@ class InstanceHandler(base.BaseMigrationHandler):
 
         Return the resulting resource id.
         """
-        source_instance = self._source_session.compute.get_server(resource_id)
+        source_instance = self._get_source("instance", resource_id)
         if not source_instance:
             raise exception.NotFound(f"Instance not found: {resource_id}")
 
@@ -193,44 +314,26 @@ class InstanceHandler(base.BaseMigrationHandler):
             source_project_id=source_instance.project_id,
         )
         if CONF.multitenant_mode:
-            owner_source_session = self._owner_scoped_session(
-                self._source_session,
-                [CONF.member_role_name],
-                source_instance.project_id,
-            )
             owner_destination_session = self._owner_scoped_session(
                 self._destination_session,
                 [CONF.member_role_name],
                 identity_kwargs["project_id"],
             )
         else:
-            owner_source_session = self._source_session
             owner_destination_session = self._destination_session
 
         destination_image_id: str | None = None
         source_image: Any = None
 
-        # Handle image-booted instances: upload to Glance and migrate image
-        if source_instance.image and source_instance.image.get("id"):
-            source_image = self._upload_instance_to_image(
-                owner_source_session, source_instance
+        # Handle image-booted instances: upload to Glance and migrate image.
+        # The transfer may have been started before migrating the volumes.
+        root_disk_transfer = self._root_disk_transfers.pop(resource_id, None)
+        if root_disk_transfer:
+            source_image, destination_image_id = root_disk_transfer.result()
+        elif self._is_image_booted(source_instance):
+            source_image, destination_image_id = self._transfer_root_disk(
+                source_instance
             )
-            try:
-                image_migration = self.manager.perform_individual_migration(
-                    resource_type="image",
-                    resource_id=source_image.id,
-                    cleanup_source=True,
-                    include_dependencies=True,
-                )
-                destination_image_id = image_migration.destination_id
-            except Exception as ex:
-                LOG.error("Failed to migrate instance image: %r", ex)
-                # Clean up source image on error
-                if source_image:
-                    self._source_session.image.delete_image(
-                        source_image.id, ignore_missing=True
-                    )
-                raise
 
         try:
             # Build instance creation kwargs
@@ -247,29 +350,18 @@ class InstanceHandler(base.BaseMigrationHandler):
             )
 
             LOG.info("Waiting for instance provisioning: %s", destination_instance.id)
-            self._destination_session.compute.wait_for_server(
-                destination_instance,
+            self._wait_for_status(
+                self._destination_session,
+                "instance",
+                destination_instance.id,
                 status="ACTIVE",
                 failures=["ERROR"],
-                interval=5,
                 wait=CONF.resource_creation_timeout,
+                operation="create",
             )
         finally:
             # Clean up temporary images after instance is created
-            if source_image:
-                LOG.info("Deleting temporary image on source side: %s", source_image.id)
-                self._source_session.image.delete_image(
-                    source_image.id, ignore_missing=True
-                )
-
-            if destination_image_id:
-                LOG.info(
-                    "Deleting temporary image on destination side: %s",
-                    destination_image_id,
-                )
-                self._destination_session.image.delete_image(
-                    destination_image_id, ignore_missing=True
-                )
+            self._delete_temporary_images(source_image, destination_image_id)
 
         return destination_instance.id
 
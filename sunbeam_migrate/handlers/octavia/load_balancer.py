@@ -2,6 +2,9 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import logging
+from concurrent import futures
+
+from openstack import exceptions as openstack_exc
 
 from sunbeam_migrate import config, exception
 from sunbeam_migrate.handlers import base
@@ -36,9 +39,7 @@ class LoadBalancerHandler(base.BaseMigrationHandler):
 
     def get_associated_resources(self, resource_id: str) -> list[base.Resource]:
         """Return the source resources this loadbalancer depends on."""
-        source_load_balancer = self._source_session.load_balancer.get_load_balancer(
-            resource_id
-        )
+        source_load_balancer = self._get_source("load-balancer", resource_id)
         if not source_load_balancer:
             raise exception.NotFound(f"Load balancer not found: {resource_id}")
 
@@ -61,7 +62,43 @@ class LoadBalancerHandler(base.BaseMigrationHandler):
                 )
             )
 
-        # Collect member subnets from any default pools attached to listeners
+        source_inventory = self._source_inventory
+        if source_inventory:
+            member_subnet_ids = source_inventory.get_related(
+                "load-balancer-subnet", resource_id
+            )
+        else:
+            member_subnet_ids = self._get_member_subnet_ids(resource_id)
+        for member_subnet_id in member_subnet_ids:
+            associated_resources.append(
+                base.Resource(resource_type="subnet", source_id=member_subnet_id)
+            )
+
+        # Collect any floating IPs associated with the load balancer's port
+        source_lb_port_id = source_load_balancer.vip_port_id
+        if source_lb_port_id:
+            if source_inventory:
+                fip_ids = source_inventory.get_reverse_related(
+                    "floating-ip-port", source_lb_port_id
+                )
+            else:
+                fip_ids = [
+                    floating_ip.id
+                    for floating_ip in self._source_session.network.ips(
+                        port_id=source_lb_port_id
+                    )
+                ]
+            for fip_id in fip_ids:
+                if fip_id:
+                    associated_resources.append(
+                        base.Resource(resource_type="floating-ip", source_id=fip_id)
+                    )
+
+        return associated_resources
+
+    def _get_member_subnet_ids(self, resource_id: str) -> list[str]:
+        """Get the member subnets of the default pools attached to listeners."""
+        member_subnet_ids = []
         for listener in self._source_session.load_balancer.listeners(
             loadbalancer_id=resource_id
         ):
@@ -69,33 +106,15 @@ class LoadBalancerHandler(base.BaseMigrationHandler):
             if not default_pool_id:
                 continue
 
-            pool = self._source_session.load_balancer.get_pool(default_pool_id)
+            pool = self._get_source("pool", default_pool_id)
             if not pool:
                 continue
 
             for member in self._source_session.load_balancer.members(pool.id):
                 member_subnet_id = getattr(member, "subnet_id", None)
                 if member_subnet_id:
-                    associated_resources.append(
-                        base.Resource(
-                            resource_type="subnet", source_id=member_subnet_id
-                        )
-                    )
-
-        # Collect any floating IPs associated with the load balancer's port
-        source_lb_port_id = source_load_balancer.vip_port_id
-        if source_lb_port_id:
-            for floating_ip in self._source_session.network.ips(
-                port_id=source_lb_port_id
-            ):
-                if floating_ip.id:
-                    associated_resources.append(
-                        base.Resource(
-                            resource_type="floating-ip", source_id=floating_ip.id
-                        )
-                    )
-
-        return associated_resources
+                    member_subnet_ids.append(member_subnet_id)
+        return member_subnet_ids
 
     def get_member_resource_types(self) -> list[str]:
         """Get a list of member (contained) resource types.
@@ -118,7 +137,7 @@ class LoadBalancerHandler(base.BaseMigrationHandler):
 
         Return the resulting resource id.
         """
-        source_lb = self._source_session.load_balancer.get_load_balancer(resource_id)
+        source_lb = self._get_source("load-balancer", resource_id)
         if not source_lb:
             raise exception.NotFound(f"Load balancer not found: {resource_id}")
 
@@ -133,98 +152,59 @@ class LoadBalancerHandler(base.BaseMigrationHandler):
         ):
             source_listeners.append(listener)
 
+        source_pool_ids = []
         for listener in source_listeners:
             default_pool_id = listener.default_pool_id
-            if default_pool_id and default_pool_id not in source_pools_map:
-                pool = self._source_session.load_balancer.get_pool(default_pool_id)
-                if pool:
-                    source_pools_map[default_pool_id] = pool
-                    # Get members for this pool
-                    source_members_map[default_pool_id] = self._get_source_pool_members(
-                        default_pool_id
-                    )
-                    # Get health monitor for this pool
-                    if pool.health_monitor_id:
-                        hm = self._source_session.load_balancer.get_health_monitor(
-                            pool.health_monitor_id
-                        )
-                        if hm:
-                            source_health_monitors_map[default_pool_id] = hm
-
-        dest_lb_id = self._create_destination_load_balancer(
-            source_lb, migrated_associated_resources
-        )
-
-        self._destination_session.load_balancer.wait_for_load_balancer(
-            dest_lb_id,
-            status="ACTIVE",
-            failures=["ERROR"],
-            interval=2,
-            wait=CONF.resource_creation_timeout,
-        )
-
-        listener_id_map = {}
-        pool_id_map = {}
-
-        for source_listener in source_listeners:
-            dest_listener_id = self._create_destination_listener(
-                source_listener, dest_lb_id
+            if default_pool_id and default_pool_id not in source_pool_ids:
+                source_pool_ids.append(default_pool_id)
+
+        # Gather the pools along with their members and health monitors
+        # concurrently.
+        with futures.ThreadPoolExecutor(
+            max_workers=max(1, CONF.load_balancer_source_concurrency)
+        ) as executor:
+            pool_components = executor.map(
+                self._get_source_pool_components, source_pool_ids
             )
-            listener_id_map[source_listener.id] = dest_listener_id
+            for pool_id, (pool, members, hm) in zip(source_pool_ids, pool_components):
+                if not pool:
+                    continue
+                source_pools_map[pool_id] = pool
+                source_members_map[pool_id] = members
+                if hm:
+                    source_health_monitors_map[pool_id] = hm
 
-            self._destination_session.load_balancer.wait_for_load_balancer(
-                dest_lb_id,
-                status="ACTIVE",
-                failures=["ERROR"],
-                interval=2,
-                wait=CONF.resource_creation_timeout,
+        dest_lb_id = None
+        if CONF.load_balancer_single_request_creation:
+            try:
+                dest_lb_id = self._create_populated_destination_load_balancer(
+                    source_lb,
+                    source_listeners,
+                    source_pools_map,
+                    source_members_map,
+                    source_health_monitors_map,
+                    migrated_associated_resources,
+                )
+            except openstack_exc.HttpException as ex:
+                # Not all Octavia providers support single-call creation.
+                if ex.status_code != 501:
+                    raise
+                LOG.warning(
+                    "The destination Octavia provider does not support "
+                    "fully-populated load balancer creation, creating the "
+                    "load balancer components one by one. Error: %s",
+                    ex,
+                )
+        if not dest_lb_id:
+            dest_lb_id = self._create_destination_load_balancer_components(
+                source_lb,
+                source_listeners,
+                source_pools_map,
+                source_members_map,
+                source_health_monitors_map,
+                migrated_associated_resources,
             )
 
-            if source_listener.default_pool_id:
-                source_pool = source_pools_map.get(source_listener.default_pool_id)
-                if source_pool and source_pool.id not in pool_id_map:
-                    dest_pool_id = self._create_destination_pool(
-                        source_pool, dest_listener_id
-                    )
-                    pool_id_map[source_pool.id] = dest_pool_id
-
-                    self._destination_session.load_balancer.wait_for_load_balancer(
-                        dest_lb_id,
-                        status="ACTIVE",
-                        failures=["ERROR"],
-                        interval=2,
-                        wait=CONF.resource_creation_timeout,
-                    )
-
-                    if source_pool.id in source_health_monitors_map:
-                        source_hm = source_health_monitors_map[source_pool.id]
-                        self._create_destination_health_monitor(source_hm, dest_pool_id)
-
-                        self._destination_session.load_balancer.wait_for_load_balancer(
-                            dest_lb_id,
-                            status="ACTIVE",
-                            failures=["ERROR"],
-                            interval=2,
-                            wait=CONF.resource_creation_timeout,
-                        )
-
-                    source_members = source_members_map.get(source_pool.id, [])
-                    for source_member in source_members:
-                        self._create_destination_member(
-                            source_member,
-                            dest_pool_id,
-                            source_pool.id,
-                            migrated_associated_resources,
-                        )
-
-                        self._destination_session.load_balancer.wait_for_load_balancer(
-                            dest_lb_id,
-                            status="ACTIVE",
-                            failures=["ERROR"],
-                            interval=2,
-                            wait=CONF.resource_creation_timeout,
-                        )
-
         # Attach Floating IPs to the destination load balancer port
         dest_lb = self._destination_session.load_balancer.get_load_balancer(dest_lb_id)
         if dest_lb.vip_port_id:
@@ -281,6 +261,26 @@ class LoadBalancerHandler(base.BaseMigrationHandler):
             resource_id, ignore_missing=True, cascade=True
         )
 
+    def _get_source_pool_components(self, pool_id: str) -> tuple:
+        """Get a source pool along with its members and health monitor.
+
+        :param pool_id: the source pool ID
+
+        Return a (pool, members, health_monitor) tuple. The pool is None
+        if it could not be found.
+        """
+        pool = self._get_source("pool", pool_id)
+        if not pool:
+            return None, [], None
+
+        members = self._get_source_pool_members(pool_id)
+        hm = None
+        if pool.health_monitor_id:
+            hm = self._source_session.load_balancer.get_health_monitor(
+                pool.health_monitor_id
+            )
+        return pool, members, hm
+
     def _get_source_pool_members(self, pool_id: str) -> list:
         """Get all members for a source pool.
 
@@ -293,18 +293,178 @@ class LoadBalancerHandler(base.BaseMigrationHandler):
             members.append(member)
         return members
 
-    def _create_destination_load_balancer(
+    def _create_populated_destination_load_balancer(
         self,
         source_lb,
+        source_listeners: list,
+        source_pools_map: dict,
+        source_members_map: dict,
+        source_health_monitors_map: dict,
         migrated_associated_resources: list[base.MigratedResource],
     ) -> str:
-        """Create a load balancer on the destination cloud.
+        """Create the load balancer and its components using a single request.
+
+        Octavia accepts fully-populated load balancer requests, including
+        listeners, pools, health monitors and members, which avoids waiting
+        for the load balancer to become active after each component.
+
+        Return the destination load balancer ID.
+        """
+        listeners = []
+        created_pool_ids = set()
+        for source_listener in source_listeners:
+            listener = _get_api_body(self._get_listener_kwargs(source_listener))
+            source_pool = source_pools_map.get(source_listener.default_pool_id)
+            if source_pool and source_pool.id not in created_pool_ids:
+                created_pool_ids.add(source_pool.id)
+                pool = _get_api_body(self._get_pool_kwargs(source_pool))
+                source_hm = source_health_monitors_map.get(source_pool.id)
+                if source_hm:
+                    pool["healthmonitor"] = _get_api_body(
+                        self._get_health_monitor_kwargs(source_hm)
+                    )
+                pool["members"] = [
+                    _get_api_body(
+                        self._get_member_kwargs(
+                            source_member, migrated_associated_resources
+                        )
+                    )
+                    for source_member in source_members_map.get(source_pool.id, [])
+                ]
+                listener["default_pool"] = pool
+            listeners.append(listener)
+
+        kwargs = self._get_load_balancer_kwargs(
+            source_lb, migrated_associated_resources
+        )
+        if listeners:
+            kwargs["listeners"] = listeners
+
+        dest_lb = self._destination_session.load_balancer.create_load_balancer(**kwargs)
+        LOG.info(
+            "Created load balancer %s on destination along with %s listeners, "
+            "%s pools and %s members (source: %s)",
+            dest_lb.id,
+            len(listeners),
+            len(created_pool_ids),
+            sum(
+                len(source_members_map.get(pool_id, [])) for pool_id in created_pool_ids
+            ),
+            source_lb.id,
+        )
+
+        self._wait_for_status(
+            self._destination_session,
+            "load-balancer",
+            dest_lb.id,
+            status="ACTIVE",
+            failures=["ERROR"],
+            wait=CONF.resource_creation_timeout,
+            operation="create-populated",
+        )
+        return dest_lb.id
+
+    def _create_destination_load_balancer_components(
+        self,
+        source_lb,
+        source_listeners: list,
+        source_pools_map: dict,
+        source_members_map: dict,
+        source_health_monitors_map: dict,
+        migrated_associated_resources: list[base.MigratedResource],
+    ) -> str:
+        """Create the load balancer and its components one by one.
+
+        Waits for the load balancer to become active after each operation.
+
+        Return the destination load balancer ID.
+        """
+        dest_lb_id = self._create_destination_load_balancer(
+            source_lb, migrated_associated_resources
+        )
+
+        self._wait_for_status(
+            self._destination_session,
+            "load-balancer",
+            dest_lb_id,
+            status="ACTIVE",
+            failures=["ERROR"],
+            wait=CONF.resource_creation_timeout,
+            operation="create",
+        )
+
+        listener_id_map = {}
+        pool_id_map = {}
+
+        for source_listener in source_listeners:
+            dest_listener_id = self._create_destination_listener(
+                source_listener, dest_lb_id
+            )
+            listener_id_map[source_listener.id] = dest_listener_id
+
+            self._wait_for_status(
+                self._destination_session,
+                "load-balancer",
+                dest_lb_id,
+                status="ACTIVE",
+                failures=["ERROR"],
+                wait=CONF.resource_creation_timeout,
+                operation="create-listener",
+            )
+
+            if source_listener.default_pool_id:
+                source_pool = source_pools_map.get(source_listener.default_pool_id)
+                if source_pool and source_pool.id not in pool_id_map:
+                    dest_pool_id = self._create_destination_pool(
+                        source_pool, dest_listener_id
+                    )
+                    pool_id_map[source_pool.id] = dest_pool_id
+
+                    self._wait_for_status(
+                        self._destination_session,
+                        "load-balancer",
+                        dest_lb_id,
+                        status="ACTIVE",
+                        failures=["ERROR"],
+                        wait=CONF.resource_creation_timeout,
+                        operation="create-pool",
+                    )
+
+                    if source_pool.id in source_health_monitors_map:
+                        source_hm = source_health_monitors_map[source_pool.id]
+                        self._create_destination_health_monitor(source_hm, dest_pool_id)
+
+                        self._wait_for_status(
+                            self._destination_session,
+                            "load-balancer",
+                            dest_lb_id,
+                            status="ACTIVE",
+                            failures=["ERROR"],
+                            wait=CONF.resource_creation_timeout,
+                            operation="create-health-monitor",
+                        )
+
+                    source_members = source_members_map.get(source_pool.id, [])
+                    if source_members:
+                        self._create_destination_members(
+                            source_members,
+                            dest_lb_id,
+                            dest_pool_id,
+                            migrated_associated_resources,
+                        )
+
+        return dest_lb_id
+
+    def _get_load_balancer_kwargs(
+        self,
+        source_lb,
+        migrated_associated_resources: list[base.MigratedResource],
+    ) -> dict:
+        """Get the destination load balancer creation arguments.
 
         :param source_lb: the source load balancer object
         :param migrated_associated_resources: a list of MigratedResource
             objects describing migrated dependencies.
-
-        Return the destination load balancer ID.
         """
         fields = [
             "name",
@@ -346,7 +506,24 @@ class LoadBalancerHandler(base.BaseMigrationHandler):
             source_project_id=source_lb.project_id,
         )
         kwargs.update(identity_kwargs)
+        return kwargs
 
+    def _create_destination_load_balancer(
+        self,
+        source_lb,
+        migrated_associated_resources: list[base.MigratedResource],
+    ) -> str:
+        """Create a load balancer on the destination cloud.
+
+        :param source_lb: the source load balancer object
+        :param migrated_associated_resources: a list of MigratedResource
+            objects describing migrated dependencies.
+
+        Return the destination load balancer ID.
+        """
+        kwargs = self._get_load_balancer_kwargs(
+            source_lb, migrated_associated_resources
+        )
         dest_lb = self._destination_session.load_balancer.create_load_balancer(**kwargs)
         LOG.info(
             "Created load balancer %s on destination (source: %s)",
@@ -355,13 +532,10 @@ class LoadBalancerHandler(base.BaseMigrationHandler):
         )
         return dest_lb.id
 
-    def _create_destination_listener(self, source_listener, dest_lb_id: str) -> str:
-        """Create a listener on the destination load balancer.
+    def _get_listener_kwargs(self, source_listener) -> dict:
+        """Get the destination listener creation arguments.
 
         :param source_listener: the source listener object
-        :param dest_lb_id: the destination load balancer ID
-
-        Return the destination listener ID.
         """
         fields = [
             "name",
@@ -380,14 +554,24 @@ class LoadBalancerHandler(base.BaseMigrationHandler):
             "allowed_cidrs",
         ]
 
-        kwargs = {"loadbalancer_id": dest_lb_id}
+        kwargs = {}
         for field in fields:
             value = getattr(source_listener, field, None)
             if value is not None:
                 kwargs[field] = value
+        return kwargs
 
+    def _create_destination_listener(self, source_listener, dest_lb_id: str) -> str:
+        """Create a listener on the destination load balancer.
+
+        :param source_listener: the source listener object
+        :param dest_lb_id: the destination load balancer ID
+
+        Return the destination listener ID.
+        """
+        kwargs = self._get_listener_kwargs(source_listener)
         dest_listener = self._destination_session.load_balancer.create_listener(
-            **kwargs
+            loadbalancer_id=dest_lb_id, **kwargs
         )
         LOG.info(
             "Created listener %s on destination (source: %s)",
@@ -396,13 +580,10 @@ class LoadBalancerHandler(base.BaseMigrationHandler):
         )
         return dest_listener.id
 
-    def _create_destination_pool(self, source_pool, dest_listener_id: str) -> str:
-        """Create a pool on the destination cloud.
+    def _get_pool_kwargs(self, source_pool) -> dict:
+        """Get the destination pool creation arguments.
 
         :param source_pool: the source pool object
-        :param dest_listener_id: the destination listener ID
-
-        Return the destination pool ID.
         """
         fields = [
             "name",
@@ -413,13 +594,25 @@ class LoadBalancerHandler(base.BaseMigrationHandler):
             "session_persistence",
         ]
 
-        kwargs = {"listener_id": dest_listener_id}
+        kwargs = {}
         for field in fields:
             value = getattr(source_pool, field, None)
             if value is not None:
                 kwargs[field] = value
+        return kwargs
+
+    def _create_destination_pool(self, source_pool, dest_listener_id: str) -> str:
+        """Create a pool on the destination cloud.
+
+        :param source_pool: the source pool object
+        :param dest_listener_id: the destination listener ID
 
-        dest_pool = self._destination_session.load_balancer.create_pool(**kwargs)
+        Return the destination pool ID.
+        """
+        kwargs = self._get_pool_kwargs(source_pool)
+        dest_pool = self._destination_session.load_balancer.create_pool(
+            listener_id=dest_listener_id, **kwargs
+        )
         LOG.info(
             "Created pool %s on destination (source: %s)",
             dest_pool.id,
@@ -427,18 +620,14 @@ class LoadBalancerHandler(base.BaseMigrationHandler):
         )
         return dest_pool.id
 
-    def _create_destination_member(
+    def _get_member_kwargs(
         self,
         source_member,
-        dest_pool_id: str,
-        source_pool_id: str,
         migrated_associated_resources: list[base.MigratedResource],
-    ):
-        """Create a pool member on the destination cloud.
+    ) -> dict:
+        """Get the destination pool member creation arguments.
 
         :param source_member: the source member object
-        :param dest_pool_id: the destination pool ID
-        :param source_pool_id: the source pool ID (for logging)
         :param migrated_associated_resources: a list of MigratedResource
             objects describing migrated dependencies.
         """
@@ -473,7 +662,22 @@ class LoadBalancerHandler(base.BaseMigrationHandler):
                     "member may not work correctly",
                     source_member.subnet_id,
                 )
+        return kwargs
+
+    def _create_destination_member(
+        self,
+        source_member,
+        dest_pool_id: str,
+        migrated_associated_resources: list[base.MigratedResource],
+    ):
+        """Create a pool member on the destination cloud.
 
+        :param source_member: the source member object
+        :param dest_pool_id: the destination pool ID
+        :param migrated_associated_resources: a list of MigratedResource
+            objects describing migrated dependencies.
+        """
+        kwargs = self._get_member_kwargs(source_member, migrated_associated_resources)
         dest_member = self._destination_session.load_balancer.create_member(
             dest_pool_id, **kwargs
         )
@@ -484,11 +688,85 @@ class LoadBalancerHandler(base.BaseMigrationHandler):
             source_member.id,
         )
 
-    def _create_destination_health_monitor(self, source_hm, dest_pool_id: str):
-        """Create a health monitor on the destination cloud.
+    def _create_destination_members(
+        self,
+        source_members: list,
+        dest_lb_id: str,
+        dest_pool_id: str,
+        migrated_associated_resources: list[base.MigratedResource],
+    ):
+        """Create the pool members on the destination cloud.
 
-        :param source_hm: the source health monitor object
+        The members are created using a single batch member update,
+        waiting once for the load balancer to become active. Falls back to
+        creating the members one by one if batch updates are not supported.
+
+        :param source_members: the source member objects
+        :param dest_lb_id: the destination load balancer ID
         :param dest_pool_id: the destination pool ID
+        :param migrated_associated_resources: a list of MigratedResource
+            objects describing migrated dependencies.
+        """
+        members = [
+            _get_api_body(
+                self._get_member_kwargs(source_member, migrated_associated_resources)
+            )
+            for source_member in source_members
+        ]
+        # The openstack SDK doesn't expose batch member updates.
+        response = self._destination_session.load_balancer.put(
+            f"/lbaas/pools/{dest_pool_id}/members",
+            json={"members": members},
+            raise_exc=False,
+        )
+        try:
+            openstack_exc.raise_from_response(response)
+        except openstack_exc.HttpException as ex:
+            if ex.status_code != 501:
+                raise
+            LOG.warning(
+                "The destination Octavia provider does not support batch "
+                "member updates, creating the members one by one. Error: %s",
+                ex,
+            )
+        else:
+            LOG.info(
+                "Created %s members in pool %s on destination",
+                len(members),
+                dest_pool_id,
+            )
+            self._wait_for_status(
+                self._destination_session,
+                "load-balancer",
+                dest_lb_id,
+                status="ACTIVE",
+                failures=["ERROR"],
+                wait=CONF.resource_creation_timeout,
+                operation="update-members",
+            )
+            return
+
+        for source_member in source_members:
+            self._create_destination_member(
+                source_member,
+                dest_pool_id,
+                migrated_associated_resources,
+            )
+
+            self._wait_for_status(
+                self._destination_session,
+                "load-balancer",
+                dest_lb_id,
+                status="ACTIVE",
+                failures=["ERROR"],
+                wait=CONF.resource_creation_timeout,
+                operation="create-member",
+            )
+
+    def _get_health_monitor_kwargs(self, source_hm) -> dict:
+        """Get the destination health monitor creation arguments.
+
+        :param source_hm: the source health monitor object
         """
         fields = [
             "name",
@@ -503,17 +781,37 @@ class LoadBalancerHandler(base.BaseMigrationHandler):
             "is_admin_state_up",
         ]
 
-        kwargs = {"pool_id": dest_pool_id}
+        kwargs = {}
         for field in fields:
             value = getattr(source_hm, field, None)
             if value is not None:
                 kwargs[field] = value
+        return kwargs
 
+    def _create_destination_health_monitor(self, source_hm, dest_pool_id: str):
+        """Create a health monitor on the destination cloud.
+
+        :param source_hm: the source health monitor object
+        :param dest_pool_id: the destination pool ID
+        """
+        kwargs = self._get_health_monitor_kwargs(source_hm)
         dest_hm = self._destination_session.load_balancer.create_health_monitor(
-            **kwargs
+            pool_id=dest_pool_id, **kwargs
         )
         LOG.info(
             "Created health monitor %s on destination (source: %s)",
             dest_hm.id,
             source_hm.id,
         )
+
+
+def _get_api_body(kwargs: dict) -> dict:
+    """Convert SDK resource arguments to Octavia API request fields.
+
+    Nested objects of fully-populated load balancer requests are passed
+    to the API as-is, without the SDK attribute name translation.
+    """
+    body = dict(kwargs)
+    if "is_admin_state_up" in body:
+        body["admin_state_up"] = body.pop("is_admin_state_up")
+    return body
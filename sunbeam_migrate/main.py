@@ -11,12 +11,16 @@ from sunbeam_migrate import config, log
 from sunbeam_migrate.cmd import capabilities as capabilities_cmd
 from sunbeam_migrate.cmd import cleanup_source as cleanup_source_cmd
 from sunbeam_migrate.cmd import delete as delete_cmd
+from sunbeam_migrate.cmd import inventory as inventory_cmd
 from sunbeam_migrate.cmd import list as list_cmd
 from sunbeam_migrate.cmd import register_external as register_external_cmd
 from sunbeam_migrate.cmd import restore as restore_cmd
 from sunbeam_migrate.cmd import show as show_cmd
 from sunbeam_migrate.cmd import start as start_cmd
+from sunbeam_migrate.cmd import sync as sync_cmd
+from sunbeam_migrate.cmd import verify as verify_cmd
 from sunbeam_migrate.db import api as db_api
+from sunbeam_migrate.utils import connection_pool
 
 LOG = logging.getLogger()
 
@@ -45,6 +49,9 @@ def cli(ctx, config_path: str, debug: bool):
     if config_path:
         LOG.debug("Loaded config: %s", config_path)
 
+    if config.get_config().revoke_temporary_role_assignments:
+        ctx.call_on_close(connection_pool.get_connection_pool().revoke_role_grants)
+
 
 def main():
     """Main entry point."""
@@ -58,7 +65,10 @@ def main():
     cli.add_command(delete_cmd.delete_migrations)
     cli.add_command(restore_cmd.restore_migrations)
     cli.add_command(cleanup_source_cmd.cleanup_migration_sources)
+    cli.add_command(sync_cmd.sync_migration_data)
+    cli.add_command(verify_cmd.verify_migration_data)
     cli.add_command(register_external_cmd.register_external)
+    cli.add_command(inventory_cmd.inventory_group)
 
     cli()
 
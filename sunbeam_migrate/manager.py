@@ -2,18 +2,56 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import logging
+import threading
 import typing
+from concurrent import futures
 
-from sunbeam_migrate import config, constants, exception
+from sunbeam_migrate import config, constants, exception, executor
 from sunbeam_migrate.db import api as db_api
 from sunbeam_migrate.db import models
 from sunbeam_migrate.handlers import base, factory
+from sunbeam_migrate.utils import connection_pool
 
 CONFIG = config.get_config()
 LOG = logging.getLogger()
 
 
 class SunbeamMigrationManager:
+    def __init__(self):
+        # Migrations that are currently being performed by this process,
+        # used to avoid migrating shared dependencies more than once when
+        # performing concurrent migrations.
+        self._in_flight_migrations: dict[tuple[str, str], futures.Future] = {}
+        self._in_flight_lock = threading.Lock()
+
+    def _claim_migration(
+        self, resource_type: str, resource_id: str
+    ) -> tuple[futures.Future, bool]:
+        """Register an in-flight migration.
+
+        Returns a future that provides the resulting migration object and a
+        boolean stating whether the caller is expected to perform the
+        migration. If the resource is already being migrated, the caller is
+        expected to wait for the returned future instead.
+        """
+        key = (resource_type, resource_id)
+        with self._in_flight_lock:
+            if key in self._in_flight_migrations:
+                return self._in_flight_migrations[key], False
+            future: futures.Future = futures.Future()
+            self._in_flight_migrations[key] = future
+            return future, True
+
+    def _release_migration(self, resource_type: str, resource_id: str):
+        with self._in_flight_lock:
+            self._in_flight_migrations.pop((resource_type, resource_id), None)
+
+    def _get_in_flight_migration(
+        self, resource_type: str, resource_id: str
+    ) -> futures.Future | None:
+        with self._in_flight_lock:
+            return self._in_flight_migrations.get((resource_type, resource_id))
+
     def _get_migration_handler(
         self, resource_type: str | None
     ) -> base.BaseMigrationHandler:
@@ -45,21 +83,339 @@ class SunbeamMigrationManager:
         if not resource_id:
             raise exception.InvalidInput("No resource id specified.")
 
-        migration, associated_migrations = self._migrate_parent_resource(
-            handler=handler,
-            resource_type=resource_type,
-            resource_id=resource_id,
-            include_dependencies=include_dependencies,
-            include_members=include_members,
+        in_flight_migration, owner = self._claim_migration(resource_type, resource_id)
+        if not owner:
+            LOG.info(
+                "The %s resource %s is already being migrated, "
+                "waiting for the in-flight migration.",
+                resource_type,
+                resource_id,
+            )
+            return in_flight_migration.result()
+
+        try:
+            migration, associated_migrations = self._migrate_parent_resource(
+                handler=handler,
+                resource_type=resource_type,
+                resource_id=resource_id,
+                include_dependencies=include_dependencies,
+                include_members=include_members,
+            )
+        except Exception as ex:
+            in_flight_migration.set_exception(ex)
+            self._release_migration(resource_type, resource_id)
+            raise
+
+        # Dependent resources may consume the migrated resource as soon as
+        # we have a destination id, there's no need to wait for the members.
+        in_flight_migration.set_result(migration)
+        try:
+            return self._finalize_migration(
+                handler=handler,
+                migration=migration,
+                associated_migrations=associated_migrations,
+                resource_id=resource_id,
+                cleanup_source=cleanup_source,
+                include_dependencies=include_dependencies,
+                include_members=include_members,
+            )
+        finally:
+            self._release_migration(resource_type, resource_id)
+
+    def perform_bulk_migration(
+        self,
+        resource_type: str,
+        resource_ids: list[str],
+        cleanup_source: bool = False,
+        include_dependencies: bool = False,
+        include_members: bool = False,
+    ) -> list[models.Migration]:
+        """Migrate multiple resources of the same type.
+
+        If supported by the migration handler, the resources whose
+        dependencies have already been migrated are created in chunks using
+        bulk requests. The remaining resources are migrated individually,
+        as well as the chunks whose bulk requests failed. Failures that
+        occur after the resources are created are not retried.
+
+        Returns the migration objects, in the same order as the resource ids.
+        """
+        handler = self._get_migration_handler(resource_type)
+        chunk_size = CONFIG.bulk_migration_chunk_size
+        if chunk_size <= 1 or not handler.supports_bulk_migration():
+            return [
+                self.perform_individual_migration(
+                    resource_type,
+                    resource_id,
+                    cleanup_source=cleanup_source,
+                    include_dependencies=include_dependencies,
+                    include_members=include_members,
+                )
+                for resource_id in resource_ids
+            ]
+
+        migrations: dict[str, models.Migration] = {}
+        claimed_migrations: dict[str, futures.Future] = {}
+        try:
+            bulk_resources = self._claim_bulk_resources(
+                resource_type, resource_ids, claimed_migrations
+            )
+
+            for idx in range(0, len(bulk_resources), chunk_size):
+                chunk = bulk_resources[idx : idx + chunk_size]
+                resource_ids_chunk = [resource_id for resource_id, _ in chunk]
+                migrated_associated_resources = self._get_bulk_associated_resources(
+                    chunk
+                )
+                LOG.info(
+                    "Initiating bulk %s migration, resource ids: %s",
+                    resource_type,
+                    ", ".join(resource_ids_chunk),
+                )
+                try:
+                    destination_ids = handler.perform_bulk_migration(
+                        resource_ids_chunk,
+                        migrated_associated_resources=migrated_associated_resources,
+                    )
+                except Exception as ex:
+                    # Nothing was created, the resources can safely be
+                    # migrated individually.
+                    LOG.warning(
+                        "Bulk %s migration failed, migrating the resources "
+                        "individually: %r",
+                        resource_type,
+                        ex,
+                    )
+                    for resource_id in resource_ids_chunk:
+                        migrations[resource_id] = self._perform_claimed_migration(
+                            resource_type,
+                            resource_id,
+                            claimed_migrations.pop(resource_id),
+                            cleanup_source=cleanup_source,
+                            include_dependencies=include_dependencies,
+                            include_members=include_members,
+                        )
+                    continue
+
+                chunk_migrations = self._record_bulk_migrations(
+                    handler,
+                    resource_type,
+                    resource_ids_chunk,
+                    destination_ids,
+                    cleanup_source,
+                    include_members,
+                )
+                finalize_error = None
+                for migration in chunk_migrations:
+                    resource_id = str(migration.source_id)
+                    in_flight_migration = claimed_migrations.pop(resource_id)
+                    try:
+                        handler.finalize_bulk_migration(
+                            resource_id,
+                            str(migration.destination_id),
+                            migrated_associated_resources,
+                        )
+                    except Exception as ex:
+                        LOG.error(
+                            "Unable to finalize the %s %s migration: %r",
+                            resource_type,
+                            resource_id,
+                            ex,
+                        )
+                        migration.status = constants.STATUS_FAILED
+                        migration.error_message = "Migration failed, error: %r" % ex
+                        migration.save()
+                        in_flight_migration.set_exception(ex)
+                        self._release_migration(resource_type, resource_id)
+                        finalize_error = finalize_error or ex
+                        continue
+
+                    in_flight_migration.set_result(migration)
+                    try:
+                        if include_members or cleanup_source:
+                            self._finalize_migration(
+                                handler=handler,
+                                migration=migration,
+                                associated_migrations=[],
+                                resource_id=resource_id,
+                                cleanup_source=cleanup_source,
+                                include_dependencies=include_dependencies,
+                                include_members=include_members,
+                            )
+                    finally:
+                        self._release_migration(resource_type, resource_id)
+                    migrations[resource_id] = migration
+                if finalize_error:
+                    raise finalize_error
+        finally:
+            for resource_id, in_flight_migration in claimed_migrations.items():
+                in_flight_migration.set_exception(
+                    exception.SunbeamMigrateException(
+                        f"Bulk {resource_type} migration aborted."
+                    )
+                )
+                self._release_migration(resource_type, resource_id)
+
+        for resource_id in resource_ids:
+            if resource_id not in migrations:
+                migrations[resource_id] = self.perform_individual_migration(
+                    resource_type,
+                    resource_id,
+                    cleanup_source=cleanup_source,
+                    include_dependencies=include_dependencies,
+                    include_members=include_members,
+                )
+        return [migrations[resource_id] for resource_id in resource_ids]
+
+    def _claim_bulk_resources(
+        self,
+        resource_type: str,
+        resource_ids: list[str],
+        claimed_migrations: dict[str, futures.Future],
+    ) -> list[tuple[str, typing.Sequence[base.Resource]]]:
+        """Claim the resources that can be migrated in bulk.
+
+        The in-flight migrations of the claimed resources are added to the
+        "claimed_migrations" dict.
+
+        Returns the claimed resources along with their migrated dependencies.
+        """
+        bulk_resources: list[tuple[str, typing.Sequence[base.Resource]]] = []
+        for resource_id in resource_ids:
+            existing = db_api.get_migrations(
+                source_id=resource_id,
+                resource_type=resource_type,
+            )
+            if existing and existing[0].status in constants.LIST_STATUS_MIGRATED:
+                continue
+            associated_resources = self._get_associated_resources(
+                resource_type, resource_id
+            )
+            if associated_resources["pending"]:
+                continue
+            in_flight_migration, owner = self._claim_migration(
+                resource_type, resource_id
+            )
+            if not owner:
+                continue
+            claimed_migrations[resource_id] = in_flight_migration
+            bulk_resources.append((resource_id, associated_resources["migrated"]))
+        return bulk_resources
+
+    def _perform_claimed_migration(
+        self,
+        resource_type: str,
+        resource_id: str,
+        in_flight_migration: futures.Future,
+        cleanup_source: bool,
+        include_dependencies: bool,
+        include_members: bool,
+    ) -> models.Migration:
+        """Migrate a resource claimed for a bulk migration individually."""
+        self._release_migration(resource_type, resource_id)
+        try:
+            migration = self.perform_individual_migration(
+                resource_type,
+                resource_id,
+                cleanup_source=cleanup_source,
+                include_dependencies=include_dependencies,
+                include_members=include_members,
+            )
+        except Exception as ex:
+            in_flight_migration.set_exception(ex)
+            raise
+        in_flight_migration.set_result(migration)
+        return migration
+
+    def _get_bulk_associated_resources(
+        self, resources: list[tuple[str, typing.Sequence[base.Resource]]]
+    ) -> list[base.MigratedResource]:
+        """Merge the migrated associated resources of a bulk migration chunk."""
+        migrated_associated_resources: dict[tuple[str, str], base.MigratedResource] = {}
+        for _, associated_resources in resources:
+            for associated_resource in associated_resources:
+                migrated_associated_resources[
+                    (associated_resource.resource_type, associated_resource.source_id)
+                ] = typing.cast(base.MigratedResource, associated_resource)
+        return list(migrated_associated_resources.values())
+
+    def _record_bulk_migrations(
+        self,
+        handler,
+        resource_type: str,
+        resource_ids: list[str],
+        destination_ids: list[str],
+        cleanup_source: bool,
+        include_members: bool,
+    ) -> list[models.Migration]:
+        """Record the resources that were created using a bulk request.
+
+        The migration records are saved using a single transaction. The
+        created resources are removed if the migrations cannot be recorded.
+        """
+        # The members and cleanup steps are handled separately, if requested.
+        status = (
+            constants.STATUS_PENDING_MEMBERS
+            if include_members or cleanup_source
+            else constants.STATUS_COMPLETED
         )
+        try:
+            if len(destination_ids) != len(resource_ids):
+                raise exception.SunbeamMigrateException(
+                    "Expected %s %s resources, got: %s"
+                    % (len(resource_ids), resource_type, destination_ids)
+                )
+            migrations = [
+                models.Migration(
+                    service=handler.get_service_type(),
+                    source_cloud=CONFIG.source_cloud_name,
+                    destination_cloud=CONFIG.destination_cloud_name,
+                    source_id=resource_id,
+                    destination_id=destination_id,
+                    resource_type=resource_type,
+                    status=status,
+                )
+                for resource_id, destination_id in zip(resource_ids, destination_ids)
+            ]
+            db_api.create_migrations(migrations)
+        except Exception:
+            for destination_id in destination_ids:
+                try:
+                    handler.delete_destination_resource(destination_id)
+                except Exception as cleanup_ex:
+                    LOG.error(
+                        "Unable to clean up the destination %s %s: %r",
+                        resource_type,
+                        destination_id,
+                        cleanup_ex,
+                    )
+            raise
+
+        LOG.info(
+            "Successfully migrated %s %s resources in bulk",
+            len(migrations),
+            resource_type,
+        )
+        return migrations
 
+    def _finalize_migration(
+        self,
+        handler,
+        migration: models.Migration,
+        associated_migrations: list[models.Migration],
+        resource_id: str,
+        cleanup_source: bool,
+        include_dependencies: bool,
+        include_members: bool,
+    ) -> models.Migration:
+        """Migrate member resources and cleanup the source, if requested."""
         migration.status = constants.STATUS_PENDING_MEMBERS
         migration.save()
 
         if include_members:
             migrated_member_resources = self._migrate_member_resources(
                 handler=handler,
-                resource_id=resource_id,
+                parent_migration=migration,
                 cleanup_source=cleanup_source,
                 include_dependencies=include_dependencies,
                 include_members=include_members,
@@ -134,6 +490,12 @@ class SunbeamMigrationManager:
         migration.save()
 
         cleanup_associated_migrations = []
+        # Used to migrate the associated resources concurrently, along with
+        # the steps that the handler may perform in advance.
+        transfer_pool = futures.ThreadPoolExecutor(
+            max_workers=handler.get_associated_resource_concurrency(),
+            thread_name_prefix=f"{resource_type}-transfer",
+        )
         try:
             associated_resources = self._get_associated_resources(
                 resource_type, resource_id
@@ -144,54 +506,55 @@ class SunbeamMigrationManager:
                 resource_id,
                 associated_resources,
             )
-            if associated_resources["pending"]:
-                if not include_dependencies:
-                    raise exception.InvalidInput(
-                        "The %s resource (%s) has pending associated resources. "
-                        "Specify --include-dependencies to automatically migrate them "
-                        "or use separate `sunbeam-migrate start` commands: %s"
-                        % (resource_type, resource_id, associated_resources)
-                    )
-                for associated_resource in associated_resources["pending"]:
-                    # Check if this resource is already being migrated
-                    existing = db_api.get_migrations(
-                        source_id=associated_resource.source_id,
-                        resource_type=associated_resource.resource_type,
-                    )
-                    if existing:
-                        if existing[0].status in constants.LIST_STATUS_MIGRATED:
-                            LOG.info(
-                                "Associated resource %s %s already completed"
-                                " (migration %s, status %s), "
-                                "skipping duplicate migration",
-                                associated_resource.resource_type,
-                                associated_resource.source_id,
-                                existing[0].uuid,
-                                existing[0].status,
-                            )
-                            continue
-                        elif existing[0].status == constants.STATUS_IN_PROGRESS:
-                            LOG.info(
-                                "Associated resource %s %s already in progress"
-                                " (migration %s), "
-                                "will be available once migration completes",
-                                associated_resource.resource_type,
-                                associated_resource.source_id,
-                                existing[0].uuid,
-                            )
-                            continue
+            if associated_resources["pending"] and not include_dependencies:
+                raise exception.InvalidInput(
+                    "The %s resource (%s) has pending associated resources. "
+                    "Specify --include-dependencies to automatically migrate them "
+                    "or use separate `sunbeam-migrate start` commands: %s"
+                    % (resource_type, resource_id, associated_resources)
+                )
 
-                    LOG.info(
-                        "Migrating associated %s resource: %s",
-                        associated_resource.resource_type,
-                        associated_resource.source_id,
-                    )
-                    associated_migration = self.perform_individual_migration(
-                        associated_resource.resource_type,
-                        associated_resource.source_id,
-                        include_dependencies=include_dependencies,
-                        include_members=include_members,
-                    )
+            # The associated resources that may be shared with other
+            # resources are migrated in order, the remaining ones are then
+            # migrated concurrently, along with the work prepared by the
+            # handler.
+            concurrent_types = handler.get_concurrent_associated_resource_types()
+            pending_resources = [
+                resource
+                for resource in associated_resources["pending"]
+                if resource.resource_type not in concurrent_types
+            ]
+            concurrent_resources = [
+                resource
+                for resource in associated_resources["pending"]
+                if resource.resource_type in concurrent_types
+            ]
+            associated_migrations = [
+                self._migrate_associated_resource(
+                    associated_resource,
+                    include_dependencies=include_dependencies,
+                    include_members=include_members,
+                )
+                for associated_resource in pending_resources
+            ]
+
+            handler.prepare_individual_migration(resource_id, transfer_pool)
+
+            if concurrent_resources:
+                associated_migrations += self._migrate_associated_resources(
+                    transfer_pool,
+                    concurrent_resources,
+                    include_dependencies=include_dependencies,
+                    include_members=include_members,
+                )
+                pending_resources += concurrent_resources
+
+            if pending_resources:
+                for associated_resource, associated_migration in zip(
+                    pending_resources, associated_migrations
+                ):
+                    if not associated_migration:
+                        continue
                     # Indirect dependencies will not be included.
                     if associated_resource.should_cleanup:
                         LOG.debug(
@@ -225,12 +588,26 @@ class SunbeamMigrationManager:
                 migrated_associated_resources=associated_resources["migrated"],
             )
             migration.destination_id = destination_id
+            # Recorded before resolving the in-flight migration, the
+            # dependent resources check the migration status.
+            migration.status = constants.STATUS_PENDING_MEMBERS
             migration.save()
         except Exception as ex:
+            try:
+                handler.abort_individual_migration(resource_id)
+            except Exception as abort_ex:
+                LOG.error(
+                    "Unable to clean up the %s %s migration: %r",
+                    resource_type,
+                    resource_id,
+                    abort_ex,
+                )
             migration.status = constants.STATUS_FAILED
             migration.error_message = "Migration failed, error: %r" % ex
             migration.save()
             raise
+        finally:
+            transfer_pool.shutdown(wait=True)
 
         LOG.info(
             "Successfully migrated %s resource, destination id: %s",
@@ -240,16 +617,120 @@ class SunbeamMigrationManager:
 
         return migration, cleanup_associated_migrations
 
+    def _migrate_associated_resources(
+        self,
+        transfer_pool: futures.Executor,
+        associated_resources: typing.Sequence[base.Resource],
+        include_dependencies: bool,
+        include_members: bool,
+    ) -> list[models.Migration | None]:
+        """Migrate the pending associated resources.
+
+        The resources are migrated concurrently, based on the transfer pool
+        size. The pending migrations are cancelled if any of the migrations
+        fails.
+
+        Returns a list containing the migration objects of the resources
+        that were migrated by this call, None otherwise.
+        """
+        associated_futures = [
+            transfer_pool.submit(
+                self._migrate_associated_resource,
+                associated_resource,
+                include_dependencies=include_dependencies,
+                include_members=include_members,
+            )
+            for associated_resource in associated_resources
+        ]
+        _, not_done = futures.wait(
+            associated_futures, return_when=futures.FIRST_EXCEPTION
+        )
+        for future in not_done:
+            future.cancel()
+        futures.wait(associated_futures)
+        for future in associated_futures:
+            if not future.cancelled() and future.exception():
+                raise typing.cast(Exception, future.exception())
+        return [future.result() for future in associated_futures]
+
+    def _migrate_associated_resource(
+        self,
+        associated_resource: base.Resource,
+        include_dependencies: bool,
+        include_members: bool,
+    ) -> models.Migration | None:
+        in_flight_migration = self._get_in_flight_migration(
+            associated_resource.resource_type,
+            associated_resource.source_id,
+        )
+        if in_flight_migration:
+            # Shared dependency, already being migrated as part of
+            # a concurrent migration. It's up to the other migration
+            # to cleanup the resource, if needed.
+            LOG.info(
+                "Associated resource %s %s already in progress, "
+                "waiting for the migration to complete.",
+                associated_resource.resource_type,
+                associated_resource.source_id,
+            )
+            in_flight_migration.result()
+            return None
+
+        # Check if this resource is already being migrated
+        existing = db_api.get_migrations(
+            source_id=associated_resource.source_id,
+            resource_type=associated_resource.resource_type,
+        )
+        if existing:
+            if existing[0].status in constants.LIST_STATUS_MIGRATED:
+                LOG.info(
+                    "Associated resource %s %s already completed"
+                    " (migration %s, status %s), "
+                    "skipping duplicate migration",
+                    associated_resource.resource_type,
+                    associated_resource.source_id,
+                    existing[0].uuid,
+                    existing[0].status,
+                )
+                return None
+            elif existing[0].status == constants.STATUS_IN_PROGRESS:
+                LOG.info(
+                    "Associated resource %s %s already in progress"
+                    " (migration %s), "
+                    "will be available once migration completes",
+                    associated_resource.resource_type,
+                    associated_resource.source_id,
+                    existing[0].uuid,
+                )
+                return None
+
+        LOG.info(
+            "Migrating associated %s resource: %s",
+            associated_resource.resource_type,
+            associated_resource.source_id,
+        )
+        return self.perform_individual_migration(
+            associated_resource.resource_type,
+            associated_resource.source_id,
+            include_dependencies=include_dependencies,
+            include_members=include_members,
+        )
+
     def _migrate_member_resources(
         self,
         handler,
-        resource_id: str,
+        parent_migration: models.Migration,
         cleanup_source: bool,
         include_dependencies: bool,
         include_members: bool,
     ) -> list[base.MigratedResource]:
         """Handle member resource migration logic."""
+        resource_id = str(parent_migration.source_id)
         migrated_member_resources: list[base.MigratedResource] = []
+        pending_member_resources: list[base.Resource] = []
+        # Members that are not being migrated by this process, which may
+        # be migrated in bulk by the parent resource handler.
+        batch_member_resources: list[base.Resource] = []
         member_resources = handler.get_member_resources(resource_id)
         for member_resource in member_resources:
             # Check if this resource is already migrated or being migrated
@@ -270,7 +751,13 @@ class SunbeamMigrationManager:
                         latest.status,
                     )
                     continue
-                elif latest.status == constants.STATUS_IN_PROGRESS:
+                elif latest.status == constants.STATUS_IN_PROGRESS and (
+                    not self._get_in_flight_migration(
+                        member_resource.resource_type, member_resource.source_id
+                    )
+                ):
+                    # Concurrent migrations performed by this process are
+                    # awaited so that the member can be connected to the parent.
                     LOG.info(
                         "Member resource %s %s already in progress (migration %s), "
                         "skipping duplicate migration",
@@ -281,6 +768,32 @@ class SunbeamMigrationManager:
                     continue
                 # If status is FAILED, we'll retry by continuing below
 
+            pending_member_resources.append(member_resource)
+            if not self._get_in_flight_migration(
+                member_resource.resource_type, member_resource.source_id
+            ):
+                batch_member_resources.append(member_resource)
+
+        if batch_member_resources:
+            batch_migrated_resources = self._migrate_member_resources_batch(
+                handler=handler,
+                parent_migration=parent_migration,
+                member_resources=batch_member_resources,
+                cleanup_source=cleanup_source,
+            )
+            migrated_member_resources += batch_migrated_resources
+            batch_migrated_ids = {
+                (resource.resource_type, resource.source_id)
+                for resource in batch_migrated_resources
+            }
+            pending_member_resources = [
+                resource
+                for resource in pending_member_resources
+                if (resource.resource_type, resource.source_id)
+                not in batch_migrated_ids
+            ]
+
+        for member_resource in pending_member_resources:
             LOG.info(
                 "Migrating member %s resource: %s",
                 member_resource.resource_type,
@@ -307,6 +820,97 @@ class SunbeamMigrationManager:
 
         return migrated_member_resources
 
+    def _migrate_member_resources_batch(
+        self,
+        handler,
+        parent_migration: models.Migration,
+        member_resources: list[base.Resource],
+        cleanup_source: bool,
+    ) -> list[base.MigratedResource]:
+        """Migrate member resources in bulk, if supported by the handler.
+
+        The migration records are saved using a single transaction.
+
+        Returns a list of MigratedResource objects describing the members
+        migrated by this call. The remaining members are expected to be
+        migrated individually.
+        """
+        if not parent_migration.destination_id:
+            return []
+
+        parent_resource = self._get_migrated_resource(parent_migration)
+        try:
+            associated_resources = self._get_associated_resources(
+                parent_resource.resource_type, parent_resource.source_id
+            )
+            migrated_ids = handler.perform_member_batch_migration(
+                parent_resource.source_id,
+                parent_resource.destination_id,
+                member_resources,
+                migrated_associated_resources=[
+                    parent_resource,
+                    *associated_resources["migrated"],
+                ],
+            )
+        except Exception as ex:
+            LOG.warning(
+                "Bulk member migration failed for %s %s, migrating the members "
+                "individually: %r",
+                parent_resource.resource_type,
+                parent_resource.source_id,
+                ex,
+            )
+            return []
+
+        migrations = []
+        for member_resource in member_resources:
+            destination_id = migrated_ids.get(member_resource.source_id)
+            if not destination_id:
+                continue
+            member_handler = self._get_migration_handler(member_resource.resource_type)
+            migrations.append(
+                models.Migration(
+                    service=member_handler.get_service_type(),
+                    source_cloud=CONFIG.source_cloud_name,
+                    destination_cloud=CONFIG.destination_cloud_name,
+                    source_id=member_resource.source_id,
+                    destination_id=destination_id,
+                    resource_type=member_resource.resource_type,
+                    status=(
+                        constants.STATUS_PENDING_CLEANUP
+                        if cleanup_source
+                        else constants.STATUS_COMPLETED
+                    ),
+                )
+            )
+        if not migrations:
+            return []
+
+        db_api.create_migrations(migrations)
+        LOG.info(
+            "Migrated %s member resources of %s %s in bulk",
+            len(migrations),
+            parent_resource.resource_type,
+            parent_resource.source_id,
+        )
+
+        if cleanup_source:
+            for migration in migrations:
+                try:
+                    self.cleanup_migration_source(migration)
+                except Exception as ex:
+                    LOG.error(
+                        "Failed to clean up member resource %s %s: %r",
+                        migration.resource_type,
+                        migration.source_id,
+                        ex,
+                    )
+                    continue
+                migration.status = constants.STATUS_COMPLETED
+                migration.save()
+
+        return [self._get_migrated_resource(migration) for migration in migrations]
+
     def _get_associated_resources(
         self,
         resource_type: str,
@@ -343,12 +947,18 @@ class SunbeamMigrationManager:
         cleanup_source: bool = False,
         include_dependencies: bool = False,
         include_members: bool = False,
+        workers: int = 1,
     ):
-        """Migrate multiple resources that match the specified filters."""
+        """Migrate multiple resources that match the specified filters.
+
+        If more than one worker is requested, independent resources are going
+        to be migrated concurrently.
+        """
         handler = self._get_migration_handler(resource_type)
 
         resource_ids = handler.get_source_resource_ids(resource_filters)
 
+        pending_resource_ids = []
         for resource_id in resource_ids:
             migrations = db_api.get_migrations(
                 source_id=resource_id, status=constants.STATUS_COMPLETED
@@ -360,15 +970,99 @@ class SunbeamMigrationManager:
                     migrations[-1].uuid,
                 )
                 continue
+            pending_resource_ids.append(resource_id)
 
-            self.perform_individual_migration(
-                resource_type,
-                resource_id,
-                cleanup_source=cleanup_source,
-                include_dependencies=include_dependencies,
-                include_members=include_members,
-                dry_run=dry_run,
+        if dry_run:
+            for resource_id in pending_resource_ids:
+                self.perform_individual_migration(
+                    resource_type,
+                    resource_id,
+                    cleanup_source=cleanup_source,
+                    include_dependencies=include_dependencies,
+                    include_members=include_members,
+                    dry_run=dry_run,
+                )
+            return
+
+        with handler.batch_migration_context(pending_resource_ids):
+            if workers > 1:
+                # The OpenStack connections are shared by the workers.
+                connection_pool.get_connection_pool().set_http_pool_size(workers)
+                batch_executor = executor.BatchMigrationExecutor(self, workers)
+                batch_executor.run(
+                    resource_type,
+                    pending_resource_ids,
+                    cleanup_source=cleanup_source,
+                    include_dependencies=include_dependencies,
+                    include_members=include_members,
+                )
+            elif handler.supports_bulk_migration():
+                self.perform_bulk_migration(
+                    resource_type,
+                    pending_resource_ids,
+                    cleanup_source=cleanup_source,
+                    include_dependencies=include_dependencies,
+                    include_members=include_members,
+                )
+            else:
+                for resource_id in pending_resource_ids:
+                    self.perform_individual_migration(
+                        resource_type,
+                        resource_id,
+                        cleanup_source=cleanup_source,
+                        include_dependencies=include_dependencies,
+                        include_members=include_members,
+                    )
+
+    def sync_migration_data(
+        self, migration: models.Migration, cleanup_source: bool = False
+    ):
+        """Copy the data that changed since the resource was migrated."""
+        if migration.source_removed:
+            raise exception.InvalidInput(
+                f"The source {migration.resource_type} was removed: "
+                f"{migration.source_id}"
             )
+        migrated_resource = self._get_migrated_resource(migration)
+        handler = self._get_migration_handler(migrated_resource.resource_type)
+
+        LOG.info(
+            "Synchronizing %s data: %s -> %s",
+            migrated_resource.resource_type,
+            migrated_resource.source_id,
+            migrated_resource.destination_id,
+        )
+        handler.sync_resource_data(
+            migrated_resource.source_id, migrated_resource.destination_id
+        )
+        LOG.info(
+            "Successfully synchronized %s data: %s",
+            migrated_resource.resource_type,
+            migrated_resource.source_id,
+        )
+
+        if cleanup_source:
+            self.cleanup_migration_source(migration)
+
+    def verify_migration_data(self, migration: models.Migration):
+        """Verify the data of a migrated resource."""
+        migrated_resource = self._get_migrated_resource(migration)
+        handler = self._get_migration_handler(migrated_resource.resource_type)
+
+        LOG.info(
+            "Verifying %s data: %s -> %s",
+            migrated_resource.resource_type,
+            migrated_resource.source_id,
+            migrated_resource.destination_id,
+        )
+        handler.verify_resource_data(
+            migrated_resource.source_id, migrated_resource.destination_id
+        )
+        LOG.info(
+            "Successfully verified %s data: %s",
+            migrated_resource.resource_type,
+            migrated_resource.source_id,
+        )
 
     def cleanup_migration_source(self, migration: models.Migration):
         """Cleanup the migration source."""
@@ -0,0 +1,46 @@
+# SPDX-FileCopyrightText: 2025 - Canonical Ltd
+# SPDX-License-Identifier: Apache-2.0
+
+from unittest import mock
+
+from sunbeam_migrate.utils import cache
+
+
+def test_object_cache():
+    object_cache = cache.ObjectCache(ttl=300)
+    fetch = mock.Mock()
+
+    for idx in range(3):
+        assert object_cache.get("port", "fake-id", fetch) is fetch.return_value
+    fetch.assert_called_once_with()
+
+    # Other resource types are cached separately.
+    object_cache.get("network", "fake-id", fetch)
+    assert fetch.call_count == 2
+
+    object_cache.invalidate("port", "fake-id")
+    object_cache.get("port", "fake-id", fetch)
+    assert fetch.call_count == 3
+
+    object_cache.invalidate(None, "fake-id")
+    object_cache.get("port", "fake-id", fetch)
+    object_cache.get("network", "fake-id", fetch)
+    assert fetch.call_count == 5
+
+
+def test_object_cache_disabled():
+    object_cache = cache.ObjectCache(ttl=0)
+    fetch = mock.Mock()
+
+    object_cache.get("port", "fake-id", fetch)
+    object_cache.get("port", "fake-id", fetch)
+    assert fetch.call_count == 2
+
+
+def test_object_cache_missing_object():
+    object_cache = cache.ObjectCache(ttl=300)
+    fetch = mock.Mock(return_value=None)
+
+    assert object_cache.get("port", "fake-id", fetch) is None
+    assert object_cache.get("port", "fake-id", fetch) is None
+    assert fetch.call_count == 2
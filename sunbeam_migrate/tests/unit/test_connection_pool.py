@@ -0,0 +1,101 @@
+# SPDX-FileCopyrightText: 2025 - Canonical Ltd
+# SPDX-License-Identifier: Apache-2.0
+
+import threading
+import time
+from unittest import mock
+
+from sunbeam_migrate.utils import connection_pool
+
+
+@mock.patch.object(connection_pool, "CONF")
+@mock.patch("openstack.connect")
+def test_owner_scoped_connection(mock_connect, mock_conf):
+    mock_conn = mock_connect.return_value
+    # The first role was already assigned, the second one is granted by us.
+    mock_conn.grant_role.side_effect = [False, True]
+
+    pool = connection_pool.ConnectionPool()
+    for idx in range(3):
+        assert pool.get_connection("fake-cloud") is mock_conn
+        scoped_conn = pool.get_owner_scoped_connection(
+            "fake-cloud", ["fake-role"], "fake-project"
+        )
+        assert scoped_conn is mock_conn.connect_as_project.return_value
+        pool.get_owner_scoped_connection(
+            "fake-cloud", ["fake-other-role"], "fake-project"
+        )
+
+    mock_connect.assert_called_once()
+    assert mock_conn.grant_role.call_count == 2
+    mock_conn.identity.get_project.assert_called_with("fake-project")
+    assert mock_conn.connect_as_project.call_count == 2
+
+    pool.revoke_role_grants()
+    mock_conn.revoke_role.assert_called_once_with(
+        "fake-other-role",
+        user=mock_conn.current_user_id,
+        project="fake-project",
+    )
+
+
+@mock.patch.object(connection_pool, "CONF")
+@mock.patch("openstack.connect")
+def test_shared_connection(mock_connect, mock_conf):
+    mock_connect.side_effect = lambda cloud, **kwargs: mock.Mock(cloud=cloud)
+
+    pool = connection_pool.ConnectionPool()
+    source_conn = pool.get_connection("fake-source")
+    destination_conn = pool.get_connection("fake-destination")
+
+    # The connections are created once per cloud.
+    assert pool.get_connection("fake-source") is source_conn
+    assert pool.get_connection("fake-destination") is destination_conn
+    assert source_conn is not destination_conn
+    assert mock_connect.call_count == 2
+
+    pool.clear()
+    source_conn.close.assert_called_once_with()
+    destination_conn.close.assert_called_once_with()
+    assert pool.get_connection("fake-source") is not source_conn
+
+
+@mock.patch.object(connection_pool.ks_session, "TCPKeepAliveAdapter")
+@mock.patch.object(connection_pool, "CONF")
+@mock.patch("openstack.connect")
+def test_set_http_pool_size(mock_connect, mock_conf, mock_adapter):
+    pool = connection_pool.ConnectionPool()
+    mock_conn = pool.get_connection("fake-cloud")
+    mock_adapter.reset_mock()
+
+    pool.set_http_pool_size(32)
+
+    mock_adapter.assert_called_with(pool_connections=32, pool_maxsize=32)
+    mock_conn.session.mount.assert_any_call("https://", mock_adapter.return_value)
+    mock_conn.session.mount.assert_any_call("http://", mock_adapter.return_value)
+
+
+@mock.patch.object(connection_pool, "_CONNECTION_POOL", None)
+def test_get_connection_pool_concurrent():
+    original_init = connection_pool.ConnectionPool.__init__
+
+    def _slow_init(self):
+        # Give other threads a chance to create the pool as well.
+        time.sleep(0.01)
+        original_init(self)
+
+    pools = []
+    with mock.patch.object(connection_pool.ConnectionPool, "__init__", _slow_init):
+        threads = [
+            threading.Thread(
+                target=lambda: pools.append(connection_pool.get_connection_pool())
+            )
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert len(pools) == 8
+    assert all(pool is pools[0] for pool in pools)
@@ -0,0 +1,200 @@
+# SPDX-FileCopyrightText: 2025 - Canonical Ltd
+# SPDX-License-Identifier: Apache-2.0
+
+import collections
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from sunbeam_migrate import constants, exception, manager
+from sunbeam_migrate.handlers.base import Resource
+
+_DEPENDENCIES = {
+    "fake-instance-0": [
+        Resource(resource_type="port", source_id="fake-port-0", should_cleanup=True),
+        Resource(resource_type="network", source_id="fake-network"),
+    ],
+    "fake-instance-1": [
+        Resource(resource_type="port", source_id="fake-port-1", should_cleanup=True),
+        Resource(resource_type="network", source_id="fake-network"),
+    ],
+    "fake-port-0": [Resource(resource_type="network", source_id="fake-network")],
+    "fake-port-1": [Resource(resource_type="network", source_id="fake-network")],
+}
+
+
+@mock.patch("sunbeam_migrate.handlers.factory.get_migration_handler")
+@mock.patch("sunbeam_migrate.db.api.create_migrations")
+@mock.patch("sunbeam_migrate.db.api.get_migrations")
+@mock.patch("sunbeam_migrate.db.models.Migration.save")
+def _test_batch_migration(
+    mock_migration_cls_save,
+    mock_get_migrations,
+    mock_create_migrations,
+    mock_get_migration_handler,
+    failed_resources=(),
+    cleanup_source=False,
+    bulk_migration=False,
+    dependencies=_DEPENDENCIES,
+):
+    mock_handler = mock_get_migration_handler.return_value
+    mock_handler.get_service_type.return_value = "fake-service-type"
+    mock_handler.get_associated_resource_concurrency.return_value = 1
+    mock_handler.perform_member_batch_migration.return_value = {}
+    mock_handler.supports_bulk_migration.return_value = bulk_migration
+    mock_handler.get_source_resource_ids.return_value = [
+        "fake-instance-0",
+        "fake-instance-1",
+    ]
+
+    lock = threading.Lock()
+    migrated_resources = set()
+    migration_calls = collections.Counter()
+    migration_order = []
+
+    def _fake_get_migrations(
+        order_by="created_at",
+        ascending=False,
+        session=None,
+        include_archived=False,
+        source_id=None,
+        resource_type=None,
+        status=None,
+    ):
+        with lock:
+            if source_id in migrated_resources:
+                return [
+                    mock.Mock(
+                        status=constants.STATUS_COMPLETED,
+                        resource_type=resource_type,
+                        source_id=source_id,
+                        destination_id="dest-%s" % source_id,
+                    )
+                ]
+        return []
+
+    def _fake_migrate_resource(resource_id, migrated_associated_resources):
+        with lock:
+            migration_calls[resource_id] += 1
+        # Give other workers a chance to request the same resources.
+        time.sleep(0.01)
+        if resource_id in failed_resources:
+            raise exception.SunbeamMigrateException("fake failure")
+        for dependency in dependencies.get(resource_id, []):
+            assert dependency.source_id in migrated_resources
+        with lock:
+            migrated_resources.add(resource_id)
+            migration_order.append(resource_id)
+        return "dest-%s" % resource_id
+
+    def _fake_bulk_migrate_resources(resource_ids, migrated_associated_resources):
+        return [
+            _fake_migrate_resource(resource_id, migrated_associated_resources)
+            for resource_id in resource_ids
+        ]
+
+    mock_get_migrations.side_effect = _fake_get_migrations
+    mock_handler.perform_individual_migration.side_effect = _fake_migrate_resource
+    mock_handler.perform_bulk_migration.side_effect = _fake_bulk_migrate_resources
+    mock_handler.get_associated_resources.side_effect = lambda resource_id: list(
+        dependencies.get(resource_id, [])
+    )
+    mock_handler.get_member_resources.return_value = []
+
+    mgr = manager.SunbeamMigrationManager()
+    mgr.perform_batch_migration(
+        resource_type="instance",
+        resource_filters={},
+        dry_run=False,
+        cleanup_source=cleanup_source,
+        include_dependencies=True,
+        workers=4,
+    )
+    return mock_handler, migration_calls, migration_order
+
+
+def test_batch_migration_shared_dependencies():
+    mock_handler, migration_calls, migration_order = _test_batch_migration()
+
+    # The shared network must be migrated only once, before its dependants.
+    assert migration_calls == {
+        "fake-network": 1,
+        "fake-port-0": 1,
+        "fake-port-1": 1,
+        "fake-instance-0": 1,
+        "fake-instance-1": 1,
+    }
+    assert migration_order[0] == "fake-network"
+    for idx in range(2):
+        assert migration_order.index(f"fake-port-{idx}") < migration_order.index(
+            f"fake-instance-{idx}"
+        )
+    mock_handler.delete_source_resource.assert_not_called()
+
+
+def test_batch_migration_bulk():
+    mock_handler, migration_calls, _ = _test_batch_migration(bulk_migration=True)
+
+    # The resources of the same type that are ready at the same time are
+    # migrated using bulk requests.
+    assert migration_calls == {
+        "fake-network": 1,
+        "fake-port-0": 1,
+        "fake-port-1": 1,
+        "fake-instance-0": 1,
+        "fake-instance-1": 1,
+    }
+    mock_handler.perform_individual_migration.assert_called_once_with(
+        "fake-network", migrated_associated_resources=[]
+    )
+    bulk_resource_ids = [
+        call.args[0] for call in mock_handler.perform_bulk_migration.mock_calls
+    ]
+    assert sorted(map(sorted, bulk_resource_ids)) == [
+        ["fake-instance-0", "fake-instance-1"],
+        ["fake-port-0", "fake-port-1"],
+    ]
+
+
+@pytest.mark.parametrize("bulk_migration", [False, True])
+def test_batch_migration_cleanup(bulk_migration):
+    mock_handler, _, _ = _test_batch_migration(
+        cleanup_source=True, bulk_migration=bulk_migration
+    )
+
+    deleted = {call.args[0] for call in mock_handler.delete_source_resource.mock_calls}
+    # Shared resources should not be cleaned up.
+    assert deleted == {
+        "fake-instance-0",
+        "fake-instance-1",
+        "fake-port-0",
+        "fake-port-1",
+    }
+
+
+def test_batch_migration_failed_dependency():
+    with pytest.raises(exception.SunbeamMigrateException) as ex:
+        _test_batch_migration(failed_resources=["fake-port-0"])
+    assert "fake-instance-0" in str(ex.value)
+    assert "fake-instance-1" not in str(ex.value)
+
+
+@pytest.mark.parametrize("bulk_migration", [False, True])
+def test_batch_migration_cleanup_shared_dependency(bulk_migration):
+    shared_port = Resource(
+        resource_type="port", source_id="fake-port-0", should_cleanup=True
+    )
+    mock_handler, _, _ = _test_batch_migration(
+        cleanup_source=True,
+        bulk_migration=bulk_migration,
+        dependencies={
+            "fake-instance-0": [shared_port],
+            "fake-instance-1": [shared_port],
+        },
+    )
+
+    deleted = [call.args[0] for call in mock_handler.delete_source_resource.mock_calls]
+    # The dependency shared by both instances is cleaned up only once.
+    assert sorted(deleted) == ["fake-instance-0", "fake-instance-1", "fake-port-0"]
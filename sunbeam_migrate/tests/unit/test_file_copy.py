@@ -0,0 +1,262 @@
+# SPDX-FileCopyrightText: 2025 - Canonical Ltd
+# SPDX-License-Identifier: Apache-2.0
+
+import errno
+import hashlib
+import os
+import shutil
+from unittest import mock
+
+import pytest
+
+from sunbeam_migrate import exception
+from sunbeam_migrate.utils import file_copy
+
+
+def _populate_source_dir(source_dir):
+    for dir_idx in range(3):
+        subdir = source_dir / f"dir-{dir_idx}" / "nested"
+        subdir.mkdir(parents=True)
+        for file_idx in range(5):
+            (subdir / f"file-{file_idx}").write_bytes(os.urandom(1000 * file_idx))
+
+    (source_dir / "file").write_bytes(b"fake-data")
+    os.link(source_dir / "file", source_dir / "dir-0" / "hardlink")
+    os.symlink("dir-0/nested/file-1", source_dir / "symlink")
+    os.mkfifo(source_dir / "fifo")
+    try:
+        os.setxattr(source_dir / "file", "user.fake-attr", b"fake-value")
+    except OSError as exc:
+        if exc.errno != errno.EOPNOTSUPP:
+            raise
+
+    os.chmod(source_dir / "file", 0o640)
+    os.utime(source_dir / "file", ns=(1000, 2000))
+    os.utime(source_dir / "symlink", ns=(3000, 4000), follow_symlinks=False)
+    os.utime(source_dir / "dir-0", ns=(5000, 6000))
+
+
+def _get_tree(root):
+    tree = {}
+    for dirpath, dirnames, filenames in os.walk(root):
+        for name in dirnames + filenames:
+            path = os.path.join(dirpath, name)
+            path_stat = os.stat(path, follow_symlinks=False)
+            tree[os.path.relpath(path, root)] = (
+                path_stat.st_mode,
+                path_stat.st_uid,
+                path_stat.st_gid,
+                path_stat.st_mtime_ns,
+                path_stat.st_size,
+            )
+    return tree
+
+
+def test_copy_tree(tmp_path):
+    source_dir = tmp_path / "source"
+    destination_dir = tmp_path / "destination"
+    source_dir.mkdir()
+    destination_dir.mkdir()
+    _populate_source_dir(source_dir)
+
+    copier = file_copy.ParallelTreeCopier(
+        str(source_dir), str(destination_dir), workers=4, scanners=2
+    )
+    stats = copier.copy()
+
+    assert _get_tree(destination_dir) == _get_tree(source_dir)
+    assert stats.files == 19
+    assert stats.bytes == 3 * 10000 + len(b"fake-data")
+    assert not stats.errors
+    assert (destination_dir / "file").read_bytes() == b"fake-data"
+    assert os.path.samefile(
+        destination_dir / "file", destination_dir / "dir-0" / "hardlink"
+    )
+    assert os.readlink(destination_dir / "symlink") == "dir-0/nested/file-1"
+    assert os.listxattr(destination_dir / "file") == os.listxattr(source_dir / "file")
+
+
+def test_copy_tree_errors(tmp_path):
+    source_dir = tmp_path / "source"
+    destination_dir = tmp_path / "destination"
+    source_dir.mkdir()
+    destination_dir.mkdir()
+    _populate_source_dir(source_dir)
+
+    copy_file_data = file_copy.copy_file_data
+
+    def _fake_copy_file_data(source_fd, destination_fd, buffer_size):
+        if os.fstat(source_fd).st_size == 1000:
+            raise OSError(errno.EIO, "fake-error")
+        return copy_file_data(source_fd, destination_fd, buffer_size)
+
+    copier = file_copy.ParallelTreeCopier(str(source_dir), str(destination_dir))
+    with mock.patch.object(
+        file_copy, "copy_file_data", side_effect=_fake_copy_file_data
+    ):
+        with pytest.raises(exception.SunbeamMigrateException):
+            copier.copy()
+
+    # The remaining files are still copied.
+    assert copier.stats.errors == 3
+    assert copier.stats.files == 16
+
+
+@pytest.mark.parametrize(
+    "unsupported", [["_copy_file_range"], ["_copy_file_range", "_sendfile"]]
+)
+def test_copy_file_data_fallback(tmp_path, unsupported):
+    data = os.urandom(3 * 1024 * 1024)
+    (tmp_path / "source").write_bytes(data)
+
+    patchers = [
+        mock.patch.object(
+            file_copy,
+            func_name,
+            autospec=True,
+            side_effect=OSError(errno.EXDEV, "fake-error"),
+        )
+        for func_name in unsupported
+    ]
+    for patcher in patchers:
+        patcher.start()
+    try:
+        with (
+            open(tmp_path / "source", "rb") as source_file,
+            open(tmp_path / "destination", "wb") as destination_file,
+        ):
+            copied = file_copy.copy_file_data(
+                source_file.fileno(), destination_file.fileno(), 1024 * 1024
+            )
+    finally:
+        for patcher in patchers:
+            patcher.stop()
+
+    assert copied == len(data)
+    assert (tmp_path / "destination").read_bytes() == data
+
+
+def test_copy_tree_incremental(tmp_path):
+    source_dir = tmp_path / "source"
+    destination_dir = tmp_path / "destination"
+    manifest_path = str(tmp_path / "manifest.sqlite")
+    source_dir.mkdir()
+    destination_dir.mkdir()
+    _populate_source_dir(source_dir)
+
+    stats = file_copy.ParallelTreeCopier(
+        str(source_dir), str(destination_dir), manifest_path=manifest_path
+    ).copy()
+    assert stats.files == 19
+    assert not stats.skipped
+
+    # Update the source while it's still in use.
+    (source_dir / "dir-0" / "nested" / "file-1").write_bytes(b"updated-data")
+    (source_dir / "dir-1" / "nested" / "new-file").write_bytes(b"new-data")
+    os.unlink(source_dir / "dir-2" / "nested" / "file-2")
+    shutil.rmtree(source_dir / "dir-1" / "nested")
+    (source_dir / "dir-1" / "nested").write_bytes(b"replaced-dir")
+
+    stats = file_copy.ParallelTreeCopier(
+        str(source_dir), str(destination_dir), manifest_path=manifest_path
+    ).copy()
+
+    assert _get_tree(destination_dir) == _get_tree(source_dir)
+    assert (destination_dir / "dir-0" / "nested" / "file-1").read_bytes() == (
+        b"updated-data"
+    )
+    assert (destination_dir / "dir-1" / "nested").read_bytes() == b"replaced-dir"
+    # The hardlinked file is relinked, the other unchanged files are skipped.
+    assert stats.files == 3
+    assert stats.skipped == 11
+    # The removed directory contents and the removed file.
+    assert stats.removed == 6
+    assert not os.path.exists(manifest_path + ".tmp")
+
+
+def test_copy_tree_incremental_scan_error(tmp_path):
+    source_dir = tmp_path / "source"
+    destination_dir = tmp_path / "destination"
+    manifest_path = str(tmp_path / "manifest.sqlite")
+    source_dir.mkdir()
+    destination_dir.mkdir()
+    _populate_source_dir(source_dir)
+
+    file_copy.ParallelTreeCopier(
+        str(source_dir), str(destination_dir), manifest_path=manifest_path
+    ).copy()
+    with open(manifest_path, "rb") as manifest_file:
+        manifest_data = manifest_file.read()
+    os.unlink(source_dir / "dir-2" / "nested" / "file-2")
+
+    scandir = os.scandir
+
+    def _fake_scandir(path):
+        if path.endswith(os.path.join("dir-1", "nested")):
+            raise OSError(errno.EIO, "fake-error")
+        return scandir(path)
+
+    copier = file_copy.ParallelTreeCopier(
+        str(source_dir), str(destination_dir), manifest_path=manifest_path
+    )
+    with mock.patch.object(file_copy.os, "scandir", side_effect=_fake_scandir):
+        with pytest.raises(exception.SunbeamMigrateException):
+            copier.copy()
+
+    # The files of the directory that couldn't be scanned are preserved,
+    # nothing is removed and the previous manifest is kept.
+    assert copier.stats.errors == 1
+    assert not copier.stats.removed
+    assert len(os.listdir(destination_dir / "dir-1" / "nested")) == 5
+    assert (destination_dir / "dir-2" / "nested" / "file-2").exists()
+    with open(manifest_path, "rb") as manifest_file:
+        assert manifest_file.read() == manifest_data
+    assert not os.path.exists(manifest_path + ".tmp")
+
+    # The next pass removes the deleted file.
+    stats = file_copy.ParallelTreeCopier(
+        str(source_dir), str(destination_dir), manifest_path=manifest_path
+    ).copy()
+    assert stats.removed == 1
+    assert _get_tree(destination_dir) == _get_tree(source_dir)
+
+
+def test_copy_tree_verify(tmp_path):
+    source_dir = tmp_path / "source"
+    destination_dir = tmp_path / "destination"
+    manifest_path = str(tmp_path / "manifest.sqlite")
+    source_dir.mkdir()
+    destination_dir.mkdir()
+    _populate_source_dir(source_dir)
+
+    for _ in range(2):
+        # The checksums of the unchanged files are preserved by subsequent
+        # incremental copies.
+        file_copy.ParallelTreeCopier(
+            str(source_dir),
+            str(destination_dir),
+            manifest_path=manifest_path,
+            checksums=True,
+        ).copy()
+
+    checksums = {
+        rel_path: checksum
+        for rel_path, _, _, checksum in file_copy.get_manifest_entries(manifest_path)
+    }
+    assert checksums["file"] == hashlib.sha256(b"fake-data").hexdigest()
+    assert checksums["dir-0/hardlink"] == checksums["file"]
+    assert checksums["dir-0"] is None
+
+    stats = file_copy.ParallelTreeVerifier(
+        str(destination_dir), manifest_path, workers=4
+    ).verify()
+    assert stats.files == len(checksums)
+    assert not stats.errors
+
+    # Same size, different contents.
+    (destination_dir / "dir-1" / "nested" / "file-1").write_bytes(b"\0" * 1000)
+    os.unlink(destination_dir / "symlink")
+    verifier = file_copy.ParallelTreeVerifier(str(destination_dir), manifest_path)
+    with pytest.raises(exception.Invalid):
+        verifier.verify()
+    assert verifier.stats.errors == 2
@@ -0,0 +1,152 @@
+# SPDX-FileCopyrightText: 2025 - Canonical Ltd
+# SPDX-License-Identifier: Apache-2.0
+
+import io
+import random
+import struct
+from unittest import mock
+
+import pytest
+
+from sunbeam_migrate.handlers.glance import image as image_handler
+from sunbeam_migrate.utils import image_conversion
+
+_CLUSTER_SIZE = image_conversion.QCOW2_CLUSTER_SIZE
+_OFFSET_MASK = (1 << 62) - 1
+
+
+def _read_qcow2(path) -> tuple[bytes, set[int]]:
+    """Minimal qcow2 reader, used to validate the converted images."""
+    data = path.read_bytes()
+    (
+        magic,
+        version,
+        _,
+        _,
+        cluster_bits,
+        virtual_size,
+        _,
+        l1_size,
+        l1_offset,
+        refcount_table_offset,
+        _,
+        _,
+        _,
+    ) = struct.unpack_from(">4sIQIIQIIQQIIQ", data)
+    assert magic == image_conversion.QCOW2_MAGIC
+    assert version == 2
+    assert cluster_bits == image_conversion.QCOW2_CLUSTER_BITS
+
+    l2_entries = _CLUSTER_SIZE // 8
+    output = bytearray(virtual_size)
+    allocated_clusters = set()
+    for l1_idx in range(l1_size):
+        (l2_offset,) = struct.unpack_from(">Q", data, l1_offset + l1_idx * 8)
+        l2_offset &= _OFFSET_MASK
+        if not l2_offset:
+            continue
+        allocated_clusters.add(l2_offset // _CLUSTER_SIZE)
+        for l2_idx in range(l2_entries):
+            (cluster_offset,) = struct.unpack_from(">Q", data, l2_offset + l2_idx * 8)
+            cluster_offset &= _OFFSET_MASK
+            if not cluster_offset:
+                continue
+            allocated_clusters.add(cluster_offset // _CLUSTER_SIZE)
+            guest_offset = (l1_idx * l2_entries + l2_idx) * _CLUSTER_SIZE
+            length = min(_CLUSTER_SIZE, virtual_size - guest_offset)
+            output[guest_offset : guest_offset + length] = data[
+                cluster_offset : cluster_offset + length
+            ]
+
+    # Every cluster of the file must have a refcount of 1.
+    (refcount_block_offset,) = struct.unpack_from(">Q", data, refcount_table_offset)
+    file_clusters = len(data) // _CLUSTER_SIZE
+    assert len(data) % _CLUSTER_SIZE == 0
+    for cluster in range(file_clusters):
+        (refcount,) = struct.unpack_from(
+            ">H", data, refcount_block_offset + cluster * 2
+        )
+        assert refcount == 1
+    return bytes(output), allocated_clusters
+
+
+def test_python_qcow2_converter(tmp_path):
+    raw_path = tmp_path / "image.raw"
+    qcow2_path = tmp_path / "image.qcow2"
+
+    # Mostly empty image with an unaligned size.
+    raw_data = bytearray(50 * _CLUSTER_SIZE + 123)
+    raw_data[100:200] = random.randbytes(100)
+    raw_data[20 * _CLUSTER_SIZE : 22 * _CLUSTER_SIZE] = random.randbytes(
+        2 * _CLUSTER_SIZE
+    )
+    raw_data[-10:] = random.randbytes(10)
+    with raw_path.open("wb") as raw_file:
+        image_conversion.write_sparse(raw_file, raw_data)
+        raw_file.truncate(len(raw_data))
+
+    assert raw_path.read_bytes() == raw_data
+
+    image_conversion.PythonQcow2Converter().convert(raw_path, qcow2_path)
+
+    converted_data, allocated_clusters = _read_qcow2(qcow2_path)
+    assert converted_data == raw_data
+    # 4 data clusters and one L2 table.
+    assert len(allocated_clusters) == 5
+    assert qcow2_path.stat().st_size < len(raw_data)
+
+
+def test_write_sparse():
+    file_obj = io.BytesIO()
+    data = bytes(image_conversion.ZERO_BLOCK_SIZE) + b"fake-data"
+    image_conversion.write_sparse(file_obj, data)
+
+    assert file_obj.getvalue() == data
+
+
+@pytest.mark.parametrize("convert", [False, True])
+@mock.patch.object(
+    image_handler.ImageHandler, "_source_session", new_callable=mock.PropertyMock
+)
+@mock.patch.object(
+    image_handler.ImageHandler,
+    "_get_identity_build_kwargs",
+    mock.Mock(return_value={}),
+)
+@mock.patch.object(
+    image_handler.ImageHandler, "_destination_session", new_callable=mock.PropertyMock
+)
+@mock.patch.object(image_handler.ImageHandler, "_spooled_image_transfer")
+@mock.patch.object(image_handler.ImageHandler, "_get_source")
+@mock.patch.object(image_handler.image_transfer, "ImageSpool")
+@mock.patch.object(image_handler, "CONF")
+def test_sparse_image_transfer(
+    mock_conf,
+    mock_spool_cls,
+    mock_get_source,
+    mock_spooled_transfer,
+    mock_destination_session,
+    mock_source_session,
+    convert,
+):
+    mock_conf.sparse_image_transfer = True
+    mock_conf.sparse_image_transfer_qcow2 = convert
+    mock_get_source.return_value = mock.Mock(
+        disk_format="raw", container_format="bare", checksum="fake-checksum"
+    )
+    mock_spooled_transfer.return_value = (mock.Mock(id="fake-dest-image"), None)
+    destination_session = mock_destination_session.return_value
+    destination_session.get_image.return_value = mock.Mock(
+        id="fake-dest-image", checksum="fake-checksum"
+    )
+
+    handler = image_handler.ImageHandler()
+    handler.perform_individual_migration("fake-image", [])
+
+    # The spool is always sparse, however the raw disk format is preserved
+    # unless the qcow2 conversion is explicitly enabled.
+    assert mock_spool_cls.call_args.kwargs["sparse"]
+    mock_spooled_transfer.assert_called_once_with(
+        mock_spool_cls.return_value, mock.ANY, convert=convert
+    )
+    assert mock_spooled_transfer.call_args.args[1]["disk_format"] == "raw"
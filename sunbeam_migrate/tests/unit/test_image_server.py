@@ -0,0 +1,142 @@
+# SPDX-FileCopyrightText: 2025 - Canonical Ltd
+# SPDX-License-Identifier: Apache-2.0
+
+import random
+import urllib.error
+import urllib.request
+from unittest import mock
+
+import pytest
+
+from sunbeam_migrate import exception
+from sunbeam_migrate.handlers.glance import image as image_handler
+from sunbeam_migrate.utils import image_server
+
+_IMAGE_DATA = random.randbytes(1000)
+
+
+def _get_data():
+    for offset in range(0, len(_IMAGE_DATA), 64):
+        yield memoryview(_IMAGE_DATA)[offset : offset + 64]
+
+
+def test_image_server():
+    with image_server.ImageServer(
+        _get_data, size=len(_IMAGE_DATA), bind_address="127.0.0.1"
+    ) as server:
+        assert server.url.startswith("http://")
+        local_url = server.url.replace(
+            server.url.split("/")[2], f"127.0.0.1:{server._server.server_port}"
+        )
+        with urllib.request.urlopen(local_url) as response:
+            assert response.read() == _IMAGE_DATA
+
+        # The image may only be fetched once.
+        with pytest.raises(urllib.error.HTTPError) as ex:
+            urllib.request.urlopen(local_url)
+        assert ex.value.code == 404
+
+        with pytest.raises(urllib.error.HTTPError) as ex:
+            urllib.request.urlopen(local_url.rsplit("/", 1)[0] + "/fake-token")
+        assert ex.value.code == 404
+
+
+def test_image_server_expired():
+    with image_server.ImageServer(
+        _get_data,
+        bind_address="127.0.0.1",
+        public_url="http://127.0.0.1:{port}",
+        expiry=0,
+    ) as server:
+        url = server.url.format(port=server._server.server_port)
+        with pytest.raises(urllib.error.HTTPError) as ex:
+            urllib.request.urlopen(url)
+        assert ex.value.code == 404
+
+
+@mock.patch.object(image_handler.ImageHandler, "_wait_for_status")
+@mock.patch.object(
+    image_handler.ImageHandler, "_chunked_image_reader", return_value=_get_data()
+)
+@mock.patch.object(
+    image_handler.ImageHandler, "_destination_session", new_callable=mock.PropertyMock
+)
+@mock.patch.object(image_handler, "CONF")
+def test_web_download_image_transfer(
+    mock_conf, mock_destination_session, mock_chunked_image_reader, mock_wait
+):
+    mock_conf.image_transfer_streams = 1
+    mock_conf.image_web_download_bind_address = "127.0.0.1"
+    mock_conf.image_web_download_port = 0
+    mock_conf.image_web_download_url = None
+    mock_conf.image_import_timeout = 60
+
+    imported_data = []
+    fake_destination_image = mock.Mock(id="fake-destination-image")
+
+    def _fake_create_image(use_import, import_method, uri, **kwargs):
+        # Simulate the Glance "web-download" import.
+        assert import_method == "web-download"
+        port = uri.split("/")[2].split(":")[1]
+        local_uri = f"http://127.0.0.1:{port}/" + uri.split("/", 3)[3]
+        with urllib.request.urlopen(local_uri) as response:
+            imported_data.append(response.read())
+        return fake_destination_image
+
+    destination_session = mock_destination_session.return_value
+    destination_session.create_image.side_effect = _fake_create_image
+
+    source_image = mock.Mock(id="fake-image", size=len(_IMAGE_DATA))
+    handler = image_handler.ImageHandler()
+    destination_image = handler._web_download_image_transfer(
+        source_image, {"name": "fake-name"}
+    )
+
+    assert destination_image == fake_destination_image
+    assert imported_data == [_IMAGE_DATA]
+    mock_wait.assert_called_once_with(
+        destination_session,
+        "image",
+        "fake-destination-image",
+        status="active",
+        failures=["killed", "deleted"],
+        wait=60,
+        size=len(_IMAGE_DATA),
+        operation="web-download-import",
+    )
+
+
+@mock.patch.object(
+    image_handler.ImageHandler, "_destination_session", new_callable=mock.PropertyMock
+)
+@mock.patch.object(image_handler, "CONF")
+def test_web_download_missing_port(mock_conf, mock_destination_session):
+    mock_conf.image_web_download_port = None
+
+    handler = image_handler.ImageHandler()
+    with pytest.raises(exception.InvalidInput):
+        handler._web_download_image_transfer(
+            mock.Mock(id="fake-image"), {"name": "fake-name"}
+        )
+
+    mock_destination_session.return_value.create_image.assert_not_called()
+
+
+@mock.patch.object(image_handler.net_utils, "get_local_ip_for_remote")
+@mock.patch.object(image_handler.net_utils.socket, "gethostbyname")
+@mock.patch.object(
+    image_handler.ImageHandler, "_destination_session", new_callable=mock.PropertyMock
+)
+def test_web_download_bind_address(
+    mock_destination_session, mock_gethostbyname, mock_get_local_ip
+):
+    destination_session = mock_destination_session.return_value
+    destination_session.image.get_endpoint.return_value = (
+        "https://glance.example.com:9292/v2"
+    )
+    mock_get_local_ip.return_value = "10.0.0.5"
+
+    handler = image_handler.ImageHandler()
+    assert handler._get_web_download_bind_address() == "10.0.0.5"
+    mock_gethostbyname.assert_called_once_with("glance.example.com")
+    mock_get_local_ip.assert_called_once_with(mock_gethostbyname.return_value)
@@ -0,0 +1,193 @@
+# SPDX-FileCopyrightText: 2025 - Canonical Ltd
+# SPDX-License-Identifier: Apache-2.0
+
+import hashlib
+import io
+import random
+import re
+import time
+from unittest import mock
+
+import pytest
+
+from sunbeam_migrate import exception
+from sunbeam_migrate.utils import image_transfer
+
+_IMAGE_DATA = random.randbytes(1000)
+
+
+def _get_fake_image(data=_IMAGE_DATA):
+    return mock.Mock(
+        id="fake-image",
+        base_path="/images",
+        size=len(data),
+        checksum=hashlib.md5(data, usedforsecurity=False).hexdigest(),
+        hash_algo="sha512",
+        hash_value=hashlib.sha512(data).hexdigest(),
+    )
+
+
+def _get_fake_session(data=_IMAGE_DATA):
+    session = mock.Mock()
+
+    def _fake_get(url, headers):
+        assert url == "images/fake-image/file"
+        start, end = re.match(r"bytes=(\d+)-(\d+)", headers["Range"]).groups()
+        # Return the chunks out of order.
+        time.sleep(random.random() / 100)
+        return mock.Mock(status_code=206, content=data[int(start) : int(end) + 1])
+
+    session.image.get.side_effect = _fake_get
+    return session
+
+
+@mock.patch("openstack.exceptions.raise_from_response")
+def test_parallel_image_reader(mock_raise_from_response):
+    session = _get_fake_session()
+    reader = image_transfer.ParallelImageReader(
+        session, _get_fake_image(), chunk_size=64, streams=4, ring_size=6
+    )
+
+    assert b"".join(reader) == _IMAGE_DATA
+    assert session.image.get.call_count == 16
+
+
+@mock.patch("openstack.exceptions.raise_from_response")
+def test_parallel_image_reader_checksum_mismatch(mock_raise_from_response):
+    session = _get_fake_session(data=b"x" * len(_IMAGE_DATA))
+    reader = image_transfer.ParallelImageReader(
+        session, _get_fake_image(), chunk_size=64, streams=4, ring_size=6
+    )
+
+    with pytest.raises(exception.Invalid):
+        b"".join(reader)
+
+
+@mock.patch("openstack.exceptions.raise_from_response")
+def test_parallel_image_reader_unsupported_ranges(mock_raise_from_response):
+    session = mock.Mock()
+    session.image.get.return_value = mock.Mock(status_code=200, content=_IMAGE_DATA)
+    reader = image_transfer.ParallelImageReader(
+        session, _get_fake_image(), chunk_size=64, streams=4, ring_size=6
+    )
+
+    with pytest.raises(exception.NotSupported):
+        b"".join(reader)
+
+
+@pytest.mark.parametrize("status_code", [200, 206])
+@mock.patch("openstack.exceptions.raise_from_response")
+def test_supports_range_requests(mock_raise_from_response, status_code):
+    session = mock.Mock()
+    response = session.image.get.return_value
+    response.status_code = status_code
+
+    supported = image_transfer.supports_range_requests(session, _get_fake_image())
+
+    assert supported == (status_code == 206)
+    session.image.get.assert_called_once_with(
+        "images/fake-image/file", headers={"Range": "bytes=0-0"}, stream=True
+    )
+    response.close.assert_called_once_with()
+    response.iter_content.assert_not_called()
+
+
+def _get_fake_streaming_session(data=_IMAGE_DATA):
+    session = mock.Mock()
+    session.image.download_image.return_value.raw = io.BytesIO(data)
+    return session
+
+
+def test_pipelined_image_reader():
+    session = _get_fake_streaming_session()
+    reader = image_transfer.PipelinedImageReader(
+        session, _get_fake_image(), chunk_size=64, buffer_count=3
+    )
+
+    transferred = b""
+    buffers = set()
+    for chunk in reader:
+        # Simulate a slow upload.
+        time.sleep(0.001)
+        transferred += bytes(chunk)
+        buffers.add(id(chunk.obj))
+
+    assert transferred == _IMAGE_DATA
+    # The buffers are reused.
+    assert len(buffers) <= 3
+    session.image.download_image.return_value.close.assert_called_once_with()
+
+
+def test_pipelined_image_reader_checksum_mismatch():
+    session = _get_fake_streaming_session(data=b"x" * len(_IMAGE_DATA))
+    reader = image_transfer.PipelinedImageReader(
+        session, _get_fake_image(), chunk_size=64, buffer_count=3
+    )
+
+    with pytest.raises(exception.Invalid):
+        for chunk in reader:
+            pass
+
+
+def _get_fake_ranged_response(data, headers, fail_after=None):
+    start = 0
+    if "Range" in headers:
+        start = int(re.match(r"bytes=(\d+)-", headers["Range"]).group(1))
+
+    def _iter_content(chunk_size):
+        for idx, offset in enumerate(range(start, len(data), chunk_size)):
+            if fail_after is not None and idx >= fail_after:
+                raise ConnectionError("fake connection error")
+            yield data[offset : offset + chunk_size]
+
+    response = mock.MagicMock(status_code=206 if start else 200)
+    response.iter_content.side_effect = _iter_content
+    return response
+
+
+@mock.patch("time.sleep")
+@mock.patch("openstack.exceptions.raise_from_response")
+def test_image_spool_resume(mock_raise_from_response, mock_sleep, tmp_path):
+    session = mock.Mock()
+    session.image.get.side_effect = [
+        _get_fake_ranged_response(_IMAGE_DATA, {}, fail_after=3),
+        _get_fake_ranged_response(_IMAGE_DATA, {"Range": "bytes=192-"}),
+    ]
+    spool = image_transfer.ImageSpool(
+        session, _get_fake_image(), spool_dir=tmp_path, chunk_size=64
+    )
+
+    spool_path = spool.download(retries=1)
+
+    assert spool_path.read_bytes() == _IMAGE_DATA
+    assert session.image.get.call_args_list[1].kwargs["headers"] == {
+        "Range": "bytes=192-"
+    }
+
+    # Subsequent transfers reuse the spooled image.
+    spool.download()
+    assert session.image.get.call_count == 2
+
+    spool.remove()
+    assert not list(tmp_path.iterdir())
+
+
+@mock.patch("openstack.exceptions.raise_from_response")
+def test_image_spool_corrupted(mock_raise_from_response, tmp_path):
+    session = mock.Mock()
+    session.image.get.side_effect = [
+        _get_fake_ranged_response(_IMAGE_DATA, {}, fail_after=3),
+        _get_fake_ranged_response(_IMAGE_DATA, {}),
+    ]
+    spool = image_transfer.ImageSpool(
+        session, _get_fake_image(), spool_dir=tmp_path, chunk_size=64
+    )
+    with pytest.raises(ConnectionError):
+        spool.download()
+
+    # Alter the spooled data, which is expected to be discarded.
+    spool.path.write_bytes(b"x" * 192)
+    spool.download()
+
+    assert spool.path.read_bytes() == _IMAGE_DATA
+    assert "Range" not in session.image.get.call_args_list[1].kwargs["headers"]
@@ -0,0 +1,126 @@
+# SPDX-FileCopyrightText: 2025 - Canonical Ltd
+# SPDX-License-Identifier: Apache-2.0
+
+import threading
+import types
+from unittest import mock
+
+from sunbeam_migrate import constants, manager
+from sunbeam_migrate.handlers import base
+from sunbeam_migrate.handlers.nova import instance
+
+_VOLUME_IDS = ["fake-volume-0", "fake-volume-1"]
+
+
+@mock.patch.object(instance.InstanceHandler, "_wait_for_status", mock.Mock())
+@mock.patch.object(
+    instance.InstanceHandler,
+    "_get_identity_build_kwargs",
+    mock.Mock(return_value={"project_id": "fake-project"}),
+)
+@mock.patch.object(
+    instance.InstanceHandler, "_build_instance_kwargs", mock.Mock(return_value={})
+)
+@mock.patch.object(
+    instance.InstanceHandler, "_destination_session", new_callable=mock.PropertyMock
+)
+@mock.patch.object(
+    instance.InstanceHandler, "_source_session", new_callable=mock.PropertyMock
+)
+@mock.patch.object(instance.InstanceHandler, "_transfer_root_disk")
+@mock.patch.object(instance.InstanceHandler, "get_associated_resources")
+@mock.patch.object(instance.InstanceHandler, "_get_source")
+@mock.patch.object(instance, "CONF")
+@mock.patch("sunbeam_migrate.handlers.factory.get_migration_handler")
+@mock.patch("sunbeam_migrate.db.api.get_migrations")
+@mock.patch("sunbeam_migrate.db.models.Migration.save")
+def test_concurrent_disk_transfers(
+    mock_migration_cls_save,
+    mock_get_migrations,
+    mock_get_migration_handler,
+    mock_conf,
+    mock_get_source,
+    mock_get_associated_resources,
+    mock_transfer_root_disk,
+    mock_source_session,
+    mock_destination_session,
+):
+    mock_conf.instance_transfer_concurrency = 4
+    mock_conf.multitenant_mode = False
+    mock_get_source.return_value = types.SimpleNamespace(
+        id="fake-instance",
+        image={"id": "fake-image"},
+        flavor=types.SimpleNamespace(id="fake-flavor"),
+        project_id="fake-project",
+    )
+    mock_get_associated_resources.return_value = [
+        base.Resource(resource_type="port", source_id="fake-port"),
+        *[
+            base.Resource(resource_type="volume", source_id=volume_id)
+            for volume_id in _VOLUME_IDS
+        ],
+    ]
+
+    migrated_resources: list[str] = []
+    # The root disk and the volume transfers are expected to overlap,
+    # otherwise the barrier times out.
+    barrier = threading.Barrier(3, timeout=5)
+
+    def _fake_get_migrations(source_id=None, resource_type=None, **kwargs):
+        if source_id in migrated_resources:
+            return [
+                mock.Mock(
+                    status=constants.STATUS_COMPLETED,
+                    resource_type=resource_type,
+                    source_id=source_id,
+                    destination_id=f"dest-{source_id}",
+                )
+            ]
+        return []
+
+    def _fake_migrate_resource(resource_id, migrated_associated_resources):
+        if resource_id in _VOLUME_IDS:
+            barrier.wait()
+        migrated_resources.append(resource_id)
+        return f"dest-{resource_id}"
+
+    def _fake_transfer_root_disk(source_instance):
+        # The ports are migrated before starting the disk transfers.
+        assert migrated_resources == ["fake-port"]
+        barrier.wait()
+        migrated_resources.append("root-disk")
+        return mock.Mock(id="fake-tmp-image"), "fake-dest-tmp-image"
+
+    def _fake_create_server(**kwargs):
+        # The disk transfers are joined before creating the server.
+        assert sorted(migrated_resources) == sorted(
+            ["fake-port", "root-disk", *_VOLUME_IDS]
+        )
+        return mock.Mock(id="fake-dest-instance")
+
+    dependency_handler = mock.MagicMock()
+    dependency_handler.get_associated_resources.return_value = []
+    dependency_handler.get_member_resources.return_value = []
+    dependency_handler.get_associated_resource_concurrency.return_value = 1
+    dependency_handler.perform_individual_migration.side_effect = _fake_migrate_resource
+    instance_handler = instance.InstanceHandler()
+    mock_get_migration_handler.side_effect = lambda resource_type: (
+        instance_handler if resource_type == "instance" else dependency_handler
+    )
+    mock_get_migrations.side_effect = _fake_get_migrations
+    mock_transfer_root_disk.side_effect = _fake_transfer_root_disk
+    destination_session = mock_destination_session.return_value
+    destination_session.compute.create_server.side_effect = _fake_create_server
+
+    mgr = manager.SunbeamMigrationManager()
+    migration = mgr.perform_individual_migration(
+        "instance", "fake-instance", include_dependencies=True
+    )
+
+    assert migration.destination_id == "fake-dest-instance"
+    assert migration.status == constants.STATUS_COMPLETED
+    destination_session.compute.create_server.assert_called_once()
+    # The temporary images are removed once the server is created.
+    destination_session.image.delete_image.assert_called_once_with(
+        "fake-dest-tmp-image", ignore_missing=True
+    )
@@ -0,0 +1,78 @@
+# SPDX-FileCopyrightText: 2025 - Canonical Ltd
+# SPDX-License-Identifier: Apache-2.0
+
+import types
+from unittest import mock
+
+from sunbeam_migrate.db import api as db_api
+from sunbeam_migrate.db import session_utils
+from sunbeam_migrate.utils import inventory
+
+
+def _resource(**kwargs):
+    return types.SimpleNamespace(**{"project_id": None, "name": None, **kwargs})
+
+
+def _get_fake_session():
+    session = mock.Mock()
+    session.network.networks.return_value = [
+        _resource(id="fake-network", project_id="fake-project")
+    ]
+    session.network.subnets.return_value = [
+        _resource(id="fake-subnet", network_id="fake-network")
+    ]
+    session.network.ports.return_value = [
+        _resource(
+            id="fake-instance-port",
+            device_id="fake-instance",
+            device_owner="compute:nova",
+            fixed_ips=[{"subnet_id": "fake-subnet"}],
+        ),
+        _resource(
+            id="fake-router-port",
+            device_id="fake-router",
+            device_owner="network:router_interface",
+            fixed_ips=[{"subnet_id": "fake-subnet"}],
+        ),
+    ]
+    session.network.routers.return_value = [_resource(id="fake-router")]
+    session.network.ips.return_value = [
+        _resource(id="fake-fip", port_id="fake-instance-port")
+    ]
+    session.network.security_groups.return_value = []
+    session.compute.servers.return_value = [
+        _resource(id="fake-instance", project_id="fake-project")
+    ]
+    session.block_storage.volumes.return_value = [_resource(id="fake-volume")]
+    session.image.images.return_value = []
+    session.has_service.return_value = False
+    return session
+
+
+@mock.patch.object(inventory, "CONF")
+def test_inventory(mock_conf):
+    mock_conf.inventory_max_age = 3600
+    session_utils.initialize("sqlite://")
+    db_api.create_tables()
+
+    inventory.sync_inventory(_get_fake_session(), "fake-cloud")
+    inv = inventory.get_inventory("fake-cloud")
+    assert inv
+
+    assert inv.get_related("subnet-network", "fake-subnet") == ["fake-network"]
+    assert inv.get_related("router-subnet", "fake-router") == ["fake-subnet"]
+    assert inv.get_reverse_related("port-device", "fake-instance") == [
+        "fake-instance-port"
+    ]
+    assert inv.get_reverse_related("floating-ip-port", "fake-instance-port") == [
+        "fake-fip"
+    ]
+
+    # The snapshot is replaced when syncing again.
+    inventory.sync_inventory(_get_fake_session(), "fake-cloud")
+    assert inv.get_related("subnet-network", "fake-subnet") == ["fake-network"]
+
+    # Outdated snapshots are ignored.
+    mock_conf.inventory_max_age = 0
+    inventory.reset_inventory_cache()
+    assert not inventory.get_inventory("fake-cloud")
@@ -0,0 +1,223 @@
+# SPDX-FileCopyrightText: 2025 - Canonical Ltd
+# SPDX-License-Identifier: Apache-2.0
+
+import types
+from unittest import mock
+
+from openstack import exceptions as openstack_exc
+
+from sunbeam_migrate.handlers import base
+from sunbeam_migrate.handlers.octavia import load_balancer
+
+_MIGRATED_RESOURCES = [
+    base.MigratedResource(
+        resource_type="subnet",
+        source_id="fake-subnet",
+        destination_id="fake-dest-subnet",
+    ),
+]
+
+
+def _get_source_resources():
+    source_lb = types.SimpleNamespace(
+        id="fake-lb",
+        name="fake-lb-name",
+        is_admin_state_up=True,
+        vip_subnet_id="fake-subnet",
+        vip_network_id=None,
+        vip_address="10.0.0.10",
+        vip_port_id="fake-port",
+        project_id="fake-project",
+    )
+    listeners = [
+        types.SimpleNamespace(
+            id=f"fake-listener-{idx}",
+            protocol="TCP",
+            protocol_port=80 + idx,
+            is_admin_state_up=True,
+            default_pool_id="fake-pool",
+        )
+        for idx in range(2)
+    ]
+    pool = types.SimpleNamespace(
+        id="fake-pool", protocol="TCP", lb_algorithm="ROUND_ROBIN"
+    )
+    members = [
+        types.SimpleNamespace(
+            id=f"fake-member-{idx}",
+            address=f"10.0.0.{idx}",
+            protocol_port=8080,
+            subnet_id="fake-subnet",
+        )
+        for idx in range(3)
+    ]
+    health_monitor = types.SimpleNamespace(
+        id="fake-hm", type="TCP", delay=5, timeout=3, max_retries=3
+    )
+    return (
+        source_lb,
+        listeners,
+        {"fake-pool": pool},
+        {"fake-pool": members},
+        {"fake-pool": health_monitor},
+    )
+
+
+@mock.patch.object(load_balancer.LoadBalancerHandler, "_wait_for_status")
+@mock.patch.object(
+    load_balancer.LoadBalancerHandler,
+    "_get_identity_build_kwargs",
+    mock.Mock(return_value={}),
+)
+@mock.patch.object(
+    load_balancer.LoadBalancerHandler,
+    "_destination_session",
+    new_callable=mock.PropertyMock,
+)
+def test_create_populated_load_balancer(mock_destination_session, mock_wait):
+    destination_session = mock_destination_session.return_value
+    create_lb = destination_session.load_balancer.create_load_balancer
+    create_lb.return_value = mock.Mock(id="fake-dest-lb")
+
+    handler = load_balancer.LoadBalancerHandler()
+    dest_lb_id = handler._create_populated_destination_load_balancer(
+        *_get_source_resources(), _MIGRATED_RESOURCES
+    )
+
+    assert dest_lb_id == "fake-dest-lb"
+    create_lb.assert_called_once_with(
+        name="fake-lb-name",
+        is_admin_state_up=True,
+        vip_subnet_id="fake-dest-subnet",
+        vip_address="10.0.0.10",
+        listeners=[
+            {
+                "protocol": "TCP",
+                "protocol_port": 80,
+                "admin_state_up": True,
+                "default_pool": {
+                    "protocol": "TCP",
+                    "lb_algorithm": "ROUND_ROBIN",
+                    "healthmonitor": {
+                        "type": "TCP",
+                        "delay": 5,
+                        "timeout": 3,
+                        "max_retries": 3,
+                    },
+                    "members": [
+                        {
+                            "address": f"10.0.0.{idx}",
+                            "protocol_port": 8080,
+                            "subnet_id": "fake-dest-subnet",
+                        }
+                        for idx in range(3)
+                    ],
+                },
+            },
+            # The shared pool is only created once.
+            {"protocol": "TCP", "protocol_port": 81, "admin_state_up": True},
+        ],
+    )
+    # A single wait for all the load balancer components.
+    mock_wait.assert_called_once()
+    destination_session.load_balancer.create_listener.assert_not_called()
+    destination_session.load_balancer.create_member.assert_not_called()
+
+
+@mock.patch.object(
+    load_balancer.LoadBalancerHandler,
+    "_create_destination_load_balancer_components",
+    return_value="fake-dest-lb",
+)
+@mock.patch.object(
+    load_balancer.LoadBalancerHandler,
+    "_create_populated_destination_load_balancer",
+    side_effect=openstack_exc.HttpException(http_status=501),
+)
+@mock.patch.object(
+    load_balancer.LoadBalancerHandler,
+    "_destination_session",
+    new_callable=mock.PropertyMock,
+)
+@mock.patch.object(
+    load_balancer.LoadBalancerHandler, "_source_session", new_callable=mock.PropertyMock
+)
+@mock.patch.object(load_balancer.LoadBalancerHandler, "_get_source")
+@mock.patch.object(load_balancer, "CONF")
+def test_populated_load_balancer_fallback(
+    mock_conf,
+    mock_get_source,
+    mock_source_session,
+    mock_destination_session,
+    mock_create_populated,
+    mock_create_components,
+):
+    mock_conf.load_balancer_single_request_creation = True
+    mock_conf.load_balancer_source_concurrency = 4
+    source_session = mock_source_session.return_value
+    source_session.load_balancer.listeners.return_value = []
+    source_session.network.ips.return_value = []
+
+    handler = load_balancer.LoadBalancerHandler()
+    dest_lb_id = handler.perform_individual_migration("fake-lb", [])
+
+    assert dest_lb_id == "fake-dest-lb"
+    mock_create_populated.assert_called_once()
+    mock_create_components.assert_called_once()
+
+
+@mock.patch.object(load_balancer.LoadBalancerHandler, "_wait_for_status")
+@mock.patch.object(
+    load_balancer.LoadBalancerHandler,
+    "_destination_session",
+    new_callable=mock.PropertyMock,
+)
+def test_create_destination_members(mock_destination_session, mock_wait):
+    destination_session = mock_destination_session.return_value
+    destination_session.load_balancer.put.return_value = mock.Mock(status_code=202)
+    _, _, _, members_map, _ = _get_source_resources()
+
+    handler = load_balancer.LoadBalancerHandler()
+    handler._create_destination_members(
+        members_map["fake-pool"], "fake-dest-lb", "fake-dest-pool", _MIGRATED_RESOURCES
+    )
+
+    # All the members are created using a single batch update.
+    destination_session.load_balancer.put.assert_called_once_with(
+        "/lbaas/pools/fake-dest-pool/members",
+        json={
+            "members": [
+                {
+                    "address": f"10.0.0.{idx}",
+                    "protocol_port": 8080,
+                    "subnet_id": "fake-dest-subnet",
+                }
+                for idx in range(3)
+            ]
+        },
+        raise_exc=False,
+    )
+    destination_session.load_balancer.create_member.assert_not_called()
+    mock_wait.assert_called_once()
+
+
+@mock.patch.object(load_balancer.LoadBalancerHandler, "_get_source_pool_members")
+@mock.patch.object(
+    load_balancer.LoadBalancerHandler, "_source_session", new_callable=mock.PropertyMock
+)
+@mock.patch.object(load_balancer.LoadBalancerHandler, "_get_source")
+def test_get_source_pool_components(
+    mock_get_source, mock_source_session, mock_get_members
+):
+    mock_get_source.return_value = types.SimpleNamespace(
+        id="fake-pool", health_monitor_id="fake-hm"
+    )
+
+    handler = load_balancer.LoadBalancerHandler()
+    pool, members, hm = handler._get_source_pool_components("fake-pool")
+
+    assert pool == mock_get_source.return_value
+    assert members == mock_get_members.return_value
+    assert hm == (
+        mock_source_session.return_value.load_balancer.get_health_monitor.return_value
+    )
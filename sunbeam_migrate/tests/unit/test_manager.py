@@ -1,11 +1,14 @@
 # SPDX-FileCopyrightText: 2025 - Canonical Ltd
 # SPDX-License-Identifier: Apache-2.0
 
+import threading
 from unittest import mock
 
 import pytest
 
 from sunbeam_migrate import constants, exception, manager
+from sunbeam_migrate.db import models
+from sunbeam_migrate.handlers import base
 from sunbeam_migrate.handlers.base import Resource
 
 
@@ -24,6 +27,9 @@ def _test_individual_migration(
 ):
     mock_handler = mock_get_migration_handler.return_value
     mock_handler.get_service_type.return_value = "fake-service-type"
+    mock_handler.get_associated_resource_concurrency.return_value = 1
+    mock_handler.perform_member_batch_migration.return_value = {}
+    mock_handler.supports_bulk_migration.return_value = False
 
     migrated_resources = set()
 
@@ -179,6 +185,9 @@ def test_perform_batch_migration(
 ):
     mock_handler = mock_get_migration_handler.return_value
     mock_handler.get_service_type.return_value = "fake-service-type"
+    mock_handler.get_associated_resource_concurrency.return_value = 1
+    mock_handler.perform_member_batch_migration.return_value = {}
+    mock_handler.supports_bulk_migration.return_value = False
 
     mock_get_migrations.side_effect = [None, None, [mock.Mock()]]
     fake_resources = [
@@ -215,3 +224,419 @@ def test_perform_batch_migration(
     mock_handler.get_source_resource_ids.assert_called_once_with(
         mock.sentinel.resource_filters
     )
+
+
+@mock.patch("sunbeam_migrate.handlers.factory.get_migration_handler")
+@mock.patch("sunbeam_migrate.db.api.get_migrations")
+@mock.patch("sunbeam_migrate.db.models.Migration.save")
+def test_concurrent_associated_resources(
+    mock_migration_cls_save,
+    mock_get_migrations,
+    mock_get_migration_handler,
+):
+    mock_handler = mock_get_migration_handler.return_value
+    mock_handler.get_service_type.return_value = "fake-service-type"
+    mock_handler.get_associated_resource_concurrency.return_value = 3
+    mock_handler.get_concurrent_associated_resource_types.return_value = ["volume"]
+    mock_handler.perform_member_batch_migration.return_value = {}
+    mock_handler.supports_bulk_migration.return_value = False
+
+    volume_ids = ["fake-volume-0", "fake-volume-1"]
+    migrated_resources = set()
+    # The prepared work and the volume migrations are expected to run
+    # concurrently, otherwise the barrier times out.
+    barrier = threading.Barrier(3, timeout=5)
+
+    def _fake_get_migrations(source_id=None, **kwargs):
+        if source_id in migrated_resources:
+            return [mock.Mock(status=constants.STATUS_COMPLETED)]
+        return []
+
+    def _fake_get_associated_resources(resource_id):
+        if resource_id == "fake-instance":
+            return [
+                Resource(resource_type="volume", source_id=volume_id)
+                for volume_id in volume_ids
+            ] + [Resource(resource_type="network", source_id="fake-network")]
+        return []
+
+    def _fake_prepare(resource_id, executor):
+        if resource_id == "fake-instance":
+            # The other dependencies are migrated first.
+            assert "fake-network" in migrated_resources
+            executor.submit(barrier.wait)
+
+    def _fake_migrate_resource(resource_id, migrated_associated_resources):
+        if resource_id in volume_ids:
+            barrier.wait()
+        migrated_resources.add(resource_id)
+
+    mock_get_migrations.side_effect = _fake_get_migrations
+    mock_handler.get_associated_resources.side_effect = _fake_get_associated_resources
+    mock_handler.prepare_individual_migration.side_effect = _fake_prepare
+    mock_handler.perform_individual_migration.side_effect = _fake_migrate_resource
+    mock_handler.get_member_resources.return_value = []
+
+    mgr = manager.SunbeamMigrationManager()
+    migration = mgr.perform_individual_migration(
+        resource_type="instance",
+        resource_id="fake-instance",
+        include_dependencies=True,
+    )
+
+    assert migration.status == constants.STATUS_COMPLETED
+    assert migrated_resources == {"fake-instance", "fake-network", *volume_ids}
+    mock_handler.abort_individual_migration.assert_not_called()
+
+
+@mock.patch("sunbeam_migrate.handlers.factory.get_migration_handler")
+@mock.patch("sunbeam_migrate.db.api.create_migrations")
+@mock.patch("sunbeam_migrate.db.api.get_migrations")
+@mock.patch("sunbeam_migrate.db.models.Migration.save")
+def test_member_batch_migration(
+    mock_migration_cls_save,
+    mock_get_migrations,
+    mock_create_migrations,
+    mock_get_migration_handler,
+):
+    mock_handler = mock_get_migration_handler.return_value
+    mock_handler.get_service_type.return_value = "fake-service-type"
+    mock_handler.get_associated_resource_concurrency.return_value = 1
+    mock_handler.get_associated_resources.return_value = []
+    mock_handler.get_member_resources.side_effect = lambda resource_id: (
+        [
+            Resource(resource_type="security-group-rule", source_id=f"fake-rule-{idx}")
+            for idx in range(3)
+        ]
+        if resource_id == "fake-sg"
+        else []
+    )
+    mock_handler.perform_individual_migration.side_effect = (
+        lambda resource_id, migrated_associated_resources: f"dest-{resource_id}"
+    )
+    # The last rule is left to be migrated individually.
+    mock_handler.perform_member_batch_migration.return_value = {
+        "fake-rule-0": "dest-fake-rule-0",
+        "fake-rule-1": "dest-fake-rule-1",
+    }
+    mock_get_migrations.return_value = []
+
+    mgr = manager.SunbeamMigrationManager()
+    migration = mgr.perform_individual_migration(
+        resource_type="security-group",
+        resource_id="fake-sg",
+        include_members=True,
+    )
+
+    assert migration.status == constants.STATUS_COMPLETED
+    mock_handler.perform_member_batch_migration.assert_called_once_with(
+        "fake-sg",
+        "dest-fake-sg",
+        mock_handler.get_member_resources("fake-sg"),
+        migrated_associated_resources=[
+            base.MigratedResource(
+                resource_type="security-group",
+                source_id="fake-sg",
+                destination_id="dest-fake-sg",
+            )
+        ],
+    )
+    # A single insert for the bulk migrated rules.
+    (batch_migrations,) = mock_create_migrations.call_args.args
+    assert [
+        (batch_migration.source_id, batch_migration.destination_id)
+        for batch_migration in batch_migrations
+    ] == [
+        ("fake-rule-0", "dest-fake-rule-0"),
+        ("fake-rule-1", "dest-fake-rule-1"),
+    ]
+    assert all(
+        batch_migration.status == constants.STATUS_COMPLETED
+        for batch_migration in batch_migrations
+    )
+    mock_handler.perform_individual_migration.assert_has_calls(
+        [
+            mock.call("fake-sg", migrated_associated_resources=[]),
+            mock.call("fake-rule-2", migrated_associated_resources=[]),
+        ]
+    )
+    connected_members = mock_handler.connect_member_resources_to_parent.call_args
+    assert [
+        resource.source_id
+        for resource in connected_members.kwargs["migrated_member_resources"]
+    ] == ["fake-rule-0", "fake-rule-1", "fake-rule-2"]
+
+
+@mock.patch("sunbeam_migrate.handlers.factory.get_migration_handler")
+@mock.patch("sunbeam_migrate.db.api.get_migrations")
+@mock.patch("sunbeam_migrate.db.models.Migration.save", autospec=True)
+def test_shared_dependency_pending_members(
+    mock_migration_cls_save,
+    mock_get_migrations,
+    mock_get_migration_handler,
+):
+    mock_handler = mock_get_migration_handler.return_value
+    mock_handler.get_service_type.return_value = "fake-service-type"
+    mock_handler.get_associated_resource_concurrency.return_value = 1
+    mock_handler.perform_member_batch_migration.return_value = {}
+    mock_handler.supports_bulk_migration.return_value = False
+
+    saved_migrations: dict[tuple[str, str], mock.Mock] = {}
+    finalizing = threading.Event()
+    finalize_proceed = threading.Event()
+    mgr = manager.SunbeamMigrationManager()
+
+    def _fake_save(migration, session=None):
+        key = (migration.resource_type, migration.source_id)
+        in_flight_migration = mgr._get_in_flight_migration(*key)
+        if key == ("network", "fake-network") and (
+            in_flight_migration and in_flight_migration.done()
+        ):
+            # Block the network migration once the in-flight migration
+            # is resolved, before its status gets updated.
+            finalizing.set()
+            assert finalize_proceed.wait(timeout=5)
+        saved_migrations[key] = mock.Mock(
+            status=migration.status,
+            resource_type=migration.resource_type,
+            source_id=migration.source_id,
+            destination_id=migration.destination_id,
+        )
+
+    def _fake_get_migrations(source_id=None, resource_type=None, **kwargs):
+        migration = saved_migrations.get((resource_type, source_id))
+        return [migration] if migration else []
+
+    def _fake_get_associated_resources(resource_id):
+        if resource_id == "fake-port":
+            return [Resource(resource_type="network", source_id="fake-network")]
+        return []
+
+    mock_migration_cls_save.side_effect = _fake_save
+    mock_get_migrations.side_effect = _fake_get_migrations
+    mock_handler.get_associated_resources.side_effect = _fake_get_associated_resources
+    mock_handler.get_member_resources.return_value = []
+    mock_handler.perform_individual_migration.side_effect = (
+        lambda resource_id, migrated_associated_resources: f"dest-{resource_id}"
+    )
+
+    network_thread = threading.Thread(
+        target=mgr.perform_individual_migration, args=("network", "fake-network")
+    )
+    network_thread.start()
+    try:
+        assert finalizing.wait(timeout=5)
+        # The network migration is still being finalized, however it can
+        # already be consumed by the port.
+        migration = mgr.perform_individual_migration(
+            "port", "fake-port", include_dependencies=True
+        )
+    finally:
+        finalize_proceed.set()
+        network_thread.join()
+
+    assert migration.status == constants.STATUS_COMPLETED
+    assert saved_migrations[("network", "fake-network")].status == (
+        constants.STATUS_COMPLETED
+    )
+    mock_handler.perform_individual_migration.assert_has_calls(
+        [
+            mock.call("fake-network", migrated_associated_resources=[]),
+            mock.call("fake-port", migrated_associated_resources=[mock.ANY]),
+        ]
+    )
+
+
+@pytest.mark.parametrize("bulk_failure", [False, True])
+@mock.patch("sunbeam_migrate.handlers.factory.get_migration_handler")
+@mock.patch("sunbeam_migrate.db.api.create_migrations")
+@mock.patch("sunbeam_migrate.db.api.get_migrations")
+@mock.patch("sunbeam_migrate.db.models.Migration.save")
+@mock.patch.object(manager, "CONFIG")
+def test_perform_bulk_migration(
+    mock_config,
+    mock_migration_cls_save,
+    mock_get_migrations,
+    mock_create_migrations,
+    mock_get_migration_handler,
+    bulk_failure,
+):
+    mock_config.bulk_migration_chunk_size = 2
+    mock_handler = mock_get_migration_handler.return_value
+    mock_handler.get_service_type.return_value = "fake-service-type"
+    mock_handler.get_associated_resource_concurrency.return_value = 1
+    mock_handler.supports_bulk_migration.return_value = True
+    mock_handler.get_member_resources.return_value = []
+    # The last network has a pending dependency.
+    mock_handler.get_associated_resources.side_effect = lambda resource_id: (
+        [Resource(resource_type="project", source_id="fake-project")]
+        if resource_id == "fake-network-3"
+        else []
+    )
+    migrated_resources = set()
+
+    def _fake_get_migrations(source_id=None, **kwargs):
+        if source_id in migrated_resources:
+            return [
+                mock.Mock(
+                    status=constants.STATUS_COMPLETED,
+                    resource_type="project",
+                    source_id=source_id,
+                    destination_id=f"dest-{source_id}",
+                )
+            ]
+        return []
+
+    def _fake_migrate_resource(resource_id, migrated_associated_resources):
+        migrated_resources.add(resource_id)
+        return f"dest-{resource_id}"
+
+    def _fake_bulk_migrate_resources(resource_ids, migrated_associated_resources):
+        if bulk_failure:
+            raise exception.SunbeamMigrateException("fake failure")
+        return [f"dest-{resource_id}" for resource_id in resource_ids]
+
+    mock_get_migrations.side_effect = _fake_get_migrations
+    mock_handler.perform_individual_migration.side_effect = _fake_migrate_resource
+    mock_handler.perform_bulk_migration.side_effect = _fake_bulk_migrate_resources
+
+    resource_ids = [f"fake-network-{idx}" for idx in range(4)]
+    mgr = manager.SunbeamMigrationManager()
+    migrations = mgr.perform_bulk_migration(
+        "network", resource_ids, include_dependencies=True
+    )
+
+    assert [migration.source_id for migration in migrations] == resource_ids
+    assert [migration.destination_id for migration in migrations] == [
+        f"dest-{resource_id}" for resource_id in resource_ids
+    ]
+    assert all(
+        migration.status == constants.STATUS_COMPLETED for migration in migrations
+    )
+    # The resources are migrated in chunks.
+    mock_handler.perform_bulk_migration.assert_has_calls(
+        [
+            mock.call(
+                ["fake-network-0", "fake-network-1"], migrated_associated_resources=[]
+            ),
+            mock.call(["fake-network-2"], migrated_associated_resources=[]),
+        ]
+    )
+    individual_ids = [
+        call.args[0] for call in mock_handler.perform_individual_migration.mock_calls
+    ]
+    if bulk_failure:
+        mock_create_migrations.assert_not_called()
+        assert individual_ids == [*resource_ids[:3], "fake-project", resource_ids[3]]
+    else:
+        assert mock_create_migrations.call_count == 2
+        assert individual_ids == ["fake-project", "fake-network-3"]
+
+
+@pytest.mark.parametrize("failed_step", ["record", "finalize"])
+@mock.patch("sunbeam_migrate.handlers.factory.get_migration_handler")
+@mock.patch("sunbeam_migrate.db.api.create_migrations")
+@mock.patch("sunbeam_migrate.db.api.get_migrations")
+@mock.patch("sunbeam_migrate.db.models.Migration.save")
+@mock.patch.object(manager, "CONFIG")
+def test_perform_bulk_migration_post_create_failure(
+    mock_config,
+    mock_migration_cls_save,
+    mock_get_migrations,
+    mock_create_migrations,
+    mock_get_migration_handler,
+    failed_step,
+):
+    mock_config.bulk_migration_chunk_size = 2
+    mock_handler = mock_get_migration_handler.return_value
+    mock_handler.get_service_type.return_value = "fake-service-type"
+    mock_handler.supports_bulk_migration.return_value = True
+    mock_handler.get_associated_resources.return_value = []
+    mock_handler.perform_bulk_migration.side_effect = lambda resource_ids, **kwargs: [
+        f"dest-{resource_id}" for resource_id in resource_ids
+    ]
+    mock_get_migrations.return_value = []
+    if failed_step == "record":
+        mock_create_migrations.side_effect = exception.SunbeamMigrateException(
+            "fake failure"
+        )
+    else:
+
+        def _fake_finalize(resource_id, destination_id, migrated_resources):
+            if resource_id == "fake-port-0":
+                raise exception.SunbeamMigrateException("fake failure")
+
+        mock_handler.finalize_bulk_migration.side_effect = _fake_finalize
+
+    mgr = manager.SunbeamMigrationManager()
+    with pytest.raises(exception.SunbeamMigrateException, match="fake failure"):
+        mgr.perform_bulk_migration("port", ["fake-port-0", "fake-port-1"])
+
+    # The created resources are not migrated again individually.
+    mock_handler.perform_bulk_migration.assert_called_once()
+    mock_handler.perform_individual_migration.assert_not_called()
+    if failed_step == "record":
+        # The resources that couldn't be recorded are removed.
+        mock_handler.delete_destination_resource.assert_has_calls(
+            [mock.call("dest-fake-port-0"), mock.call("dest-fake-port-1")]
+        )
+        mock_handler.finalize_bulk_migration.assert_not_called()
+    else:
+        mock_handler.delete_destination_resource.assert_not_called()
+        assert mock_handler.finalize_bulk_migration.call_count == 2
+        recorded_migrations = mock_create_migrations.call_args.args[0]
+        assert [migration.status for migration in recorded_migrations] == [
+            constants.STATUS_FAILED,
+            constants.STATUS_COMPLETED,
+        ]
+    assert not mgr._in_flight_migrations
+
+
+@pytest.mark.parametrize("cleanup_source", [False, True])
+@mock.patch("sunbeam_migrate.handlers.factory.get_migration_handler")
+@mock.patch("sunbeam_migrate.db.models.Migration.save")
+def test_sync_migration_data(
+    mock_migration_cls_save, mock_get_migration_handler, cleanup_source
+):
+    mock_handler = mock_get_migration_handler.return_value
+    migration = models.Migration(
+        resource_type="share",
+        source_id="fake-share",
+        destination_id="fake-dest-share",
+        status=constants.STATUS_COMPLETED,
+        source_removed=False,
+    )
+
+    mgr = manager.SunbeamMigrationManager()
+    mgr.sync_migration_data(migration, cleanup_source=cleanup_source)
+
+    mock_handler.sync_resource_data.assert_called_once_with(
+        "fake-share", "fake-dest-share"
+    )
+    assert migration.source_removed == cleanup_source
+    if cleanup_source:
+        mock_handler.delete_source_resource.assert_called_once_with("fake-share")
+
+    # The source was already removed.
+    migration.source_removed = True
+    with pytest.raises(exception.InvalidInput):
+        mgr.sync_migration_data(migration)
+    mock_handler.sync_resource_data.assert_called_once()
+
+
+@mock.patch("sunbeam_migrate.handlers.factory.get_migration_handler")
+def test_verify_migration_data(mock_get_migration_handler):
+    mock_handler = mock_get_migration_handler.return_value
+    migration = models.Migration(
+        resource_type="share",
+        source_id="fake-share",
+        destination_id="fake-dest-share",
+        status=constants.STATUS_COMPLETED,
+    )
+
+    mgr = manager.SunbeamMigrationManager()
+    mgr.verify_migration_data(migration)
+
+    mock_handler.verify_resource_data.assert_called_once_with(
+        "fake-share", "fake-dest-share"
+    )
@@ -0,0 +1,137 @@
+# SPDX-FileCopyrightText: 2025 - Canonical Ltd
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import types
+from unittest import mock
+
+import pytest
+
+from sunbeam_migrate.utils import manila_utils
+
+
+def _share(share_id):
+    return types.SimpleNamespace(id=share_id)
+
+
+@pytest.fixture
+def mount_mocks(tmp_path):
+    with (
+        mock.patch.object(manila_utils, "CONF") as mock_conf,
+        mock.patch.object(manila_utils, "get_share_export_path") as mock_export_path,
+        mock.patch.object(manila_utils, "_get_access_ip", return_value="fake-ip"),
+        mock.patch.object(manila_utils, "_create_share_access") as mock_create_access,
+        mock.patch.object(manila_utils, "_delete_share_access") as mock_delete_access,
+        mock.patch.object(manila_utils, "mount_nfs_share") as mock_mount,
+        mock.patch.object(manila_utils, "unmount_nfs_share") as mock_unmount,
+    ):
+        mock_conf.temporary_migration_dir = tmp_path
+        mock_conf.share_access_rule_concurrency = 4
+        mock_export_path.side_effect = lambda sdk_conn, share_id: f"{share_id}-export"
+        mock_create_access.side_effect = (
+            lambda sdk_conn, share, access_ip, access_level: f"{share.id}-rule"
+        )
+        yield types.SimpleNamespace(
+            create_access=mock_create_access,
+            delete_access=mock_delete_access,
+            mount=mock_mount,
+            unmount=mock_unmount,
+        )
+
+
+def test_mounted_share(mount_mocks):
+    mount_manager = manila_utils.ShareMountManager()
+    sdk_conn = mock.Mock()
+
+    for _ in range(2):
+        with mount_manager.mounted_share(sdk_conn, _share("fake-share")) as mountpoint:
+            mount_mocks.mount.assert_called_with("fake-share-export", mountpoint)
+
+    # Outside batches, the shares are released as soon as they're unused.
+    assert mount_mocks.create_access.call_count == 2
+    assert mount_mocks.mount.call_count == 2
+    assert mount_mocks.unmount.call_count == 2
+    mount_mocks.delete_access.assert_called_with(
+        sdk_conn, "fake-share", "fake-share-rule"
+    )
+    assert mount_mocks.delete_access.call_count == 2
+
+
+def test_mounted_share_batch(mount_mocks):
+    mount_manager = manila_utils.ShareMountManager()
+    sdk_conn = mock.Mock()
+    shares = [_share(f"fake-share-{idx}") for idx in range(3)]
+
+    def _fake_create_access(sdk_conn, share, access_ip, access_level):
+        if share.id == "fake-share-2":
+            raise Exception("fake-error")
+        return f"{share.id}-rule"
+
+    mount_mocks.create_access.side_effect = _fake_create_access
+
+    with mount_manager.batch():
+        mount_manager.prepare_share_access(sdk_conn, shares)
+        assert mount_mocks.create_access.call_count == 3
+
+        mountpoints = set()
+        for _ in range(2):
+            with (
+                mount_manager.mounted_share(sdk_conn, shares[0]) as mountpoint_0,
+                mount_manager.mounted_share(sdk_conn, shares[0]) as mountpoint_1,
+            ):
+                assert mountpoint_0 == mountpoint_1
+                mountpoints.add(mountpoint_0)
+            with mount_manager.mounted_share(sdk_conn, shares[1]) as mountpoint:
+                mountpoints.add(mountpoint)
+
+        # The mounts and access rules are reused.
+        assert len(mountpoints) == 2
+        assert mount_mocks.mount.call_count == 2
+        assert mount_mocks.create_access.call_count == 3
+        mount_mocks.unmount.assert_not_called()
+        mount_mocks.delete_access.assert_not_called()
+
+    # Released at the end of the batch.
+    assert sorted(
+        call.args[0] for call in mount_mocks.unmount.call_args_list
+    ) == sorted(mountpoints)
+    mount_mocks.delete_access.assert_has_calls(
+        [
+            mock.call(sdk_conn, "fake-share-0", "fake-share-0-rule"),
+            mock.call(sdk_conn, "fake-share-1", "fake-share-1-rule"),
+        ],
+        any_order=True,
+    )
+    assert mount_mocks.delete_access.call_count == 2
+
+
+def test_release_share(mount_mocks):
+    mount_manager = manila_utils.ShareMountManager()
+    sdk_conn = mock.Mock()
+    shares = [_share(f"fake-share-{idx}") for idx in range(3)]
+
+    def _fake_unmount(mountpoint):
+        if "fake-share-0" in mountpoint:
+            raise Exception("fake-error")
+
+    mount_mocks.unmount.side_effect = _fake_unmount
+
+    with mount_manager.batch():
+        mountpoints = []
+        for share in shares:
+            with mount_manager.mounted_share(sdk_conn, share) as mountpoint:
+                mountpoints.append(mountpoint)
+
+        # Released before the share gets deleted, regardless of the batch.
+        mount_manager.release_share("fake-share-1")
+        mount_mocks.unmount.assert_called_once_with(mountpoints[1])
+        mount_mocks.delete_access.assert_called_once_with(
+            sdk_conn, "fake-share-1", "fake-share-1-rule"
+        )
+        assert not os.path.exists(mountpoints[1])
+
+    # Unmount failures don't prevent the other shares from being released.
+    assert mount_mocks.unmount.call_count == 3
+    assert os.path.exists(mountpoints[0])
+    assert not os.path.exists(mountpoints[2])
+    assert mount_mocks.delete_access.call_count == 3
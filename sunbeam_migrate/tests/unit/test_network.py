@@ -0,0 +1,107 @@
+# SPDX-FileCopyrightText: 2025 - Canonical Ltd
+# SPDX-License-Identifier: Apache-2.0
+
+import types
+from unittest import mock
+
+from sunbeam_migrate.handlers import base
+from sunbeam_migrate.handlers.neutron import network, subnet
+
+_MIGRATED_RESOURCES = [
+    base.MigratedResource(
+        resource_type="project",
+        source_id="fake-project",
+        destination_id="fake-dest-project",
+    ),
+    base.MigratedResource(
+        resource_type="network",
+        source_id="fake-network",
+        destination_id="fake-dest-network",
+    ),
+]
+
+
+def _subnet(subnet_id, project_id="fake-project"):
+    return types.SimpleNamespace(
+        id=subnet_id,
+        name=subnet_id,
+        cidr="10.0.0.0/24",
+        ip_version=4,
+        network_id="fake-network",
+        project_id=project_id,
+    )
+
+
+@mock.patch.object(network._network.Network, "bulk_create")
+@mock.patch.object(network.NetworkHandler, "_destination_session", mock.Mock())
+@mock.patch.object(network.NetworkHandler, "_get_source")
+def test_perform_bulk_migration(mock_get_source, mock_bulk_create):
+    mock_get_source.side_effect = lambda kind, resource_id: types.SimpleNamespace(
+        id=resource_id, name=resource_id, mtu=1500, project_id="fake-project"
+    )
+    mock_bulk_create.return_value = iter(
+        [mock.Mock(id="fake-dest-network-0"), mock.Mock(id="fake-dest-network-1")]
+    )
+
+    handler = network.NetworkHandler()
+    dest_network_ids = handler.perform_bulk_migration(
+        ["fake-network-0", "fake-network-1"], _MIGRATED_RESOURCES
+    )
+
+    assert dest_network_ids == ["fake-dest-network-0", "fake-dest-network-1"]
+    mock_bulk_create.assert_called_once_with(
+        mock.ANY,
+        [
+            {
+                "name": f"fake-network-{idx}",
+                "mtu": 1500,
+                "project_id": "fake-dest-project",
+            }
+            for idx in range(2)
+        ],
+    )
+
+
+@mock.patch.object(subnet._subnet.Subnet, "bulk_create")
+@mock.patch.object(subnet.SubnetHandler, "_destination_session", mock.Mock())
+@mock.patch.object(base.BaseMigrationHandler, "_get_source")
+def test_perform_member_batch_migration(mock_get_source, mock_bulk_create):
+    source_subnets = {
+        "fake-subnet-0": _subnet("fake-subnet-0"),
+        "fake-subnet-1": _subnet("fake-subnet-1"),
+        # Owned by a project that wasn't migrated yet.
+        "fake-subnet-2": _subnet("fake-subnet-2", project_id="fake-other-project"),
+    }
+    mock_get_source.side_effect = lambda kind, resource_id: source_subnets[resource_id]
+    mock_bulk_create.return_value = iter(
+        [mock.Mock(id="fake-dest-subnet-0"), mock.Mock(id="fake-dest-subnet-1")]
+    )
+
+    handler = network.NetworkHandler()
+    migrated_subnet_ids = handler.perform_member_batch_migration(
+        "fake-network",
+        "fake-dest-network",
+        [
+            base.Resource(resource_type="subnet", source_id=subnet_id)
+            for subnet_id in source_subnets
+        ],
+        _MIGRATED_RESOURCES,
+    )
+
+    assert migrated_subnet_ids == {
+        "fake-subnet-0": "fake-dest-subnet-0",
+        "fake-subnet-1": "fake-dest-subnet-1",
+    }
+    mock_bulk_create.assert_called_once_with(
+        mock.ANY,
+        [
+            {
+                "cidr": "10.0.0.0/24",
+                "ip_version": 4,
+                "name": f"fake-subnet-{idx}",
+                "network_id": "fake-dest-network",
+                "project_id": "fake-dest-project",
+            }
+            for idx in range(2)
+        ],
+    )
@@ -0,0 +1,57 @@
+# SPDX-FileCopyrightText: 2025 - Canonical Ltd
+# SPDX-License-Identifier: Apache-2.0
+
+from unittest import mock
+
+from sunbeam_migrate.utils import neutron_utils
+
+
+def test_router_interface_index():
+    session = mock.Mock()
+    session.network.subnets.return_value = [
+        mock.Mock(id="fake-subnet-0", network_id="fake-network-0"),
+        mock.Mock(id="fake-subnet-1", network_id="fake-network-0"),
+        mock.Mock(id="fake-subnet-2", network_id="fake-network-1"),
+    ]
+    interface_ports = {
+        "network:router_interface": [
+            mock.Mock(
+                device_id="fake-router-0",
+                fixed_ips=[
+                    {"subnet_id": "fake-subnet-0"},
+                    {"subnet_id": "fake-subnet-1"},
+                ],
+            ),
+        ],
+        "network:ha_router_replicated_interface": [
+            mock.Mock(
+                device_id="fake-router-1",
+                fixed_ips=[{"subnet_id": "fake-subnet-2"}],
+            ),
+        ],
+    }
+    session.network.ports.side_effect = lambda device_owner: interface_ports.get(
+        device_owner, []
+    )
+
+    index = neutron_utils.build_router_interface_index(session)
+
+    session.network.subnets.assert_called_once_with()
+    assert session.network.ports.call_count == len(
+        neutron_utils.ROUTER_INTERFACE_OWNERS
+    )
+    assert index.get_router_subnets("fake-router-0") == [
+        "fake-subnet-0",
+        "fake-subnet-1",
+    ]
+    assert index.get_router_subnets("fake-router-1") == ["fake-subnet-2"]
+    assert index.get_router_subnets("fake-router-2") == []
+    assert index.get_network_router("fake-network-0") == (
+        "fake-router-0",
+        "fake-subnet-0",
+    )
+    assert index.get_network_router("fake-network-1") == (
+        "fake-router-1",
+        "fake-subnet-2",
+    )
+    assert index.get_network_router("fake-network-2") == (None, None)
@@ -0,0 +1,110 @@
+# SPDX-FileCopyrightText: 2025 - Canonical Ltd
+# SPDX-License-Identifier: Apache-2.0
+
+import types
+from unittest import mock
+
+from sunbeam_migrate.handlers import base
+from sunbeam_migrate.handlers.neutron import security_group
+
+
+def _rule(rule_id, direction, protocol=None, port=None, remote_group_id=None):
+    return types.SimpleNamespace(
+        id=rule_id,
+        description=None,
+        direction=direction,
+        ether_type="IPv4",
+        port_range_min=port,
+        port_range_max=port,
+        protocol=protocol,
+        remote_ip_prefix=None,
+        remote_group_id=remote_group_id,
+        project_id="fake-project",
+    )
+
+
+@mock.patch.object(security_group.db_api, "get_migrations", return_value=[])
+@mock.patch.object(
+    security_group.SecurityGroupHandler,
+    "_destination_session",
+    new_callable=mock.PropertyMock,
+)
+@mock.patch.object(
+    security_group.SecurityGroupHandler,
+    "_source_session",
+    new_callable=mock.PropertyMock,
+)
+def test_perform_member_batch_migration(
+    mock_source_session, mock_destination_session, mock_get_migrations
+):
+    source_rules = [
+        _rule("fake-egress-rule", "egress"),
+        _rule("fake-ssh-rule", "ingress", "tcp", 22),
+        _rule("fake-self-rule", "ingress", remote_group_id="fake-sg"),
+        _rule("fake-remote-rule", "ingress", remote_group_id="fake-other-sg"),
+        _rule("fake-other-rule", "ingress", "tcp", 80),
+    ]
+    source_session = mock_source_session.return_value
+    source_session.network.security_group_rules.return_value = source_rules
+
+    # The default egress rule is created implicitly.
+    default_rule = mock.Mock(id="fake-dest-egress-rule", remote_group_id=None)
+    default_rule.to_dict.return_value = vars(_rule("fake-id", "egress"))
+    destination_session = mock_destination_session.return_value
+    destination_session.network.security_group_rules.return_value = [default_rule]
+    destination_session.network.create_security_group_rules.return_value = iter(
+        [mock.Mock(id="fake-dest-ssh-rule"), mock.Mock(id="fake-dest-self-rule")]
+    )
+
+    handler = security_group.SecurityGroupHandler()
+    migrated_rule_ids = handler.perform_member_batch_migration(
+        "fake-sg",
+        "fake-dest-sg",
+        [
+            base.Resource(resource_type="security-group-rule", source_id=rule_id)
+            for rule_id in (
+                "fake-egress-rule",
+                "fake-ssh-rule",
+                "fake-self-rule",
+                "fake-remote-rule",
+            )
+        ],
+        [
+            base.MigratedResource(
+                resource_type="project",
+                source_id="fake-project",
+                destination_id="fake-dest-project",
+            )
+        ],
+    )
+
+    # The rule referencing a security group that wasn't migrated yet is
+    # left to be migrated individually.
+    assert migrated_rule_ids == {
+        "fake-egress-rule": "fake-dest-egress-rule",
+        "fake-ssh-rule": "fake-dest-ssh-rule",
+        "fake-self-rule": "fake-dest-self-rule",
+    }
+    destination_session.network.create_security_group_rules.assert_called_once_with(
+        [
+            {
+                "direction": "ingress",
+                "ether_type": "IPv4",
+                "port_range_min": 22,
+                "port_range_max": 22,
+                "protocol": "tcp",
+                "project_id": "fake-dest-project",
+                "security_group_id": "fake-dest-sg",
+            },
+            {
+                "direction": "ingress",
+                "ether_type": "IPv4",
+                "project_id": "fake-dest-project",
+                "security_group_id": "fake-dest-sg",
+                "remote_group_id": "fake-dest-sg",
+            },
+        ]
+    )
+    mock_get_migrations.assert_called_once_with(
+        source_id="fake-other-sg", resource_type="security-group"
+    )
@@ -0,0 +1,163 @@
+# SPDX-FileCopyrightText: 2025 - Canonical Ltd
+# SPDX-License-Identifier: Apache-2.0
+
+import types
+from unittest import mock
+
+import pytest
+from openstack import exceptions as openstack_exc
+
+from sunbeam_migrate.db import api as db_api
+from sunbeam_migrate.db import session_utils
+from sunbeam_migrate.utils import status_poller
+
+
+def _server(server_id, status):
+    return types.SimpleNamespace(id=server_id, status=status)
+
+
+def test_status_poller():
+    poll_count = 0
+    server_count = 20
+
+    def _fake_servers(all_projects, status):
+        nonlocal poll_count
+        assert status == "BUILD"
+        poll_count += 1
+        # The servers finish building after a few polling cycles.
+        if poll_count >= 3:
+            return []
+        return [_server(f"fake-server-{idx}", "BUILD") for idx in range(server_count)]
+
+    def _fake_get_server(server_id):
+        if server_id == "fake-server-0":
+            raise openstack_exc.NotFoundException()
+        if server_id == "fake-server-1":
+            return _server(server_id, "ERROR")
+        return _server(server_id, "ACTIVE")
+
+    session = mock.Mock()
+    session.compute.servers.side_effect = _fake_servers
+    session.compute.get_server.side_effect = _fake_get_server
+
+    poller = status_poller.StatusPoller(min_interval=0.01, max_interval=0.05)
+    waiters = [
+        poller.register(
+            session, "instance", f"fake-server-{idx}", "ACTIVE", ["ERROR"], wait=10
+        )
+        for idx in range(server_count)
+    ]
+
+    with pytest.raises(openstack_exc.ResourceFailure):
+        waiters[0].result(timeout=10)
+    with pytest.raises(openstack_exc.ResourceFailure):
+        waiters[1].result(timeout=10)
+    for waiter in waiters[2:]:
+        assert waiter.result(timeout=10).status == "ACTIVE"
+
+    # One list request per polling cycle and one GET request per resource,
+    # once it's no longer building.
+    assert session.compute.servers.call_count == 3
+    assert session.compute.get_server.call_count == server_count
+    assert not poller.get_waiter_count()
+
+
+def test_status_poller_timeout():
+    session = mock.Mock()
+    session.load_balancer.load_balancers.side_effect = lambda provisioning_status: [
+        types.SimpleNamespace(id="fake-lb", provisioning_status=provisioning_status)
+    ]
+
+    poller = status_poller.StatusPoller(min_interval=0.01, max_interval=0.01)
+    with pytest.raises(openstack_exc.ResourceTimeout):
+        poller.wait_for_status(
+            session, "load-balancer", "fake-lb", "ACTIVE", ["ERROR"], wait=0.05
+        )
+    session.load_balancer.get_load_balancer.assert_not_called()
+
+
+def test_get_size_bucket():
+    assert status_poller.get_size_bucket(None) == 0
+    assert status_poller.get_size_bucket(1000) == 0
+    assert status_poller.get_size_bucket(status_poller.GiB) == 0
+    assert status_poller.get_size_bucket(status_poller.GiB + 1) == 1
+    assert status_poller.get_size_bucket(100 * status_poller.GiB) == 7
+
+
+def test_get_poll_interval():
+    def _get_interval(elapsed, expected, previous_interval=2):
+        return status_poller.get_poll_interval(
+            elapsed,
+            expected,
+            previous_interval,
+            min_interval=2,
+            max_interval=15,
+        )
+
+    # Unknown expected duration, backing off.
+    assert _get_interval(0, None) == 3
+    assert _get_interval(100, None, previous_interval=15) == 15
+    # Sparse polling for long operations, dense near the expected
+    # completion time.
+    assert _get_interval(0, 3600) == 360
+    assert _get_interval(3500, 3600) == 50
+    assert _get_interval(3599, 3600) == 2
+    # Short operations.
+    assert _get_interval(0, 10) == 5
+    # Overdue resources.
+    assert _get_interval(3700, 3600) == 3
+
+
+def test_wait_timing_history():
+    session_utils.initialize("sqlite://")
+    db_api.create_tables()
+
+    history = status_poller.WaitTimingHistory()
+    assert history.get_expected_duration("image", "volume-upload", 1) is None
+
+    for duration in (10, 20, 300):
+        history.record("image", "volume-upload", 1, duration)
+    history.record("image", "volume-upload", 2, 1000)
+    history.record("image", "web-download-import", 1, 1000)
+
+    assert history.get_expected_duration("image", "volume-upload", 1) == 20
+    # The timings are persisted.
+    history = status_poller.WaitTimingHistory()
+    assert history.get_expected_duration("image", "volume-upload", 1) == 20
+    # Different operations are tracked separately.
+    assert history.get_expected_duration("image", "web-download-import", 1) is None
+    assert history.get_expected_duration("instance", "volume-upload", 1) is None
+
+
+def test_wait_timing_history_pruning():
+    session_utils.initialize("sqlite://")
+    db_api.create_tables()
+
+    history = status_poller.WaitTimingHistory()
+    for duration in range(status_poller.TIMING_SAMPLE_COUNT + 5):
+        history.record("volume", "create", 1, duration)
+    history.record("volume", "create", 2, 1000)
+
+    timings = db_api.get_wait_timings("volume", "create", 1)
+    assert len(timings) == status_poller.TIMING_SAMPLE_COUNT
+    # The most recent timings are kept.
+    assert min(timing.duration_ms for timing in timings) == 5000
+    assert len(db_api.get_wait_timings("volume", "create", 2)) == 1
+
+
+def test_wait_timing_history_no_operation():
+    timing_history = mock.Mock()
+    poller = status_poller.StatusPoller(
+        min_interval=0.01, max_interval=0.01, timing_history=timing_history
+    )
+    session = mock.Mock()
+    session.block_storage.volumes.return_value = []
+    session.block_storage.get_volume.return_value = types.SimpleNamespace(
+        id="fake-volume", status="available"
+    )
+
+    poller.wait_for_status(session, "volume", "fake-volume", "available", wait=10)
+
+    # Waits without an operation are not used to estimate durations.
+    timing_history.get_expected_duration.assert_not_called()
+    timing_history.record.assert_not_called()
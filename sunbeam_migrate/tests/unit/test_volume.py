@@ -0,0 +1,63 @@
+# SPDX-FileCopyrightText: 2025 - Canonical Ltd
+# SPDX-License-Identifier: Apache-2.0
+
+from unittest import mock
+
+import pytest
+from openstack import exceptions as openstack_exc
+
+from sunbeam_migrate.handlers.cinder import volume
+
+
+@mock.patch.object(volume.VolumeHandler, "_wait_for_status")
+@mock.patch.object(
+    volume.VolumeHandler, "_source_session", new_callable=mock.PropertyMock
+)
+@mock.patch.object(volume, "CONF")
+def test_upload_source_volume_to_image(mock_conf, mock_source_session, mock_wait):
+    mock_conf.volume_upload_disk_format = "qcow2"
+    mock_conf.volume_upload_container_format = "compressed"
+    owner_session = mock.Mock()
+    upload = owner_session.block_storage.upload_volume_to_image
+    upload.side_effect = [
+        openstack_exc.BadRequestException("unsupported container format"),
+        {"image_id": "fake-image"},
+    ]
+    source_volume = mock.Mock(id="fake-volume", size=1)
+
+    handler = volume.VolumeHandler()
+    image = handler._upload_source_volume_to_image(owner_session, source_volume)
+
+    assert image == mock_source_session.return_value.get_image.return_value
+    # The default formats are used if the requested ones are rejected.
+    assert upload.call_args_list[0].kwargs == {
+        "force": True,
+        "disk_format": "qcow2",
+        "container_format": "compressed",
+    }
+    assert upload.call_args_list[1].kwargs == {"force": True}
+
+
+@mock.patch.object(volume.VolumeHandler, "_wait_for_status")
+@mock.patch.object(
+    volume.VolumeHandler, "_source_session", new_callable=mock.PropertyMock
+)
+@mock.patch.object(volume, "CONF")
+def test_upload_source_volume_to_image_unrelated_error(
+    mock_conf, mock_source_session, mock_wait
+):
+    mock_conf.volume_upload_disk_format = "qcow2"
+    mock_conf.volume_upload_container_format = "compressed"
+    owner_session = mock.Mock()
+    upload = owner_session.block_storage.upload_volume_to_image
+    upload.side_effect = openstack_exc.BadRequestException(
+        "Invalid volume: Volume status must be available or in-use."
+    )
+    source_volume = mock.Mock(id="fake-volume", size=1)
+
+    handler = volume.VolumeHandler()
+    with pytest.raises(openstack_exc.BadRequestException):
+        handler._upload_source_volume_to_image(owner_session, source_volume)
+
+    # Errors unrelated to the image formats are not retried.
+    upload.assert_called_once()
@@ -0,0 +1,158 @@
+# SPDX-FileCopyrightText: 2025 - Canonical Ltd
+# SPDX-License-Identifier: Apache-2.0
+
+import types
+from unittest import mock
+
+from openstack import exceptions as openstack_exc
+
+from sunbeam_migrate.handlers.designate import zone
+
+_ZONE_FILE = "$ORIGIN example.com.\nwww 300 IN A 10.0.0.1\n"
+
+
+def _recordset(name, type, records):
+    return types.SimpleNamespace(
+        name=name, type=type, records=records, ttl=300, description=None
+    )
+
+
+def _get_source_zone():
+    return types.SimpleNamespace(
+        id="fake-zone",
+        name="example.com.",
+        description="fake-description",
+        email="admin@example.com",
+        ttl=3600,
+        type="PRIMARY",
+        is_shared=False,
+        project_id="fake-project",
+    )
+
+
+def _setup_sessions(mock_source_session, mock_destination_session):
+    source_session = mock_source_session.return_value
+    source_session.dns.create_zone_export.return_value = mock.Mock(id="fake-export")
+    source_session.dns.get.return_value = mock.Mock(status_code=200, text=_ZONE_FILE)
+    source_session.dns.recordsets.return_value = [
+        _recordset("example.com.", "SOA", ["ns1.example.com. admin 1 2 3 4 5"]),
+        _recordset("www.example.com.", "A", ["10.0.0.1"]),
+        _recordset("mail.example.com.", "MX", ["10 mx.example.com."]),
+    ]
+
+    destination_session = mock_destination_session.return_value
+    destination_session.dns.find_zone.return_value = None
+    destination_session.dns.post.return_value = mock.Mock(status_code=202)
+    destination_session.dns.post.return_value.json.return_value = {"id": "fake-import"}
+    return source_session, destination_session
+
+
+@mock.patch.object(zone.ZoneHandler, "_wait_for_status")
+@mock.patch.object(
+    zone.ZoneHandler,
+    "_get_identity_build_kwargs",
+    mock.Mock(return_value={"project_id": "fake-project"}),
+)
+@mock.patch.object(
+    zone.ZoneHandler, "_destination_session", new_callable=mock.PropertyMock
+)
+@mock.patch.object(zone.ZoneHandler, "_source_session", new_callable=mock.PropertyMock)
+@mock.patch.object(zone.ZoneHandler, "_get_zone_all_projects")
+@mock.patch.object(zone, "CONF")
+def test_zone_import(
+    mock_conf,
+    mock_get_zone,
+    mock_source_session,
+    mock_destination_session,
+    mock_wait,
+):
+    mock_conf.multitenant_mode = False
+    mock_conf.dns_zone_import = True
+    mock_get_zone.return_value = _get_source_zone()
+    source_session, destination_session = _setup_sessions(
+        mock_source_session, mock_destination_session
+    )
+    # The MX record was rejected by the zone import.
+    destination_session.dns.recordsets.return_value = [
+        _recordset("example.com.", "SOA", ["ns1.example.com. admin 1 2 3 4 5"]),
+        _recordset("www.example.com.", "A", ["10.0.0.1"]),
+    ]
+    mock_wait.side_effect = [
+        mock.Mock(status="COMPLETE"),
+        mock.Mock(status="COMPLETE", zone_id="fake-dest-zone"),
+    ]
+
+    handler = zone.ZoneHandler()
+    dest_zone_id = handler.perform_individual_migration("fake-zone", [])
+
+    assert dest_zone_id == "fake-dest-zone"
+    destination_session.dns.post.assert_called_once_with(
+        "/zones/tasks/imports",
+        data=_ZONE_FILE.encode(),
+        headers={"Content-Type": "text/dns"},
+        raise_exc=False,
+    )
+    destination_session.dns.update_zone.assert_called_once_with(
+        "fake-dest-zone", description="fake-description"
+    )
+    destination_session.dns.create_zone.assert_not_called()
+    # Only the rejected recordset is created individually.
+    destination_session.dns.create_recordset.assert_called_once_with(
+        zone="fake-dest-zone",
+        name="mail.example.com.",
+        records=["10 mx.example.com."],
+        ttl=300,
+        type="MX",
+    )
+    destination_session.dns.delete_zone_import.assert_called_once_with(
+        "fake-import", ignore_missing=True
+    )
+    source_session.dns.delete.assert_called_once_with(
+        "/zones/tasks/exports/fake-export", raise_exc=False
+    )
+
+
+@mock.patch.object(zone.ZoneHandler, "_wait_for_status")
+@mock.patch.object(
+    zone.ZoneHandler,
+    "_get_identity_build_kwargs",
+    mock.Mock(return_value={"project_id": "fake-project"}),
+)
+@mock.patch.object(
+    zone.ZoneHandler, "_destination_session", new_callable=mock.PropertyMock
+)
+@mock.patch.object(zone.ZoneHandler, "_source_session", new_callable=mock.PropertyMock)
+@mock.patch.object(zone.ZoneHandler, "_get_zone_all_projects")
+@mock.patch.object(zone, "CONF")
+def test_zone_import_fallback(
+    mock_conf,
+    mock_get_zone,
+    mock_source_session,
+    mock_destination_session,
+    mock_wait,
+):
+    mock_conf.multitenant_mode = False
+    mock_conf.dns_zone_import = True
+    mock_get_zone.return_value = _get_source_zone()
+    _, destination_session = _setup_sessions(
+        mock_source_session, mock_destination_session
+    )
+    destination_session.dns.get_zone_import.return_value = mock.Mock(
+        zone_id="fake-failed-zone", message="invalid zone file"
+    )
+    destination_session.dns.create_zone.return_value = mock.Mock(id="fake-dest-zone")
+    mock_wait.side_effect = [
+        mock.Mock(status="COMPLETE"),
+        openstack_exc.ResourceFailure("zone import failed"),
+    ]
+
+    handler = zone.ZoneHandler()
+    dest_zone_id = handler.perform_individual_migration("fake-zone", [])
+
+    assert dest_zone_id == "fake-dest-zone"
+    destination_session.dns.delete_zone.assert_called_once_with(
+        "fake-failed-zone", ignore_missing=True
+    )
+    destination_session.dns.create_zone.assert_called_once()
+    # All the recordsets except the SOA are created individually.
+    assert destination_session.dns.create_recordset.call_count == 2
@@ -0,0 +1,91 @@
+# SPDX-FileCopyrightText: 2025 - Canonical Ltd
+# SPDX-License-Identifier: Apache-2.0
+
+import logging
+import threading
+import time
+import typing
+
+from sunbeam_migrate import config
+
+CONF = config.get_config()
+LOG = logging.getLogger()
+
+# Expired entries are purged when exceeding this number of entries.
+PURGE_THRESHOLD = 4096
+
+
+class ObjectCache:
+    """Thread-safe, TTL bounded object cache.
+
+    Used to avoid retrieving the same source resources multiple times
+    during a single run. Callers are expected to invalidate the entries
+    when modifying the cached resources.
+    """
+
+    def __init__(self, ttl: float):
+        self._ttl = ttl
+        self._entries: dict[tuple[str, str], tuple[float, typing.Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        kind: str,
+        resource_id: str,
+        fetch: typing.Callable[[], typing.Any],
+    ) -> typing.Any:
+        """Get the specified object, fetching it if missing or expired.
+
+        Empty results are not cached.
+        """
+        key = (kind, resource_id)
+        if self._ttl > 0:
+            with self._lock:
+                entry = self._entries.get(key)
+            if entry and entry[0] > time.monotonic():
+                return entry[1]
+
+        obj = fetch()
+        if obj and self._ttl > 0:
+            with self._lock:
+                if len(self._entries) >= PURGE_THRESHOLD:
+                    self._purge_expired()
+                self._entries[key] = (time.monotonic() + self._ttl, obj)
+        return obj
+
+    def invalidate(self, kind: str | None, resource_id: str):
+        """Invalidate a cached object.
+
+        If no kind is specified, all the objects having the specified id
+        are invalidated.
+        """
+        with self._lock:
+            if kind:
+                self._entries.pop((kind, resource_id), None)
+            else:
+                for key in list(self._entries):
+                    if key[1] == resource_id:
+                        self._entries.pop(key)
+
+    def clear(self):
+        """Remove all the cached objects."""
+        with self._lock:
+            self._entries.clear()
+
+    def _purge_expired(self):
+        # The caller is expected to hold the lock.
+        now = time.monotonic()
+        for key, (expires_at, _) in list(self._entries.items()):
+            if expires_at <= now:
+                self._entries.pop(key)
+
+
+_SOURCE_OBJECT_CACHE: ObjectCache | None = None
+
+
+def get_source_object_cache() -> ObjectCache:
+    """Retrieve the run-scoped source object cache."""
+    global _SOURCE_OBJECT_CACHE
+    if not _SOURCE_OBJECT_CACHE:
+        _SOURCE_OBJECT_CACHE = ObjectCache(ttl=CONF.source_object_cache_ttl)
+    return _SOURCE_OBJECT_CACHE
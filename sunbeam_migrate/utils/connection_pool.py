@@ -0,0 +1,201 @@
+# SPDX-FileCopyrightText: 2025 - Canonical Ltd
+# SPDX-License-Identifier: Apache-2.0
+
+import logging
+import os
+import threading
+import typing
+
+import openstack
+from keystoneauth1 import session as ks_session
+
+from sunbeam_migrate import config, constants, exception
+
+CONF = config.get_config()
+LOG = logging.getLogger()
+
+# The default "requests" connection pool size.
+DEFAULT_HTTP_POOL_SIZE = 10
+
+
+class ConnectionPool:
+    """Process-wide OpenStack connection registry.
+
+    Migration handlers are instantiated for every resource, dependency lookup
+    and cleanup. Creating a new OpenStack connection each time would imply
+    additional Keystone authentication requests and catalog fetches, so we're
+    sharing the connections across handlers instead.
+
+    The connections are keyed by cloud name and project scope. Expired tokens
+    are transparently renewed by keystoneauth, which also retries the requests
+    that fail with 401 after invalidating the token.
+    """
+
+    def __init__(self):
+        self._connections: dict[tuple, typing.Any] = {}
+        self._lock = threading.Lock()
+        self._http_pool_size = DEFAULT_HTTP_POOL_SIZE
+
+        # Used to serialize the role assignments and project scoped
+        # connection requests of a given project.
+        self._scope_locks: dict[tuple[str, str], threading.Lock] = {}
+        # Role assignments ensured as part of this run, mapped to a boolean
+        # stating whether the assignment was created by us.
+        self._role_grants: dict[tuple[str, str, str], bool] = {}
+
+    def get_connection(self, cloud_name: str):
+        """Get a connection for the specified cloud.
+
+        :param cloud_name: the cloud name, as defined in the cloud config file.
+        """
+        with self._lock:
+            return self._get_base_connection(cloud_name)
+
+    def get_owner_scoped_connection(
+        self, cloud_name: str, role_names: list[str], project_id: str
+    ):
+        """Get a connection scoped to the specified project.
+
+        The requested roles are assigned to the current user, if missing. The
+        role assignments and the resulting connections are cached, so that the
+        Keystone requests are issued only once per project.
+        """
+        key = (cloud_name, project_id, tuple(sorted(role_names)))
+        with self._get_scope_lock(cloud_name, project_id):
+            with self._lock:
+                connection = self._connections.get(key)
+            if connection:
+                return connection
+
+            base_connection = self.get_connection(cloud_name)
+            for role_name in role_names:
+                self._ensure_project_role(
+                    base_connection, cloud_name, role_name, project_id
+                )
+
+            LOG.debug("Connecting to %s as project %s.", cloud_name, project_id)
+            project = base_connection.identity.get_project(project_id)
+            connection = base_connection.connect_as_project(project)
+            with self._lock:
+                self._set_http_pool_size(connection)
+                self._connections[key] = connection
+            return connection
+
+    def _get_scope_lock(self, cloud_name: str, project_id: str) -> threading.Lock:
+        with self._lock:
+            return self._scope_locks.setdefault(
+                (cloud_name, project_id), threading.Lock()
+            )
+
+    def _ensure_project_role(
+        self, connection, cloud_name: str, role_name: str, project_id: str
+    ):
+        # The caller is expected to hold the project scope lock.
+        key = (cloud_name, project_id, role_name)
+        if key in self._role_grants:
+            return
+
+        LOG.debug(
+            "Ensuring that user %s has role %s in project %s.",
+            connection.current_user_id,
+            role_name,
+            project_id,
+        )
+        granted = connection.grant_role(
+            role_name,
+            user=connection.current_user_id,
+            project=project_id,
+            wait=True,
+        )
+        self._role_grants[key] = bool(granted)
+
+    def revoke_role_grants(self):
+        """Revoke the role assignments created as part of this run."""
+        with self._lock:
+            grants = [key for key, granted in self._role_grants.items() if granted]
+
+        for cloud_name, project_id, role_name in grants:
+            connection = self.get_connection(cloud_name)
+            LOG.info(
+                "Revoking temporary role assignment: cloud %s, project %s, role %s.",
+                cloud_name,
+                project_id,
+                role_name,
+            )
+            try:
+                connection.revoke_role(
+                    role_name,
+                    user=connection.current_user_id,
+                    project=project_id,
+                )
+                with self._lock:
+                    self._role_grants.pop((cloud_name, project_id, role_name), None)
+                    # Drop the project scoped connections, which may no longer
+                    # be authorized.
+                    for key in list(self._connections):
+                        if key[:2] == (cloud_name, project_id):
+                            self._connections.pop(key)
+            except Exception as ex:
+                LOG.warning(
+                    "Unable to revoke role %s from project %s: %r",
+                    role_name,
+                    project_id,
+                    ex,
+                )
+
+    def _get_base_connection(self, cloud_name: str):
+        # The caller is expected to hold the lock.
+        key = (cloud_name, None)
+        if key in self._connections:
+            return self._connections[key]
+
+        if not CONF.cloud_config_file:
+            raise exception.InvalidInput("No cloud config provided.")
+
+        LOG.debug("Connecting to cloud: %s", cloud_name)
+        os.environ["OS_CLIENT_CONFIG_FILE"] = str(CONF.cloud_config_file)
+        connection = openstack.connect(
+            cloud=cloud_name,
+            compute_api_version=constants.NOVA_MICROVERSION,
+            share_api_version=constants.MANILA_MICROVERSION,
+        )
+        self._set_http_pool_size(connection)
+        self._connections[key] = connection
+        return connection
+
+    def set_http_pool_size(self, workers: int):
+        """Size the HTTP connection pools based on the number of workers."""
+        with self._lock:
+            self._http_pool_size = max(DEFAULT_HTTP_POOL_SIZE, workers)
+            for connection in self._connections.values():
+                self._set_http_pool_size(connection)
+
+    def _set_http_pool_size(self, connection):
+        for scheme in ("https://", "http://"):
+            connection.session.mount(
+                scheme,
+                ks_session.TCPKeepAliveAdapter(
+                    pool_connections=self._http_pool_size,
+                    pool_maxsize=self._http_pool_size,
+                ),
+            )
+
+    def clear(self):
+        """Close and remove all the connections."""
+        with self._lock:
+            for connection in self._connections.values():
+                connection.close()
+            self._connections.clear()
+
+
+_CONNECTION_POOL: ConnectionPool | None = None
+_CONNECTION_POOL_LOCK = threading.Lock()
+
+
+def get_connection_pool() -> ConnectionPool:
+    """Retrieve the process-wide connection pool."""
+    global _CONNECTION_POOL
+    with _CONNECTION_POOL_LOCK:
+        if not _CONNECTION_POOL:
+            _CONNECTION_POOL = ConnectionPool()
+        return _CONNECTION_POOL
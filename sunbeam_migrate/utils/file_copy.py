@@ -0,0 +1,919 @@
+# SPDX-FileCopyrightText: 2025 - Canonical Ltd
+# SPDX-License-Identifier: Apache-2.0
+
+import contextlib
+import errno
+import hashlib
+import logging
+import os
+import shutil
+import sqlite3
+import stat
+import subprocess
+import sys
+import threading
+import time
+from collections.abc import Generator
+from concurrent import futures
+
+import click
+
+from sunbeam_migrate import exception
+
+LOG = logging.getLogger()
+
+MiB = 1024 * 1024
+# The maximum number of bytes transferred by a single copy_file_range or
+# sendfile call.
+DEFAULT_BUFFER_SIZE = 64 * MiB
+# The buffer size used when falling back to plain reads and writes.
+READ_WRITE_BUFFER_SIZE = MiB
+# Log the copy progress every N seconds.
+PROGRESS_REPORT_INTERVAL = 30
+# Limit the number of queued file copy tasks per worker. Directory
+# scanners will wait for the copy workers to catch up.
+QUEUED_FILES_PER_WORKER = 64
+# Errors that signal that a given copy method is unsupported for a pair of
+# files, in which case we'll fall back to the next method.
+UNSUPPORTED_COPY_ERRNOS = (errno.EXDEV, errno.ENOSYS, errno.EOPNOTSUPP, errno.EINVAL)
+# Extended attributes that aren't preserved, consistent with "cp".
+SKIPPED_XATTR_PREFIXES = ("system.", "security.selinux")
+# The number of manifest entries written at once.
+MANIFEST_BATCH_SIZE = 1000
+# The hash algorithm used for the file checksums recorded in manifests.
+CHECKSUM_ALGORITHM = "sha256"
+# The buffer size used when hashing files.
+CHECKSUM_BUFFER_SIZE = 4 * MiB
+
+
+def _copy_file_range(source_fd: int, destination_fd: int, count: int) -> int:
+    return os.copy_file_range(source_fd, destination_fd, count)
+
+
+def _sendfile(source_fd: int, destination_fd: int, count: int) -> int:
+    return os.sendfile(destination_fd, source_fd, None, count)
+
+
+def _read_write(source_fd: int, destination_fd: int, count: int) -> int:
+    data = memoryview(os.read(source_fd, min(count, READ_WRITE_BUFFER_SIZE)))
+    written = 0
+    while written < len(data):
+        written += os.write(destination_fd, data[written:])
+    return written
+
+
+def copy_file_data(source_fd: int, destination_fd: int, buffer_size: int) -> int:
+    """Copy the file contents, preferring in-kernel copies.
+
+    Falls back to sendfile and then plain reads and writes if
+    copy_file_range is not supported by the source and destination
+    filesystems. The copy starts at the current file offsets.
+
+    :param source_fd: the source file descriptor.
+    :param destination_fd: the destination file descriptor.
+    :param buffer_size: the maximum number of bytes copied at once.
+    :returns: the number of copied bytes.
+    """
+    copied = 0
+    for copy_func in (_copy_file_range, _sendfile, _read_write):
+        try:
+            while count := copy_func(source_fd, destination_fd, buffer_size):
+                copied += count
+            return copied
+        except OSError as exc:
+            if copy_func is _read_write or exc.errno not in UNSUPPORTED_COPY_ERRNOS:
+                raise
+            LOG.debug("%s unsupported, falling back: %r", copy_func.__name__, exc)
+    return copied
+
+
+def copy_file_data_with_checksum(
+    source_fd: int, destination_fd: int, buffer_size: int
+) -> tuple[int, str]:
+    """Copy the file contents while computing the file checksum.
+
+    The data is hashed in the same read pass, at the expense of passing
+    through userspace instead of using in-kernel copies.
+
+    :param source_fd: the source file descriptor.
+    :param destination_fd: the destination file descriptor.
+    :param buffer_size: the maximum number of bytes copied at once.
+    :returns: the number of copied bytes and the file checksum.
+    """
+    checksum = hashlib.new(CHECKSUM_ALGORITHM)
+    buffer = bytearray(min(buffer_size, CHECKSUM_BUFFER_SIZE))
+    view = memoryview(buffer)
+    copied = 0
+    while count := os.readv(source_fd, [buffer]):
+        checksum.update(view[:count])
+        written = 0
+        while written < count:
+            written += os.write(destination_fd, view[written:count])
+        copied += count
+    return copied, checksum.hexdigest()
+
+
+def get_file_checksum(path: str) -> tuple[int, str]:
+    """Hash the specified file.
+
+    :returns: the file size and checksum.
+    """
+    checksum = hashlib.new(CHECKSUM_ALGORITHM)
+    buffer = bytearray(CHECKSUM_BUFFER_SIZE)
+    view = memoryview(buffer)
+    size = 0
+    with open(path, "rb", buffering=0) as f:
+        while count := f.readinto(buffer):
+            checksum.update(view[:count])
+            size += count
+    return size, checksum.hexdigest()
+
+
+def copy_xattrs(source_path: str, destination_path: str):
+    """Copy the extended attributes of the specified file.
+
+    :param source_path: the source file path.
+    :param destination_path: the destination file path.
+    """
+    try:
+        names = os.listxattr(source_path, follow_symlinks=False)
+    except OSError as exc:
+        if exc.errno in (errno.EOPNOTSUPP, errno.ENODATA):
+            return
+        raise
+
+    for name in names:
+        if name.startswith(SKIPPED_XATTR_PREFIXES):
+            continue
+        try:
+            value = os.getxattr(source_path, name, follow_symlinks=False)
+        except OSError as exc:
+            # The attribute may have been removed in the meantime.
+            if exc.errno == errno.ENODATA:
+                continue
+            raise
+        os.setxattr(destination_path, name, value, follow_symlinks=False)
+
+
+class CopyStats:
+    """Thread-safe file copy counters."""
+
+    def __init__(self, action: str = "copied"):
+        self._action = action
+        self._lock = threading.Lock()
+        self._start_time = time.monotonic()
+        self.files = 0
+        self.bytes = 0
+        self.errors = 0
+        self.skipped = 0
+        self.removed = 0
+
+    def add(
+        self,
+        files: int = 0,
+        size: int = 0,
+        errors: int = 0,
+        skipped: int = 0,
+        removed: int = 0,
+    ):
+        """Update the copy counters."""
+        with self._lock:
+            self.files += files
+            self.bytes += size
+            self.errors += errors
+            self.skipped += skipped
+            self.removed += removed
+
+    def get_report(self) -> str:
+        """Describe the copy progress and throughput."""
+        elapsed = max(time.monotonic() - self._start_time, 0.001)
+        return (
+            f"{self.files} files ({self.bytes / MiB:.1f} MiB) {self._action} "
+            f"in {elapsed:.0f}s, {self.files / elapsed:.1f} files/s, "
+            f"{self.bytes / MiB / elapsed:.1f} MiB/s, unchanged: {self.skipped}, "
+            f"removed: {self.removed}, errors: {self.errors}"
+        )
+
+
+@contextlib.contextmanager
+def progress_reporter(
+    stats: CopyStats, operation: str, interval: float
+) -> Generator[None]:
+    """Periodically log the progress of the wrapped operation."""
+    stop_event = threading.Event()
+
+    def _report():
+        while not stop_event.wait(interval):
+            LOG.info("%s progress: %s", operation, stats.get_report())
+
+    reporter = threading.Thread(target=_report, daemon=True)
+    reporter.start()
+    try:
+        yield
+    finally:
+        stop_event.set()
+        reporter.join()
+
+
+def _get_manifest_entry(source_stat: os.stat_result) -> tuple:
+    # The ctime covers ownership, permission and xattr changes.
+    return (
+        stat.S_IFMT(source_stat.st_mode),
+        source_stat.st_size,
+        source_stat.st_mtime_ns,
+        source_stat.st_ctime_ns,
+        source_stat.st_ino,
+    )
+
+
+class FileManifest:
+    """Record the copied files, allowing subsequent incremental copies.
+
+    The manifest is a sqlite database that contains the relative path,
+    type, size, timestamps, inode and checksum of each copied file. Each
+    copy writes a new manifest, which replaces the previous one when
+    calling "save".
+    """
+
+    def __init__(self, path: str):
+        self._path = path
+        self._tmp_path = f"{path}.tmp"
+        self._lock = threading.Lock()
+        self._pending_entries: list[tuple] = []
+
+        if os.path.exists(self._tmp_path):
+            # Leftover from an interrupted copy.
+            os.unlink(self._tmp_path)
+        self._conn = sqlite3.connect(self._tmp_path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE entries (path TEXT PRIMARY KEY, type INTEGER, "
+            "size INTEGER, mtime_ns INTEGER, ctime_ns INTEGER, inode INTEGER, "
+            "checksum TEXT)"
+        )
+        self.has_previous = os.path.exists(path)
+        if self.has_previous:
+            self._conn.execute("ATTACH DATABASE ? AS previous", (path,))
+
+    def record_if_unchanged(
+        self, rel_path: str, source_stat: os.stat_result
+    ) -> tuple | None:
+        """Record the file using the previous entry if it didn't change.
+
+        Returns the recorded entry or None if the file changed.
+        """
+        if not self.has_previous:
+            return None
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT type, size, mtime_ns, ctime_ns, inode, checksum "
+                "FROM previous.entries WHERE path = ?",
+                (rel_path,),
+            ).fetchone()
+        if not row or row[:-1] != _get_manifest_entry(source_stat):
+            return None
+        entry = (rel_path, *row)
+        self._add_entry(entry)
+        return entry
+
+    def record(
+        self,
+        rel_path: str,
+        source_stat: os.stat_result,
+        checksum: str | None = None,
+        failed=False,
+    ):
+        """Record a copied file.
+
+        Failed copies are also recorded, ensuring that the file is copied
+        again or removed during the next pass.
+        """
+        entry = (rel_path, *_get_manifest_entry(source_stat), checksum)
+        if failed:
+            entry = (*entry[:2], -1, *entry[3:])
+        self._add_entry(entry)
+
+    def _add_entry(self, entry: tuple):
+        with self._lock:
+            self._pending_entries.append(entry)
+            if len(self._pending_entries) >= MANIFEST_BATCH_SIZE:
+                self._flush()
+
+    def _flush(self):
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?)",
+            self._pending_entries,
+        )
+        self._pending_entries = []
+
+    def get_removed_paths(self) -> list[str]:
+        """Get the files that were removed since the previous copy."""
+        if not self.has_previous:
+            return []
+        with self._lock:
+            self._flush()
+            rows = self._conn.execute(
+                "SELECT path FROM previous.entries WHERE path NOT IN "
+                "(SELECT path FROM main.entries) ORDER BY path"
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def discard(self):
+        """Drop the new manifest, keeping the previous one."""
+        with self._lock:
+            self._conn.close()
+        os.unlink(self._tmp_path)
+
+    def save(self):
+        """Replace the previous manifest."""
+        with self._lock:
+            self._flush()
+            self._conn.commit()
+            self._conn.close()
+        os.replace(self._tmp_path, self._path)
+
+        # Avoid leaving root owned files behind when using sudo.
+        sudo_uid = os.environ.get("SUDO_UID")
+        sudo_gid = os.environ.get("SUDO_GID")
+        if os.geteuid() == 0 and sudo_uid and sudo_gid:
+            os.chown(self._path, int(sudo_uid), int(sudo_gid))
+
+
+def get_manifest_entries(path: str) -> Generator[tuple[str, int, int, str | None]]:
+    """Read the path, type, size and checksum of the recorded files."""
+    conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        cursor = conn.execute("SELECT path, type, size, checksum FROM entries")
+        while rows := cursor.fetchmany(MANIFEST_BATCH_SIZE):
+            yield from rows
+    finally:
+        conn.close()
+
+
+class ParallelTreeCopier:
+    """Copy a directory tree using concurrent scanners and copy workers.
+
+    The ownership, permissions, timestamps, extended attributes, symlinks
+    and hardlinks are preserved. Copying the file ownership requires root
+    privileges.
+
+    Individual file failures are logged and the copy continues, raising an
+    exception once all the other files have been copied.
+
+    If a manifest path is specified, the copied files are recorded. The
+    next copy that uses the same manifest will only transfer the files
+    that changed in the meantime and delete the ones that were removed
+    from the source. The manifest is only updated if the copy succeeds.
+    If "checksums" is set, the file checksums are computed
+    while copying and recorded in the manifest, allowing the destination
+    files to be verified later on.
+    """
+
+    def __init__(
+        self,
+        source_dir: str,
+        destination_dir: str,
+        workers: int = 16,
+        scanners: int = 4,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        progress_interval: float = PROGRESS_REPORT_INTERVAL,
+        manifest_path: str | None = None,
+        checksums: bool = False,
+    ):
+        self._source_dir = source_dir
+        self._destination_dir = destination_dir
+        self._workers = max(1, workers)
+        self._scanners = max(1, scanners)
+        self._buffer_size = buffer_size
+        self._progress_interval = progress_interval
+
+        self._copy_slots = threading.BoundedSemaphore(
+            self._workers * QUEUED_FILES_PER_WORKER
+        )
+        self._pending_tasks = 0
+        self._pending_cond = threading.Condition()
+        self._lock = threading.Lock()
+        # Maps (st_dev, st_ino) to the first destination path of hardlinked
+        # files.
+        self._hardlink_targets: dict[tuple[int, int], str] = {}
+        # (source path, target, link path, source stat) tuples, the links
+        # are created once the files are copied.
+        self._hardlinks: list[tuple[str, str, str, os.stat_result]] = []
+        # The directory metadata is applied after the directory contents
+        # are copied, otherwise the timestamps would get updated and
+        # read-only directories couldn't be populated.
+        self._directories: list[tuple[str, str, os.stat_result]] = []
+        self._manifest_path = manifest_path
+        self._manifest: FileManifest | None = None
+        self._checksums = checksums
+        # The checksums of the copied hardlink targets.
+        self._hardlink_checksums: dict[str, str] = {}
+
+        self.stats = CopyStats()
+
+    def copy(self) -> CopyStats:
+        """Copy the source directory contents to the destination directory."""
+        LOG.info(
+            "Copying %s -> %s, workers: %s, scanners: %s",
+            self._source_dir,
+            self._destination_dir,
+            self._workers,
+            self._scanners,
+        )
+        if self._manifest_path:
+            self._manifest = FileManifest(self._manifest_path)
+            if self._manifest.has_previous:
+                LOG.info("Copying the files changed since the previous copy.")
+        self._directories.append(
+            (
+                self._source_dir,
+                self._destination_dir,
+                os.stat(self._source_dir, follow_symlinks=False),
+            )
+        )
+
+        with (
+            progress_reporter(self.stats, "Copy", self._progress_interval),
+            futures.ThreadPoolExecutor(max_workers=self._scanners) as scanner_pool,
+            futures.ThreadPoolExecutor(max_workers=self._workers) as copy_pool,
+        ):
+            self._scanner_pool = scanner_pool
+            self._copy_pool = copy_pool
+            self._submit(
+                scanner_pool,
+                self._scan_directory,
+                self._source_dir,
+                self._destination_dir,
+            )
+            with self._pending_cond:
+                self._pending_cond.wait_for(lambda: not self._pending_tasks)
+
+        self._create_hardlinks()
+        # The entries that couldn't be scanned are missing from the new
+        # manifest, so the deleted files are only removed and the manifest
+        # replaced if no errors occurred. Otherwise, the next pass copies
+        # the changed files again based on the previous manifest.
+        if self._manifest and not self.stats.errors:
+            # Before applying the directory metadata, which would otherwise
+            # get updated.
+            self._remove_deleted_files(self._manifest)
+        self._copy_directory_metadata()
+        if self._manifest:
+            if self.stats.errors:
+                self._manifest.discard()
+            else:
+                self._manifest.save()
+
+        LOG.info("Finished copying %s: %s", self._source_dir, self.stats.get_report())
+        if self.stats.errors:
+            raise exception.SunbeamMigrateException(
+                f"Failed to copy {self.stats.errors} file(s) from {self._source_dir}."
+            )
+        return self.stats
+
+    def _submit(self, pool: futures.ThreadPoolExecutor, func, *args):
+        with self._pending_cond:
+            self._pending_tasks += 1
+        pool.submit(self._run_task, func, *args)
+
+    def _run_task(self, func, *args):
+        try:
+            func(*args)
+        except Exception as exc:
+            LOG.exception("File copy task failed: %r", exc)
+            self.stats.add(errors=1)
+        finally:
+            with self._pending_cond:
+                self._pending_tasks -= 1
+                self._pending_cond.notify_all()
+
+    def _handle_error(self, path: str, exc: Exception):
+        LOG.error("Unable to copy %s: %r", path, exc)
+        self.stats.add(errors=1)
+
+    def _record(
+        self,
+        source_path: str,
+        source_stat: os.stat_result,
+        checksum: str | None = None,
+        failed=False,
+    ):
+        if self._manifest:
+            rel_path = os.path.relpath(source_path, self._source_dir)
+            self._manifest.record(
+                rel_path, source_stat, checksum=checksum, failed=failed
+            )
+
+    def _is_unchanged(
+        self, source_path: str, source_stat: os.stat_result, destination_path: str
+    ) -> bool:
+        if not self._manifest:
+            return False
+        rel_path = os.path.relpath(source_path, self._source_dir)
+        entry = self._manifest.record_if_unchanged(rel_path, source_stat)
+        if not entry:
+            return False
+
+        checksum = entry[-1]
+        if checksum and source_stat.st_nlink > 1:
+            # Unchanged hardlink target.
+            with self._lock:
+                self._hardlink_checksums[destination_path] = checksum
+        return True
+
+    def _scan_directory(self, source_dir: str, destination_dir: str):
+        try:
+            entries = list(os.scandir(source_dir))
+        except OSError as exc:
+            self._handle_error(source_dir, exc)
+            return
+
+        for entry in entries:
+            destination_path = os.path.join(destination_dir, entry.name)
+            try:
+                source_stat = entry.stat(follow_symlinks=False)
+                if stat.S_ISDIR(source_stat.st_mode):
+                    self._create_directory(destination_path)
+                    self._record(entry.path, source_stat)
+                    with self._lock:
+                        self._directories.append(
+                            (entry.path, destination_path, source_stat)
+                        )
+                    self._submit(
+                        self._scanner_pool,
+                        self._scan_directory,
+                        entry.path,
+                        destination_path,
+                    )
+                elif self._is_hardlink(entry.path, source_stat, destination_path):
+                    continue
+                elif self._is_unchanged(entry.path, source_stat, destination_path):
+                    self.stats.add(skipped=1)
+                elif stat.S_ISREG(source_stat.st_mode):
+                    # Apply backpressure, avoiding a large number of queued
+                    # tasks when copying millions of files.
+                    self._copy_slots.acquire()
+                    self._submit(
+                        self._copy_pool,
+                        self._copy_file,
+                        entry.path,
+                        destination_path,
+                        source_stat,
+                    )
+                elif stat.S_ISLNK(source_stat.st_mode):
+                    self._copy_symlink(entry.path, destination_path, source_stat)
+                else:
+                    self._copy_special_file(entry.path, destination_path, source_stat)
+            except OSError as exc:
+                self._handle_error(entry.path, exc)
+
+    def _create_directory(self, path: str):
+        try:
+            os.makedirs(path, exist_ok=True)
+        except FileExistsError:
+            # The source path used to be a file.
+            self._remove_existing(path)
+            os.makedirs(path)
+
+    def _is_hardlink(
+        self, source_path: str, source_stat: os.stat_result, destination_path: str
+    ) -> bool:
+        if source_stat.st_nlink < 2:
+            return False
+
+        key = (source_stat.st_dev, source_stat.st_ino)
+        with self._lock:
+            target = self._hardlink_targets.setdefault(key, destination_path)
+            if target == destination_path:
+                return False
+            self._hardlinks.append((source_path, target, destination_path, source_stat))
+            return True
+
+    def _copy_file(
+        self, source_path: str, destination_path: str, source_stat: os.stat_result
+    ):
+        try:
+            try:
+                destination_file = open(destination_path, "wb")
+            except IsADirectoryError:
+                # The source path used to be a directory.
+                self._remove_existing(destination_path)
+                destination_file = open(destination_path, "wb")
+            with open(source_path, "rb") as source_file, destination_file:
+                checksum = None
+                if self._checksums:
+                    copied, checksum = copy_file_data_with_checksum(
+                        source_file.fileno(),
+                        destination_file.fileno(),
+                        self._buffer_size,
+                    )
+                else:
+                    copied = copy_file_data(
+                        source_file.fileno(),
+                        destination_file.fileno(),
+                        self._buffer_size,
+                    )
+            self._copy_metadata(source_path, destination_path, source_stat)
+            self._record(source_path, source_stat, checksum=checksum)
+            if checksum and source_stat.st_nlink > 1:
+                with self._lock:
+                    self._hardlink_checksums[destination_path] = checksum
+            self.stats.add(files=1, size=copied)
+        except OSError as exc:
+            self._record(source_path, source_stat, failed=True)
+            self._handle_error(source_path, exc)
+        finally:
+            self._copy_slots.release()
+
+    def _copy_symlink(
+        self, source_path: str, destination_path: str, source_stat: os.stat_result
+    ):
+        link_target = os.readlink(source_path)
+        self._remove_existing(destination_path)
+        os.symlink(link_target, destination_path)
+        self._copy_metadata(source_path, destination_path, source_stat)
+        self._record(source_path, source_stat)
+        self.stats.add(files=1)
+
+    def _copy_special_file(
+        self, source_path: str, destination_path: str, source_stat: os.stat_result
+    ):
+        # FIFOs, sockets and device files.
+        self._remove_existing(destination_path)
+        os.mknod(destination_path, source_stat.st_mode, source_stat.st_rdev)
+        self._copy_metadata(source_path, destination_path, source_stat)
+        self._record(source_path, source_stat)
+        self.stats.add(files=1)
+
+    def _remove_existing(self, path: str):
+        try:
+            os.unlink(path)
+        except (FileNotFoundError, NotADirectoryError):
+            # Already removed along with the parent directory.
+            pass
+        except IsADirectoryError:
+            shutil.rmtree(path)
+
+    def _create_hardlinks(self):
+        for source_path, target, link_path, source_stat in self._hardlinks:
+            try:
+                self._remove_existing(link_path)
+                os.link(target, link_path, follow_symlinks=False)
+                self._record(
+                    source_path,
+                    source_stat,
+                    checksum=self._hardlink_checksums.get(target),
+                )
+                self.stats.add(files=1)
+            except OSError as exc:
+                self._record(source_path, source_stat, failed=True)
+                self._handle_error(link_path, exc)
+
+    def _remove_deleted_files(self, manifest: FileManifest):
+        for rel_path in manifest.get_removed_paths():
+            destination_path = os.path.join(self._destination_dir, rel_path)
+            try:
+                LOG.debug("Removing deleted file: %s", destination_path)
+                self._remove_existing(destination_path)
+                self.stats.add(removed=1)
+            except OSError as exc:
+                self._handle_error(destination_path, exc)
+
+    def _copy_directory_metadata(self):
+        # Handle the innermost directories first, otherwise the parent
+        # directory timestamps would get updated.
+        directories = sorted(
+            self._directories, key=lambda item: item[1].count(os.sep), reverse=True
+        )
+        for source_path, destination_path, source_stat in directories:
+            try:
+                self._copy_metadata(source_path, destination_path, source_stat)
+            except OSError as exc:
+                self._handle_error(source_path, exc)
+
+    def _copy_metadata(
+        self, source_path: str, destination_path: str, source_stat: os.stat_result
+    ):
+        is_symlink = stat.S_ISLNK(source_stat.st_mode)
+        os.chown(
+            destination_path,
+            source_stat.st_uid,
+            source_stat.st_gid,
+            follow_symlinks=False,
+        )
+        if not is_symlink:
+            # Changing the owner clears the setuid and setgid bits, so the
+            # permissions are set afterwards.
+            os.chmod(destination_path, stat.S_IMODE(source_stat.st_mode))
+            copy_xattrs(source_path, destination_path)
+        os.utime(
+            destination_path,
+            ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns),
+            follow_symlinks=False,
+        )
+
+
+class ParallelTreeVerifier:
+    """Verify the copied files using the checksums recorded in a manifest.
+
+    Only the destination files are read, the source is not accessed.
+    """
+
+    def __init__(
+        self,
+        destination_dir: str,
+        manifest_path: str,
+        workers: int = 16,
+        progress_interval: float = PROGRESS_REPORT_INTERVAL,
+    ):
+        self._destination_dir = destination_dir
+        self._manifest_path = manifest_path
+        self._workers = max(1, workers)
+        self._progress_interval = progress_interval
+
+        self.stats = CopyStats(action="verified")
+
+    def verify(self) -> CopyStats:
+        """Verify the destination directory contents."""
+        LOG.info(
+            "Verifying %s using manifest %s, workers: %s",
+            self._destination_dir,
+            self._manifest_path,
+            self._workers,
+        )
+        slots = threading.BoundedSemaphore(self._workers * QUEUED_FILES_PER_WORKER)
+        with (
+            progress_reporter(self.stats, "Verification", self._progress_interval),
+            futures.ThreadPoolExecutor(max_workers=self._workers) as pool,
+        ):
+            for entry in get_manifest_entries(self._manifest_path):
+                slots.acquire()
+                future = pool.submit(self._verify_file, *entry)
+                future.add_done_callback(lambda _: slots.release())
+
+        LOG.info(
+            "Finished verifying %s: %s",
+            self._destination_dir,
+            self.stats.get_report(),
+        )
+        if self.stats.errors:
+            raise exception.Invalid(
+                f"Failed to verify {self.stats.errors} file(s) "
+                f"from {self._destination_dir}."
+            )
+        return self.stats
+
+    def _verify_file(
+        self, rel_path: str, file_type: int, size: int, checksum: str | None
+    ):
+        path = os.path.join(self._destination_dir, rel_path)
+        try:
+            if size < 0:
+                raise exception.Invalid("the file copy failed")
+            if file_type != stat.S_IFREG:
+                if not os.path.lexists(path):
+                    raise exception.NotFound("missing file")
+                self.stats.add(files=1)
+                return
+
+            actual_size, actual_checksum = get_file_checksum(path)
+            if actual_size != size:
+                raise exception.Invalid(
+                    f"size mismatch, expected: {size}, actual: {actual_size}"
+                )
+            if checksum and actual_checksum != checksum:
+                raise exception.Invalid("checksum mismatch")
+            self.stats.add(files=1, size=actual_size)
+        except Exception as exc:
+            LOG.error("Unable to verify %s: %s", path, exc)
+            self.stats.add(errors=1)
+
+
+def _run_helper(args: list[str]):
+    # The helper process runs with elevated privileges.
+    cmd = ["sudo", sys.executable, "-m", __name__, *args]
+    LOG.debug("Running file copy helper: %s", cmd)
+    with subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+    ) as proc:
+        for line in proc.stdout or []:
+            LOG.info("%s", line.rstrip())
+    if proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
+
+
+def copy_tree(
+    source_dir: str,
+    destination_dir: str,
+    workers: int = 16,
+    scanners: int = 4,
+    manifest_path: str | None = None,
+    checksums: bool = False,
+):
+    """Copy a directory tree, preserving the file ownership and attributes.
+
+    Preserving the file ownership requires root privileges. If needed,
+    the copy is performed by a separate process using sudo.
+
+    :param source_dir: the source directory.
+    :param destination_dir: an existing destination directory.
+    :param workers: the number of concurrent file copy workers.
+    :param scanners: the number of concurrent directory scanners.
+    :param manifest_path: optional manifest used for incremental copies.
+    :param checksums: record the file checksums in the manifest.
+    """
+    if os.geteuid() == 0:
+        ParallelTreeCopier(
+            source_dir,
+            destination_dir,
+            workers=workers,
+            scanners=scanners,
+            manifest_path=manifest_path,
+            checksums=checksums,
+        ).copy()
+        return
+
+    args = ["copy", "--workers", str(workers), "--scanners", str(scanners)]
+    if manifest_path:
+        args += ["--manifest", manifest_path]
+    if checksums:
+        args.append("--checksums")
+    _run_helper([*args, source_dir, destination_dir])
+
+
+def verify_tree(destination_dir: str, manifest_path: str, workers: int = 16):
+    """Verify the copied files using the checksums recorded in a manifest.
+
+    Root privileges are required in order to read all the files. If needed,
+    the verification is performed by a separate process using sudo.
+
+    :param destination_dir: the destination directory.
+    :param manifest_path: the manifest recorded when copying the files.
+    :param workers: the number of concurrent verification workers.
+    """
+    if os.geteuid() == 0:
+        ParallelTreeVerifier(destination_dir, manifest_path, workers=workers).verify()
+        return
+
+    _run_helper(
+        [
+            "verify",
+            "--workers",
+            str(workers),
+            "--manifest",
+            manifest_path,
+            destination_dir,
+        ]
+    )
+
+
+@click.group()
+def main():
+    """Copy and verify directory trees."""
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+
+
+@main.command("copy")
+@click.option("--workers", type=int, default=16, help="File copy workers.")
+@click.option("--scanners", type=int, default=4, help="Directory scanners.")
+@click.option("--manifest", help="Manifest used for incremental copies.")
+@click.option("--checksums", is_flag=True, help="Record the file checksums.")
+@click.argument("source_dir")
+@click.argument("destination_dir")
+def copy_command(
+    workers: int,
+    scanners: int,
+    manifest: str | None,
+    checksums: bool,
+    source_dir: str,
+    destination_dir: str,
+):
+    """Copy a directory tree, preserving the file ownership and attributes."""
+    try:
+        ParallelTreeCopier(
+            source_dir,
+            destination_dir,
+            workers=workers,
+            scanners=scanners,
+            manifest_path=manifest,
+            checksums=checksums,
+        ).copy()
+    except Exception as exc:
+        LOG.error("%s", exc)
+        sys.exit(1)
+
+
+@main.command("verify")
+@click.option("--workers", type=int, default=16, help="Verification workers.")
+@click.option("--manifest", required=True, help="The file copy manifest.")
+@click.argument("destination_dir")
+def verify_command(workers: int, manifest: str, destination_dir: str):
+    """Verify the copied files using the checksums recorded in a manifest."""
+    try:
+        ParallelTreeVerifier(destination_dir, manifest, workers=workers).verify()
+    except Exception as exc:
+        LOG.error("%s", exc)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,277 @@
+# SPDX-FileCopyrightText: 2025 - Canonical Ltd
+# SPDX-License-Identifier: Apache-2.0
+
+import abc
+import errno
+import logging
+import os
+import shutil
+import struct
+import subprocess
+from pathlib import Path
+
+from sunbeam_migrate import exception
+
+LOG = logging.getLogger()
+
+# Zero runs smaller than this are written as regular data.
+ZERO_BLOCK_SIZE = 64 * 1024
+_ZERO_BLOCK = bytes(ZERO_BLOCK_SIZE)
+
+QCOW2_MAGIC = b"QFI\xfb"
+QCOW2_CLUSTER_BITS = 16
+QCOW2_CLUSTER_SIZE = 1 << QCOW2_CLUSTER_BITS
+# Set for clusters with a refcount of exactly 1.
+QCOW2_OFLAG_COPIED = 1 << 63
+# 16 bit refcounts (refcount_order 4), the only option for qcow2 v2.
+QCOW2_REFCOUNT_ENTRY_SIZE = 2
+
+
+def is_zero_block(data: bytes | memoryview) -> bool:
+    """Check whether the specified data contains only zeroes."""
+    if len(data) == ZERO_BLOCK_SIZE:
+        return data == _ZERO_BLOCK
+    return data == bytes(len(data))
+
+
+def write_sparse(file_obj, data: bytes | memoryview):
+    """Write the specified data, skipping zero blocks.
+
+    The zero blocks are seeked over, leaving holes in the file. The caller
+    is expected to truncate the file to the final size since trailing holes
+    don't extend the file.
+    """
+    view = memoryview(data)
+    for offset in range(0, len(view), ZERO_BLOCK_SIZE):
+        block = view[offset : offset + ZERO_BLOCK_SIZE]
+        if is_zero_block(block):
+            file_obj.seek(len(block), 1)
+        else:
+            file_obj.write(block)
+
+
+class ImageConverter(abc.ABC):
+    """Convert raw disk images to sparse qcow2 images."""
+
+    @abc.abstractmethod
+    def convert(self, source_path: Path, destination_path: Path):
+        """Convert the specified raw image to qcow2."""
+        pass
+
+
+class QemuImgConverter(ImageConverter):
+    """Convert images using qemu-img."""
+
+    def convert(self, source_path: Path, destination_path: Path):
+        """Convert the specified raw image to qcow2."""
+        cmd = [
+            "qemu-img",
+            "convert",
+            "-f",
+            "raw",
+            "-O",
+            "qcow2",
+            str(source_path),
+            str(destination_path),
+        ]
+        LOG.debug("Converting image: %s", cmd)
+        subprocess.check_call(cmd)
+
+
+class PythonQcow2Converter(ImageConverter):
+    """Pure Python qcow2 (version 2) writer.
+
+    Zero clusters are left unallocated. The source image is read twice:
+    once to identify the allocated clusters and once to copy them.
+
+    Output layout: header, L1 table, refcount table, refcount blocks,
+    L2 tables, data clusters.
+    """
+
+    def convert(self, source_path: Path, destination_path: Path):
+        """Convert the specified raw image to qcow2."""
+        virtual_size = source_path.stat().st_size
+        data_clusters = self._get_data_clusters(source_path)
+
+        l2_entries = QCOW2_CLUSTER_SIZE // 8
+        l1_size = max(1, -(-virtual_size // (QCOW2_CLUSTER_SIZE * l2_entries)))
+        l1_clusters = self._size_to_clusters(l1_size * 8)
+        l2_tables = sorted({cluster // l2_entries for cluster in data_clusters})
+
+        # The refcount structures have to cover themselves as well.
+        refcount_entries = QCOW2_CLUSTER_SIZE // QCOW2_REFCOUNT_ENTRY_SIZE
+        refcount_table_clusters = 1
+        refcount_blocks = 1
+        while True:
+            total_clusters = (
+                1
+                + l1_clusters
+                + refcount_table_clusters
+                + refcount_blocks
+                + len(l2_tables)
+                + len(data_clusters)
+            )
+            needed_blocks = -(-total_clusters // refcount_entries)
+            needed_table_clusters = self._size_to_clusters(needed_blocks * 8)
+            if (needed_blocks, needed_table_clusters) == (
+                refcount_blocks,
+                refcount_table_clusters,
+            ):
+                break
+            refcount_blocks = max(refcount_blocks, needed_blocks)
+            refcount_table_clusters = max(
+                refcount_table_clusters, needed_table_clusters
+            )
+
+        l1_offset = QCOW2_CLUSTER_SIZE
+        refcount_table_offset = l1_offset + l1_clusters * QCOW2_CLUSTER_SIZE
+        refcount_blocks_offset = (
+            refcount_table_offset + refcount_table_clusters * QCOW2_CLUSTER_SIZE
+        )
+        l2_offset = refcount_blocks_offset + refcount_blocks * QCOW2_CLUSTER_SIZE
+        data_offset = l2_offset + len(l2_tables) * QCOW2_CLUSTER_SIZE
+
+        header = struct.pack(
+            ">4sIQIIQIIQQIIQ",
+            QCOW2_MAGIC,
+            2,  # version
+            0,  # backing file offset
+            0,  # backing file size
+            QCOW2_CLUSTER_BITS,
+            virtual_size,
+            0,  # encryption method
+            l1_size,
+            l1_offset,
+            refcount_table_offset,
+            refcount_table_clusters,
+            0,  # snapshot count
+            0,  # snapshots offset
+        )
+
+        l1_table = bytearray(l1_clusters * QCOW2_CLUSTER_SIZE)
+        l2_table_offsets = {}
+        for idx, l2_idx in enumerate(l2_tables):
+            l2_table_offsets[l2_idx] = l2_offset + idx * QCOW2_CLUSTER_SIZE
+            struct.pack_into(
+                ">Q",
+                l1_table,
+                l2_idx * 8,
+                l2_table_offsets[l2_idx] | QCOW2_OFLAG_COPIED,
+            )
+
+        refcount_table = bytearray(refcount_table_clusters * QCOW2_CLUSTER_SIZE)
+        for idx in range(refcount_blocks):
+            struct.pack_into(
+                ">Q",
+                refcount_table,
+                idx * 8,
+                refcount_blocks_offset + idx * QCOW2_CLUSTER_SIZE,
+            )
+        refcounts = bytearray(refcount_blocks * QCOW2_CLUSTER_SIZE)
+        for cluster in range(total_clusters):
+            struct.pack_into(">H", refcounts, cluster * QCOW2_REFCOUNT_ENTRY_SIZE, 1)
+
+        LOG.debug(
+            "Converting %s to qcow2, allocated clusters: %s",
+            source_path,
+            len(data_clusters),
+        )
+        with (
+            source_path.open("rb") as source,
+            destination_path.open("wb") as destination,
+        ):
+            destination.write(header.ljust(QCOW2_CLUSTER_SIZE, b"\0"))
+            destination.write(l1_table)
+            destination.write(refcount_table)
+            destination.write(refcounts)
+
+            # The L2 tables are written one by one to limit the memory usage.
+            data_cluster_idx = 0
+            for l2_idx in l2_tables:
+                l2_table = bytearray(QCOW2_CLUSTER_SIZE)
+                while (
+                    data_cluster_idx < len(data_clusters)
+                    and data_clusters[data_cluster_idx] // l2_entries == l2_idx
+                ):
+                    cluster = data_clusters[data_cluster_idx]
+                    struct.pack_into(
+                        ">Q",
+                        l2_table,
+                        (cluster % l2_entries) * 8,
+                        (data_offset + data_cluster_idx * QCOW2_CLUSTER_SIZE)
+                        | QCOW2_OFLAG_COPIED,
+                    )
+                    data_cluster_idx += 1
+                destination.write(l2_table)
+
+            for cluster in data_clusters:
+                source.seek(cluster * QCOW2_CLUSTER_SIZE)
+                data = source.read(QCOW2_CLUSTER_SIZE)
+                destination.write(data.ljust(QCOW2_CLUSTER_SIZE, b"\0"))
+
+    @staticmethod
+    def _size_to_clusters(size: int) -> int:
+        return max(1, -(-size // QCOW2_CLUSTER_SIZE))
+
+    def _get_data_clusters(self, path: Path) -> list[int]:
+        """Get the indexes of the non-zero clusters."""
+        data_clusters: list[int] = []
+        with path.open("rb") as image_file:
+            for start, end in _get_data_extents(image_file):
+                first_cluster = start // QCOW2_CLUSTER_SIZE
+                if data_clusters and data_clusters[-1] >= first_cluster:
+                    first_cluster = data_clusters[-1] + 1
+                last_cluster = -(-end // QCOW2_CLUSTER_SIZE)
+                for cluster in range(first_cluster, last_cluster):
+                    image_file.seek(cluster * QCOW2_CLUSTER_SIZE)
+                    if not is_zero_block(image_file.read(QCOW2_CLUSTER_SIZE)):
+                        data_clusters.append(cluster)
+        return data_clusters
+
+
+def _get_data_extents(file_obj) -> list[tuple[int, int]]:
+    """Get the (start, end) offsets of the file regions that aren't holes.
+
+    Returns a single extent covering the whole file if the filesystem
+    doesn't support SEEK_DATA/SEEK_HOLE.
+    """
+    fd = file_obj.fileno()
+    size = os.fstat(fd).st_size
+    if not hasattr(os, "SEEK_DATA"):
+        return [(0, size)]
+
+    extents = []
+    offset = 0
+    while offset < size:
+        try:
+            start = os.lseek(fd, offset, os.SEEK_DATA)
+        except OSError as ex:
+            if ex.errno == errno.ENXIO:
+                # No more data.
+                break
+            if ex.errno == errno.EINVAL:
+                return [(0, size)]
+            raise
+        end = os.lseek(fd, start, os.SEEK_HOLE)
+        extents.append((start, end))
+        offset = end
+    return extents
+
+
+IMAGE_CONVERTERS: dict[str, type[ImageConverter]] = {
+    "qemu-img": QemuImgConverter,
+    "python": PythonQcow2Converter,
+}
+
+
+def get_image_converter(name: str = "auto") -> ImageConverter:
+    """Get the requested image converter.
+
+    "auto" selects qemu-img if available, falling back to the pure Python
+    implementation.
+    """
+    if name == "auto":
+        name = "qemu-img" if shutil.which("qemu-img") else "python"
+    if name not in IMAGE_CONVERTERS:
+        raise exception.InvalidInput(f"Unknown image converter: {name}")
+    return IMAGE_CONVERTERS[name]()
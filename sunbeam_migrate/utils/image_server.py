@@ -0,0 +1,148 @@
+# SPDX-FileCopyrightText: 2025 - Canonical Ltd
+# SPDX-License-Identifier: Apache-2.0
+
+import http.server
+import logging
+import secrets
+import socket
+import threading
+import time
+from typing import Callable, Iterable
+
+LOG = logging.getLogger()
+
+
+class ImageServer:
+    """Expose image data through a short-lived HTTP endpoint.
+
+    Used along with the Glance "web-download" import method, allowing the
+    destination cloud to pull the image data.
+
+    The web-download method doesn't support authentication headers, so the
+    data is served at a random, unguessable path that expires after the
+    specified interval. The path may only be fetched once, so that each
+    import retrieves the image from the source cloud once. The server is
+    stopped when leaving the context.
+
+    Note that the data is served over plain HTTP and still flows through
+    this host.
+    """
+
+    def __init__(
+        self,
+        data_factory: Callable[[], Iterable[bytes | memoryview]],
+        bind_address: str,
+        size: int | None = None,
+        port: int = 0,
+        public_url: str | None = None,
+        expiry: int = 3600,
+    ):
+        """Initialize the image server.
+
+        :param data_factory: returns a new iterable of image data chunks,
+            called for each request.
+        :param bind_address: the address to listen on.
+        :param size: the image size, if known.
+        :param port: the port to listen on, 0 selects a random port.
+        :param public_url: the base URL used by the destination cloud to
+            reach this server. Defaults to the bind address (or the host FQDN
+            if listening on all interfaces) and the listen port.
+        :param expiry: the number of seconds after which the image URL
+            is no longer served.
+        """
+        self._data_factory = data_factory
+        self._size = size
+        self._bind_address = bind_address
+        self._port = port
+        self._public_url = public_url
+        self._expiry = expiry
+
+        self._token = secrets.token_urlsafe(32)
+        self._expires_at = 0.0
+        self._served = False
+        self._lock = threading.Lock()
+        self._server: http.server.ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def path(self) -> str:
+        """The URL path of the image data."""
+        return f"/images/{self._token}"
+
+    @property
+    def url(self) -> str:
+        """The URL used by the destination cloud to fetch the image."""
+        if not self._server:
+            raise RuntimeError("The image server is not running.")
+        base_url = self._public_url
+        if not base_url:
+            host = self._bind_address
+            if host in ("", "0.0.0.0", "::"):  # noqa: S104
+                host = socket.getfqdn()
+            elif ":" in host:
+                host = f"[{host}]"
+            base_url = f"http://{host}:{self._server.server_port}"
+        return base_url.rstrip("/") + self.path
+
+    def start(self):
+        """Start serving the image data."""
+        self._expires_at = time.monotonic() + self._expiry
+        self._server = http.server.ThreadingHTTPServer(
+            (self._bind_address, self._port), self._get_request_handler()
+        )
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        LOG.debug("Serving image data on port %s.", self._server.server_port)
+
+    def stop(self):
+        """Stop serving the image data."""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        """Start the server when entering the context."""
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Stop the server when leaving the context."""
+        self.stop()
+
+    def _claim_request(self, path: str) -> bool:
+        """Check whether the request may be served, invalidating the path."""
+        if not secrets.compare_digest(path, self.path):
+            return False
+        with self._lock:
+            if self._served or time.monotonic() >= self._expires_at:
+                return False
+            self._served = True
+            return True
+
+    def _get_request_handler(self):
+        image_server = self
+
+        class _RequestHandler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                if not image_server._claim_request(self.path):
+                    self.send_error(404)
+                    return
+
+                LOG.debug("Serving image data to %s.", self.client_address[0])
+                self.send_response(200)
+                self.send_header("Content-Type", "application/octet-stream")
+                if image_server._size is not None:
+                    self.send_header("Content-Length", str(image_server._size))
+                self.end_headers()
+                for chunk in image_server._data_factory():
+                    self.wfile.write(chunk)
+
+            def log_message(self, format, *args):
+                LOG.debug("Image server: " + format, *args)
+
+        return _RequestHandler
@@ -0,0 +1,503 @@
+# SPDX-FileCopyrightText: 2025 - Canonical Ltd
+# SPDX-License-Identifier: Apache-2.0
+
+import hashlib
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from concurrent import futures
+from pathlib import Path
+
+from openstack import exceptions as openstack_exc
+from openstack import utils as openstack_utils
+
+from sunbeam_migrate import exception
+from sunbeam_migrate.utils import image_conversion
+
+LOG = logging.getLogger()
+
+# Log the pipeline stage depths every N chunks.
+PIPELINE_REPORT_INTERVAL = 32
+
+
+def _get_image_data_url(image) -> str:
+    return openstack_utils.urljoin(image.base_path, image.id, "file")
+
+
+def supports_range_requests(session, image) -> bool:
+    """Check whether Glance accepts ranged image downloads.
+
+    :param session: the Openstack session used to download the image.
+    :param image: the Glance image.
+    """
+    # The response is streamed and closed without reading the body, which
+    # may contain the whole image if the range is ignored.
+    response = session.image.get(
+        _get_image_data_url(image), headers={"Range": "bytes=0-0"}, stream=True
+    )
+    try:
+        openstack_exc.raise_from_response(response)
+        return response.status_code == 206
+    finally:
+        response.close()
+
+
+class ImageHashes:
+    """Compute and validate the image checksum and multihash."""
+
+    def __init__(self, image):
+        self._image = image
+        self._md5 = hashlib.md5(usedforsecurity=False)
+        self._multihash = None
+        if image.hash_algo and image.hash_value:
+            try:
+                self._multihash = hashlib.new(image.hash_algo)
+            except ValueError:
+                LOG.warning(
+                    "Unsupported image hash algorithm: %s, skipping multihash "
+                    "validation.",
+                    image.hash_algo,
+                )
+
+    @property
+    def checksum(self) -> str:
+        """The MD5 checksum of the data hashed so far."""
+        return self._md5.hexdigest()
+
+    def update(self, data: bytes | memoryview):
+        """Hash the specified image data."""
+        self._md5.update(data)
+        if self._multihash:
+            self._multihash.update(data)
+
+    def validate(self):
+        """Compare the computed hashes with the ones reported by Glance."""
+        if self._image.checksum and self._md5.hexdigest() != self._image.checksum:
+            raise exception.Invalid("Checksum mismatch in downloaded image.")
+        if self._multihash and self._multihash.hexdigest() != self._image.hash_value:
+            raise exception.Invalid("Multihash mismatch in downloaded image.")
+
+
+class ParallelImageReader:
+    """Download a Glance image using concurrent ranged requests.
+
+    The image chunks are retrieved by multiple threads into a bounded buffer
+    ring and yielded in order, allowing the data to be streamed to the
+    destination. At most "ring_size" chunks are kept in memory.
+
+    The image hashes are validated once all the chunks are read.
+    """
+
+    def __init__(
+        self,
+        session,
+        image,
+        chunk_size: int,
+        streams: int,
+        ring_size: int,
+    ):
+        if not chunk_size:
+            raise exception.InvalidInput("No image transfer chunk size provided.")
+        if not image.size:
+            raise exception.InvalidInput(f"Unknown image size: {image.id}")
+
+        self._session = session
+        self._image = image
+        self._chunk_size = chunk_size
+        self._streams = max(1, streams)
+        self._ring_size = max(1, ring_size)
+        self._chunk_count = -(-image.size // chunk_size)
+
+        self._cond = threading.Condition()
+        self._chunks: dict[int, bytes] = {}
+        self._next_chunk = 0
+        self._consumed_chunks = 0
+        self._error: Exception | None = None
+        self._stopped = False
+
+    def __iter__(self):
+        """Yield the image chunks in order."""
+        hashes = ImageHashes(self._image)
+        with futures.ThreadPoolExecutor(max_workers=self._streams) as executor:
+            for idx in range(self._streams):
+                executor.submit(self._download_worker)
+            try:
+                for chunk_idx in range(self._chunk_count):
+                    chunk = self._get_chunk(chunk_idx)
+                    hashes.update(chunk)
+                    yield chunk
+            finally:
+                with self._cond:
+                    self._stopped = True
+                    self._chunks.clear()
+                    self._cond.notify_all()
+        hashes.validate()
+
+    def _get_chunk(self, chunk_idx: int) -> bytes:
+        with self._cond:
+            self._cond.wait_for(lambda: chunk_idx in self._chunks or self._error)
+            if self._error:
+                raise self._error
+            chunk = self._chunks.pop(chunk_idx)
+            self._consumed_chunks = chunk_idx + 1
+            # Allow the workers to fetch subsequent chunks.
+            self._cond.notify_all()
+            return chunk
+
+    def _can_fetch(self) -> bool:
+        # The caller is expected to hold the lock.
+        return bool(
+            self._stopped
+            or self._error
+            or self._next_chunk >= self._chunk_count
+            or self._next_chunk < self._consumed_chunks + self._ring_size
+        )
+
+    def _download_worker(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(self._can_fetch)
+                if (
+                    self._stopped
+                    or self._error
+                    or self._next_chunk >= self._chunk_count
+                ):
+                    return
+                chunk_idx = self._next_chunk
+                self._next_chunk += 1
+
+            try:
+                chunk = self._download_chunk(chunk_idx)
+            except Exception as ex:
+                LOG.error("Unable to download image chunk %s: %r", chunk_idx, ex)
+                with self._cond:
+                    self._error = self._error or ex
+                    self._cond.notify_all()
+                return
+
+            with self._cond:
+                if not self._stopped:
+                    self._chunks[chunk_idx] = chunk
+                self._cond.notify_all()
+
+    def _download_chunk(self, chunk_idx: int) -> bytes:
+        start = chunk_idx * self._chunk_size
+        end = min(start + self._chunk_size, self._image.size) - 1
+        response = self._session.image.get(
+            _get_image_data_url(self._image),
+            headers={"Range": f"bytes={start}-{end}"},
+        )
+        openstack_exc.raise_from_response(response)
+        if response.status_code != 206:
+            raise exception.NotSupported(
+                "The image service doesn't support ranged downloads."
+            )
+
+        chunk = response.content
+        if len(chunk) != end - start + 1:
+            raise exception.Invalid(
+                f"Unexpected image chunk size. Range: {start}-{end}, "
+                f"received: {len(chunk)} bytes."
+            )
+        return chunk
+
+
+_END = object()
+
+
+class PipelinedImageReader:
+    """Download a Glance image using a producer/consumer pipeline.
+
+    A reader thread downloads the image into a pool of reusable buffers, which
+    are then passed to a hashing thread and finally yielded to the consumer
+    (the upload request). This prevents source latency spikes from stalling
+    the upload and moves the hashing out of the upload thread.
+
+    The memory usage is bounded by "buffer_count" * "chunk_size".
+    """
+
+    def __init__(self, session, image, chunk_size: int, buffer_count: int):
+        if not chunk_size:
+            raise exception.InvalidInput("No image transfer chunk size provided.")
+
+        self._session = session
+        self._image = image
+        self._chunk_size = chunk_size
+
+        self._free_buffers: queue.Queue = queue.Queue()
+        for idx in range(max(2, buffer_count)):
+            self._free_buffers.put(bytearray(chunk_size))
+        self._download_queue: queue.Queue = queue.Queue()
+        self._upload_queue: queue.Queue = queue.Queue()
+        self._hashes = ImageHashes(image)
+        self._stopped = threading.Event()
+        self._response = None
+
+    def get_stage_depths(self) -> dict[str, int]:
+        """Get the number of buffers waiting for each pipeline stage."""
+        return {
+            "download": self._free_buffers.qsize(),
+            "hash": self._download_queue.qsize(),
+            "upload": self._upload_queue.qsize(),
+        }
+
+    def __iter__(self):
+        """Yield the image data, validating the hashes at the end."""
+        self._response = self._session.image.download_image(self._image, stream=True)
+        reader = threading.Thread(target=self._reader_worker, daemon=True)
+        hasher = threading.Thread(target=self._hashing_worker, daemon=True)
+        reader.start()
+        hasher.start()
+
+        chunk_count = 0
+        previous_buffer = None
+        try:
+            while True:
+                item = self._upload_queue.get()
+                # The previous chunk was sent by the time the consumer requests
+                # the next one, so we can reuse its buffer.
+                if previous_buffer:
+                    self._free_buffers.put(previous_buffer)
+                    previous_buffer = None
+                if item is _END:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+
+                buffer, length = item
+                chunk_count += 1
+                if not chunk_count % PIPELINE_REPORT_INTERVAL:
+                    LOG.debug(
+                        "Image %s: transferred %s chunks, pipeline stage depths: %s",
+                        self._image.id,
+                        chunk_count,
+                        self.get_stage_depths(),
+                    )
+                yield memoryview(buffer)[:length]
+                previous_buffer = buffer
+        finally:
+            self._stopped.set()
+            self._response.close()
+        self._hashes.validate()
+
+    def _get_free_buffer(self) -> bytearray | None:
+        while not self._stopped.is_set():
+            try:
+                return self._free_buffers.get(timeout=1)
+            except queue.Empty:
+                continue
+        return None
+
+    def _reader_worker(self):
+        try:
+            raw = self._response.raw
+            while True:
+                buffer = self._get_free_buffer()
+                if buffer is None:
+                    break
+
+                view = memoryview(buffer)
+                length = 0
+                while length < self._chunk_size:
+                    read = raw.readinto(view[length:])
+                    if not read:
+                        break
+                    length += read
+
+                if not length:
+                    self._free_buffers.put(buffer)
+                    break
+                self._download_queue.put((buffer, length))
+            self._download_queue.put(_END)
+        except Exception as ex:
+            if not self._stopped.is_set():
+                LOG.error("Unable to download image %s: %r", self._image.id, ex)
+            self._download_queue.put(ex)
+
+    def _hashing_worker(self):
+        while True:
+            item = self._download_queue.get()
+            if item is not _END and not isinstance(item, Exception):
+                buffer, length = item
+                self._hashes.update(memoryview(buffer)[:length])
+            self._upload_queue.put(item)
+            if item is _END or isinstance(item, Exception):
+                return
+
+
+def get_file_checksum(path: Path, chunk_size: int = 1024 * 1024) -> str:
+    """Get the MD5 checksum of the specified file."""
+    md5 = hashlib.md5(usedforsecurity=False)
+    with path.open("rb") as file_obj:
+        while chunk := file_obj.read(chunk_size):
+            md5.update(chunk)
+    return md5.hexdigest()
+
+
+def retry_on_failure(func, retries: int, description: str):
+    """Call the specified function, retrying on failure.
+
+    Checksum mismatches are not retried.
+    """
+    for attempt in range(retries + 1):
+        try:
+            return func()
+        except exception.Invalid:
+            raise
+        except Exception as ex:
+            if attempt >= retries:
+                raise
+            delay = min(2**attempt, 30)
+            LOG.warning(
+                "%s failed: %r. Retrying in %ss (%s/%s).",
+                description,
+                ex,
+                delay,
+                attempt + 1,
+                retries,
+            )
+            time.sleep(delay)
+
+
+class ImageSpool:
+    """Spool a Glance image to a local file, allowing resumable downloads.
+
+    A sidecar checkpoint file records the number of bytes that were written
+    along with the checksum of the spooled data. Interrupted downloads are
+    resumed from the checkpoint using HTTP Range requests. The spooled data
+    is hashed again when resuming, since the hash state can't be persisted.
+    """
+
+    def __init__(
+        self,
+        session,
+        image,
+        spool_dir: Path,
+        chunk_size: int,
+        sparse: bool = False,
+    ):
+        if not chunk_size:
+            raise exception.InvalidInput("No image transfer chunk size provided.")
+
+        self._session = session
+        self._image = image
+        self._chunk_size = chunk_size
+        # Skip zero blocks, creating a sparse spool file.
+        self._sparse = sparse
+        self.path = spool_dir / f"{image.id}.img"
+        self.checkpoint_path = spool_dir / f"{image.id}.checkpoint"
+        # Used to store the converted image, if needed.
+        self.converted_path = spool_dir / f"{image.id}.qcow2"
+
+    def download(self, retries: int = 0) -> Path:
+        """Download the image, resuming previous transfers if possible.
+
+        Return the spool file path.
+        """
+        self.path.parent.mkdir(mode=0o750, parents=True, exist_ok=True)
+        try:
+            retry_on_failure(
+                self._download, retries, f"Image {self._image.id} download"
+            )
+        except exception.Invalid:
+            # The spooled data can't be trusted.
+            self.remove()
+            raise
+        return self.path
+
+    def remove(self):
+        """Remove the spool, checkpoint and converted image files."""
+        self.checkpoint_path.unlink(missing_ok=True)
+        self.path.unlink(missing_ok=True)
+        self.converted_path.unlink(missing_ok=True)
+
+    def _download(self):
+        offset, hashes = self._load_checkpoint()
+        if self._image.size and offset >= self._image.size:
+            LOG.info("Image %s already spooled: %s", self._image.id, self.path)
+            hashes.validate()
+            return
+
+        headers = {}
+        if offset:
+            LOG.info("Resuming image %s download from byte %s.", self._image.id, offset)
+            headers["Range"] = f"bytes={offset}-"
+        response = self._session.image.get(
+            _get_image_data_url(self._image), headers=headers, stream=True
+        )
+        openstack_exc.raise_from_response(response)
+        if offset and response.status_code != 206:
+            LOG.warning(
+                "The image service doesn't support ranged downloads, "
+                "restarting image %s download.",
+                self._image.id,
+            )
+            offset, hashes = 0, ImageHashes(self._image)
+
+        mode = "r+b" if self.path.exists() else "wb"
+        with self.path.open(mode) as spool_file, response:
+            spool_file.seek(offset)
+            spool_file.truncate()
+            for chunk in response.iter_content(chunk_size=self._chunk_size):
+                if self._sparse:
+                    image_conversion.write_sparse(spool_file, chunk)
+                else:
+                    spool_file.write(chunk)
+                hashes.update(chunk)
+                offset += len(chunk)
+
+                # Trailing holes don't extend the file.
+                spool_file.truncate(offset)
+                spool_file.flush()
+                os.fsync(spool_file.fileno())
+                self._save_checkpoint(offset, hashes)
+
+        hashes.validate()
+
+    def _load_checkpoint(self) -> tuple[int, ImageHashes]:
+        hashes = ImageHashes(self._image)
+        if not (self.checkpoint_path.exists() and self.path.exists()):
+            return 0, hashes
+
+        try:
+            checkpoint = json.loads(self.checkpoint_path.read_text())
+            offset = int(checkpoint["offset"])
+            valid = (
+                checkpoint["image_id"] == self._image.id
+                and checkpoint["image_checksum"] == self._image.checksum
+                and offset <= self.path.stat().st_size
+            )
+        except (ValueError, KeyError, TypeError) as ex:
+            LOG.warning("Invalid image checkpoint: %s, %r", self.checkpoint_path, ex)
+            return 0, hashes
+        if not valid:
+            LOG.info("Outdated image checkpoint: %s", self.checkpoint_path)
+            return 0, hashes
+
+        # Restore the hash state and validate the spooled data.
+        with self.path.open("rb") as spool_file:
+            remaining = offset
+            while remaining:
+                chunk = spool_file.read(min(self._chunk_size, remaining))
+                if not chunk:
+                    break
+                hashes.update(chunk)
+                remaining -= len(chunk)
+        if remaining or hashes.checksum != checkpoint["checksum"]:
+            LOG.warning("Corrupted image spool: %s, discarding it.", self.path)
+            return 0, ImageHashes(self._image)
+        return offset, hashes
+
+    def _save_checkpoint(self, offset: int, hashes: ImageHashes):
+        checkpoint = {
+            "image_id": self._image.id,
+            "image_checksum": self._image.checksum,
+            "offset": offset,
+            "checksum": hashes.checksum,
+        }
+        tmp_path = self.checkpoint_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(checkpoint))
+        tmp_path.replace(self.checkpoint_path)
@@ -0,0 +1,251 @@
+# SPDX-FileCopyrightText: 2025 - Canonical Ltd
+# SPDX-License-Identifier: Apache-2.0
+
+import datetime
+import logging
+import threading
+
+from sunbeam_migrate import config
+from sunbeam_migrate.db import api as db_api
+from sunbeam_migrate.utils import neutron_utils
+
+CONF = config.get_config()
+LOG = logging.getLogger()
+
+# Relation types:
+#   port-device: port -> device (e.g. instance)
+#   subnet-network: subnet -> network
+#   router-subnet: router -> internal subnet (router interfaces)
+#   floating-ip-port: floating IP -> port
+#   load-balancer-subnet: load balancer -> member subnet (default pools)
+LINK_TYPES = [
+    "port-device",
+    "subnet-network",
+    "router-subnet",
+    "floating-ip-port",
+    "load-balancer-subnet",
+]
+
+
+class InventoryCollector:
+    """Bulk list source resources and determine their relations.
+
+    A single paginated listing is performed for each resource type,
+    regardless of the number of resources.
+    """
+
+    def __init__(self, session):
+        self._session = session
+        self.resources: list[dict] = []
+        self.links: list[dict] = []
+
+    def collect(self):
+        """Collect the source inventory."""
+        self._collect_networks()
+        self._collect_subnets()
+        self._collect_ports()
+        self._collect_routers()
+        self._collect_floating_ips()
+        self._collect_security_groups()
+        self._collect_instances()
+        self._collect_volumes()
+        self._collect_images()
+        if self._session.has_service("load-balancer"):
+            self._collect_load_balancers()
+        else:
+            LOG.info("Octavia not available, skipping load balancers.")
+        if self._session.has_service("shared-file-system"):
+            self._collect_shares()
+        else:
+            LOG.info("Manila not available, skipping shares.")
+
+    def _add_resource(self, resource_type: str, resource):
+        self.resources.append(
+            {
+                "resource_type": resource_type,
+                "resource_id": resource.id,
+                "project_id": getattr(resource, "project_id", None),
+                "name": getattr(resource, "name", None),
+            }
+        )
+
+    def _add_link(self, link_type: str, resource_id: str, related_id: str | None):
+        if not related_id:
+            return
+        self.links.append(
+            {
+                "link_type": link_type,
+                "resource_id": resource_id,
+                "related_id": related_id,
+            }
+        )
+
+    def _collect_networks(self):
+        for network in self._session.network.networks():
+            self._add_resource("network", network)
+
+    def _collect_subnets(self):
+        for subnet in self._session.network.subnets():
+            self._add_resource("subnet", subnet)
+            self._add_link("subnet-network", subnet.id, subnet.network_id)
+
+    def _collect_ports(self):
+        for port in self._session.network.ports():
+            self._add_resource("port", port)
+            self._add_link("port-device", port.id, port.device_id)
+
+            subnet_ids = set()
+            for fixed_ip in port.fixed_ips or []:
+                subnet_id = fixed_ip.get("subnet_id")
+                if subnet_id:
+                    subnet_ids.add(subnet_id)
+
+            owner = port.device_owner or ""
+            if port.device_id and owner.startswith(
+                neutron_utils.ROUTER_INTERFACE_OWNERS
+            ):
+                for subnet_id in sorted(subnet_ids):
+                    self._add_link("router-subnet", port.device_id, subnet_id)
+
+    def _collect_routers(self):
+        for router in self._session.network.routers():
+            self._add_resource("router", router)
+
+    def _collect_floating_ips(self):
+        for floating_ip in self._session.network.ips():
+            self._add_resource("floating-ip", floating_ip)
+            self._add_link("floating-ip-port", floating_ip.id, floating_ip.port_id)
+
+    def _collect_security_groups(self):
+        for security_group in self._session.network.security_groups():
+            self._add_resource("security-group", security_group)
+
+    def _collect_instances(self):
+        for instance in self._session.compute.servers(all_projects=True):
+            self._add_resource("instance", instance)
+
+    def _collect_volumes(self):
+        for volume in self._session.block_storage.volumes(all_projects=True):
+            self._add_resource("volume", volume)
+
+    def _collect_images(self):
+        for image in self._session.image.images():
+            self._add_resource("image", image)
+
+    def _collect_load_balancers(self):
+        for load_balancer in self._session.load_balancer.load_balancers():
+            self._add_resource("load-balancer", load_balancer)
+
+        # Octavia doesn't allow listing all the pool members at once,
+        # so we're issuing one request per default pool.
+        for listener in self._session.load_balancer.listeners():
+            default_pool_id = listener.default_pool_id
+            if not default_pool_id:
+                continue
+            member_subnet_ids = set()
+            for member in self._session.load_balancer.members(default_pool_id):
+                if member.subnet_id:
+                    member_subnet_ids.add(member.subnet_id)
+            for load_balancer in listener.load_balancers or []:
+                for subnet_id in sorted(member_subnet_ids):
+                    self._add_link(
+                        "load-balancer-subnet", load_balancer["id"], subnet_id
+                    )
+
+    def _collect_shares(self):
+        for share in self._session.shared_file_system.shares(all_projects=True):
+            self._add_resource("share", share)
+
+
+def sync_inventory(session, cloud_name: str) -> list[dict]:
+    """Refresh the inventory snapshot of the specified cloud.
+
+    Return the list of collected resources.
+    """
+    LOG.info("Collecting %s inventory.", cloud_name)
+    collector = InventoryCollector(session)
+    collector.collect()
+    db_api.replace_inventory(cloud_name, collector.resources, collector.links)
+    reset_inventory_cache()
+    LOG.info(
+        "Stored %s inventory: %s resources, %s relations.",
+        cloud_name,
+        len(collector.resources),
+        len(collector.links),
+    )
+    return collector.resources
+
+
+class Inventory:
+    """Resolve resource relations using a local inventory snapshot."""
+
+    def __init__(self, cloud_name: str):
+        self._cloud_name = cloud_name
+
+    def get_related(self, link_type: str, resource_id: str) -> list[str]:
+        """Get the resources related to the specified resource.
+
+        :param link_type: the relation type, see LINK_TYPES.
+        :param resource_id: the resource id, e.g. a subnet id for
+            "subnet-network".
+        """
+        links = db_api.get_inventory_links(
+            self._cloud_name, link_type, resource_id=resource_id
+        )
+        return [link.related_id for link in links]
+
+    def get_reverse_related(self, link_type: str, related_id: str) -> list[str]:
+        """Resolve the specified relation in the opposite direction.
+
+        :param link_type: the relation type, see LINK_TYPES.
+        :param related_id: the related resource id, e.g. a network id
+            for "subnet-network".
+        """
+        links = db_api.get_inventory_links(
+            self._cloud_name, link_type, related_id=related_id
+        )
+        return [link.resource_id for link in links]
+
+
+_INVENTORIES: dict[str, Inventory | None] = {}
+_INVENTORIES_LOCK = threading.Lock()
+
+
+def get_inventory(cloud_name: str) -> Inventory | None:
+    """Get the inventory of the specified cloud.
+
+    Return None if there is no snapshot or if the snapshot is older than
+    "inventory_max_age".
+    """
+    with _INVENTORIES_LOCK:
+        if cloud_name not in _INVENTORIES:
+            _INVENTORIES[cloud_name] = _load_inventory(cloud_name)
+        return _INVENTORIES[cloud_name]
+
+
+def _load_inventory(cloud_name: str) -> Inventory | None:
+    if CONF.inventory_max_age <= 0:
+        return None
+
+    snapshot = db_api.get_inventory_snapshot(cloud_name)
+    if not snapshot:
+        return None
+
+    age = datetime.datetime.now() - snapshot.created_at
+    if age.total_seconds() > CONF.inventory_max_age:
+        LOG.info(
+            "The %s inventory snapshot is outdated (%s), ignoring it. "
+            "Use 'sunbeam-migrate inventory sync' to refresh it.",
+            cloud_name,
+            age,
+        )
+        return None
+
+    LOG.debug("Using %s inventory snapshot from %s.", cloud_name, snapshot.created_at)
+    return Inventory(cloud_name)
+
+
+def reset_inventory_cache():
+    """Forget the loaded inventories, picking up new snapshots."""
+    with _INVENTORIES_LOCK:
+        _INVENTORIES.clear()
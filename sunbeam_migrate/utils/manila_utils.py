@@ -2,16 +2,20 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import contextlib
+import dataclasses
 import logging
 import os
-import re
 import socket
 import subprocess
+import threading
+import typing
 from collections.abc import Generator
+from concurrent import futures
 
 from openstack import exceptions as openstack_exc
 
 from sunbeam_migrate import config, exception
+from sunbeam_migrate.utils import net_utils
 
 CONF = config.get_config()
 LOG = logging.getLogger()
@@ -27,28 +31,20 @@ def get_share_export_path(sdk_conn, share_id: str) -> str:
     return export_locations[0].path
 
 
-def _get_local_ip_for_remote(remote_ip: str) -> str:
-    cmd = ["ip", "route", "get", remote_ip]
-    # Determine which local IP will be used to contact the specified remote IP.
-    output = subprocess.check_output(cmd, text=True)
-    # Output examples:
-    #   local 192.168.99.206 dev lo table local src 192.168.99.206 uid 1000
-    #   8.8.8.8 via 192.168.30.1 dev eth0 src 192.168.99.206 uid 1000
-    ips = re.findall(r"src ([\w.:]+)", output)
-    if not ips:
-        raise exception.NotFound(f"Unable to determine the route to {remote_ip}.")
-    return ips[0]
+def _get_access_ip(export_path: str) -> str:
+    if CONF.manila_local_access_ip:
+        return CONF.manila_local_access_ip
+    export_address = export_path.split("/", 1)[0].strip(":")
+    export_ip = socket.gethostbyname(export_address)
+    return net_utils.get_local_ip_for_remote(export_ip)
 
 
-@contextlib.contextmanager
-def temporary_share_access(sdk_conn, share, export_path: str, access_level="rw"):
-    if CONF.manila_local_access_ip:
-        access_ip = CONF.manila_local_access_ip
-    else:
-        export_address = export_path.split("/", 1)[0].strip(":")
-        export_ip = socket.gethostbyname(export_address)
-        access_ip = _get_local_ip_for_remote(export_ip)
+def _create_share_access(sdk_conn, share, access_ip: str, access_level: str):
+    """Allow the specified IP to access the share.
 
+    Returns the id of the temporary access rule or None if the access was
+    already provided.
+    """
     try:
         existing_rules = sdk_conn.shared_file_system.access_rules(share)
         for rule in existing_rules:
@@ -58,17 +54,16 @@ def temporary_share_access(sdk_conn, share, export_path: str, access_level="rw")
                 and rule.access_type == "ip"
             ):
                 LOG.info("Share access already provided: %s", rule.id)
-                yield
-                return
+                return None
     except openstack_exc.NotFoundException:
         # No access rules have been defined yet.
         pass
 
+    LOG.info("Adding temporary share access rule: %s to ip %s", share.id, access_ip)
+    access_rule = sdk_conn.shared_file_system.create_access_rule(
+        share.id, access_to=access_ip, access_type="ip", access_level=access_level
+    )
     try:
-        LOG.info("Adding temporary share access rule: %s to ip %s", share.id, access_ip)
-        access_rule = sdk_conn.shared_file_system.create_access_rule(
-            share.id, access_to=access_ip, access_type="ip", access_level=access_level
-        )
         LOG.info("Waiting for share access rule to become active.")
         sdk_conn.shared_file_system.wait_for_status(
             access_rule,
@@ -78,30 +73,260 @@ def temporary_share_access(sdk_conn, share, export_path: str, access_level="rw")
             interval=5,
             wait=CONF.resource_creation_timeout,
         )
-        yield
-    finally:
-        LOG.info(
-            "Deleting temporary share access rule: %s to ip %s", share.id, access_ip
-        )
-        sdk_conn.shared_file_system.delete_access_rule(access_rule.id, share.id)
+    except Exception:
+        _delete_share_access(sdk_conn, share.id, access_rule.id)
+        raise
+    return access_rule.id
 
 
-@contextlib.contextmanager
-def mounted_nfs_share(sdk_conn, share, access_level="rw") -> Generator[str]:
-    export_path = get_share_export_path(sdk_conn, share.id)
+def _delete_share_access(sdk_conn, share_id: str, access_rule_id: str):
+    LOG.info("Deleting temporary share access rule: %s", share_id)
+    sdk_conn.shared_file_system.delete_access_rule(access_rule_id, share_id)
+
+
+@dataclasses.dataclass
+class _ShareAccess:
+    sdk_conn: typing.Any
+    share_id: str
+    export_path: str
+    # None if the access rule was not created by us.
+    access_rule_id: str | None
+
+
+@dataclasses.dataclass
+class _ShareMount:
+    access: _ShareAccess
+    mountpoint: str
+    refcount: int = 0
 
-    base_dir = CONF.temporary_migration_dir
-    mount_dirname = f"{share.id}.{int.from_bytes(os.urandom(4))}"
-    mountpoint = str(base_dir / mount_dirname)
-    os.makedirs(mountpoint)
 
-    with temporary_share_access(sdk_conn, share, export_path, access_level):
-        mount_nfs_share(export_path, mountpoint)
+class ShareMountManager:
+    """Process-wide registry of NFS share mounts and access rules.
+
+    Adding a temporary access rule and waiting for it to become active often
+    takes longer than copying the data of small shares. During batch
+    migrations, the access rules and mounts are kept until the batch
+    completes, when they are released in bulk. Outside batches, the mounts
+    and access rules are released as soon as they are no longer used.
+
+    The mounts are refcounted, allowing them to be shared by concurrent
+    migrations.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._access: dict[tuple[str, str], futures.Future] = {}
+        self._mounts: dict[tuple[str, str], futures.Future] = {}
+        self._batch_depth = 0
+
+    @contextlib.contextmanager
+    def batch(self) -> Generator[None]:
+        """Keep the mounts and access rules until the batch completes."""
+        with self._lock:
+            self._batch_depth += 1
         try:
-            yield mountpoint
+            yield
         finally:
-            unmount_nfs_share(mountpoint)
-            os.rmdir(mountpoint)
+            with self._lock:
+                self._batch_depth -= 1
+                batch_completed = not self._batch_depth
+            if batch_completed:
+                self.release_all()
+
+    def _get_or_create(self, registry: dict, key: tuple, create_func):
+        owner = False
+        with self._lock:
+            future: futures.Future | None = registry.get(key)
+            if future is None:
+                owner = True
+                future = futures.Future()
+                registry[key] = future
+
+        if owner:
+            try:
+                future.set_result(create_func())
+            except Exception as ex:
+                with self._lock:
+                    registry.pop(key, None)
+                future.set_exception(ex)
+        return future.result()
+
+    def ensure_share_access(
+        self, sdk_conn, share, access_level: str = "rw"
+    ) -> _ShareAccess:
+        """Ensure that the share can be accessed by this host.
+
+        :param sdk_conn: the Openstack connection used to manage the share.
+        :param share: the Manila share.
+        :param access_level: the requested access level.
+        """
+
+        def _create():
+            export_path = get_share_export_path(sdk_conn, share.id)
+            access_ip = _get_access_ip(export_path)
+            access_rule_id = _create_share_access(
+                sdk_conn, share, access_ip, access_level
+            )
+            return _ShareAccess(sdk_conn, share.id, export_path, access_rule_id)
+
+        return self._get_or_create(self._access, (share.id, access_level), _create)
+
+    def prepare_share_access(self, sdk_conn, shares: list, access_level: str = "rw"):
+        """Concurrently ensure that the specified shares can be accessed.
+
+        Failures are logged and ignored, the access rules are going to be
+        requested again when mounting the shares.
+        """
+        concurrency = max(1, CONF.share_access_rule_concurrency)
+        with futures.ThreadPoolExecutor(max_workers=concurrency) as pool:
+            future_map = {
+                pool.submit(
+                    self.ensure_share_access, sdk_conn, share, access_level
+                ): share
+                for share in shares
+            }
+            for future in futures.as_completed(future_map):
+                if future.exception():
+                    LOG.warning(
+                        "Unable to provide share access: %s, error: %r",
+                        future_map[future].id,
+                        future.exception(),
+                    )
+
+    @contextlib.contextmanager
+    def mounted_share(self, sdk_conn, share, access_level="rw") -> Generator[str]:
+        """Mount the specified share, reusing existing mounts."""
+        key = (share.id, access_level)
+
+        def _create():
+            access = self.ensure_share_access(sdk_conn, share, access_level)
+            base_dir = CONF.temporary_migration_dir
+            mount_dirname = f"{share.id}.{int.from_bytes(os.urandom(4))}"
+            mountpoint = str(base_dir / mount_dirname)
+            os.makedirs(mountpoint)
+            try:
+                mount_nfs_share(access.export_path, mountpoint)
+            except Exception:
+                os.rmdir(mountpoint)
+                raise
+            return _ShareMount(access, mountpoint)
+
+        while True:
+            mount = self._get_or_create(self._mounts, key, _create)
+            with self._lock:
+                # Make sure that the mount wasn't released in the meantime.
+                future = self._mounts.get(key)
+                if future and future.done() and future.result() is mount:
+                    mount.refcount += 1
+                    break
+
+        try:
+            yield mount.mountpoint
+        finally:
+            with self._lock:
+                mount.refcount -= 1
+                release = not mount.refcount and not self._batch_depth
+                if release:
+                    self._mounts.pop(key)
+                    self._access.pop(key, None)
+            if release:
+                self._release([mount], [mount.access])
+
+    def release_all(self):
+        """Unmount the unused shares and delete the temporary access rules."""
+        self._release_unused()
+
+    def release_share(self, share_id: str):
+        """Unmount the specified share and delete its temporary access rules.
+
+        Used before deleting the share, without waiting for the current
+        batch to complete.
+        """
+        self._release_unused(share_id)
+
+    def _release_unused(self, share_id: str | None = None):
+        with self._lock:
+            mounts: list[_ShareMount] = []
+            for key, future in list(self._mounts.items()):
+                if share_id and key[0] != share_id:
+                    continue
+                if not future.done() or future.exception():
+                    continue
+                if future.result().refcount:
+                    LOG.warning("Share still in use, not unmounting: %s", key[0])
+                    continue
+                mounts.append(future.result())
+                self._mounts.pop(key)
+
+            used_keys = set(self._mounts)
+            access: list[_ShareAccess] = []
+            for key, future in list(self._access.items()):
+                if share_id and key[0] != share_id:
+                    continue
+                if key in used_keys or not future.done() or future.exception():
+                    continue
+                access.append(future.result())
+                self._access.pop(key)
+
+        self._release(mounts, access)
+
+    def _release(self, mounts: list[_ShareMount], access: list[_ShareAccess]):
+        # Failures are logged, allowing the remaining shares to be released.
+        for mount in mounts:
+            try:
+                unmount_nfs_share(mount.mountpoint)
+                os.rmdir(mount.mountpoint)
+            except Exception as ex:
+                LOG.error(
+                    "Unable to unmount share: %s, mountpoint: %s, error: %r",
+                    mount.access.share_id,
+                    mount.mountpoint,
+                    ex,
+                )
+        self._delete_access_rules(access)
+
+    def _delete_access_rules(self, access: list[_ShareAccess]):
+        access_rules = [item for item in access if item.access_rule_id]
+        if not access_rules:
+            return
+
+        concurrency = max(1, CONF.share_access_rule_concurrency)
+        with futures.ThreadPoolExecutor(max_workers=concurrency) as pool:
+            future_map = {
+                pool.submit(
+                    _delete_share_access,
+                    item.sdk_conn,
+                    item.share_id,
+                    typing.cast(str, item.access_rule_id),
+                ): item
+                for item in access_rules
+            }
+            for future in futures.as_completed(future_map):
+                if future.exception():
+                    LOG.error(
+                        "Unable to delete share access rule: %s, error: %r",
+                        future_map[future].access_rule_id,
+                        future.exception(),
+                    )
+
+
+_MOUNT_MANAGER: ShareMountManager | None = None
+_MOUNT_MANAGER_LOCK = threading.Lock()
+
+
+def get_mount_manager() -> ShareMountManager:
+    """Retrieve the global share mount manager."""
+    global _MOUNT_MANAGER
+    with _MOUNT_MANAGER_LOCK:
+        if not _MOUNT_MANAGER:
+            _MOUNT_MANAGER = ShareMountManager()
+        return _MOUNT_MANAGER
+
+
+@contextlib.contextmanager
+def mounted_nfs_share(sdk_conn, share, access_level="rw") -> Generator[str]:
+    with get_mount_manager().mounted_share(sdk_conn, share, access_level) as mountpoint:
+        yield mountpoint
 
 
 def mount_nfs_share(export_path: str, mountpoint: str):
@@ -110,7 +335,7 @@ def mount_nfs_share(export_path: str, mountpoint: str):
     subprocess.check_call(cmd, text=True)
 
 
-def unmount_nfs_share(mountpoint: str):
-    LOG.info("Unmounting nfs share: %s", mountpoint)
-    cmd = ["sudo", "umount", "-f", mountpoint]
+def unmount_nfs_share(*mountpoints: str):
+    LOG.info("Unmounting nfs shares: %s", ", ".join(mountpoints))
+    cmd = ["sudo", "umount", "-f", *mountpoints]
     subprocess.check_call(cmd, text=True)
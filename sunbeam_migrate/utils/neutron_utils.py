@@ -1,8 +1,20 @@
 # SPDX-FileCopyrightText: 2025 - Canonical Ltd
 # SPDX-License-Identifier: Apache-2.0
 
+import collections
+import logging
+import threading
+
 from sunbeam_migrate import exception
 
+LOG = logging.getLogger()
+
+ROUTER_INTERFACE_OWNERS = (
+    "network:router_interface",
+    "network:router_interface_distributed",
+    "network:ha_router_replicated_interface",
+)
+
 
 def get_router_interface_subnets(session, router_id: str) -> list[str]:
     """Get the list of internal subnets connected to a router."""
@@ -12,16 +24,10 @@ def get_router_interface_subnets(session, router_id: str) -> list[str]:
 
     member_subnet_ids = set()
 
-    internal_owner_prefixes = (
-        "network:router_interface",
-        "network:router_interface_distributed",
-        "network:ha_router_replicated_interface",
-    )
-
     # Fetch all ports whose device_id == router.id
     for port in session.network.ports(device_id=router.id):
         owner = getattr(port, "device_owner", "") or ""
-        if not any(owner.startswith(prefix) for prefix in internal_owner_prefixes):
+        if not owner.startswith(ROUTER_INTERFACE_OWNERS):
             continue
 
         for ip in getattr(port, "fixed_ips", []) or []:
@@ -30,3 +36,76 @@ def get_router_interface_subnets(session, router_id: str) -> list[str]:
                 member_subnet_ids.add(subnet_id)
 
     return list(member_subnet_ids)
+
+
+class RouterInterfaceIndex:
+    """Map routers and networks to the connected router interface subnets."""
+
+    def __init__(self):
+        self._router_subnets: dict[str, list[str]] = collections.defaultdict(list)
+        self._network_interfaces: dict[str, list[tuple[str, str]]] = (
+            collections.defaultdict(list)
+        )
+
+    def add_interface(self, router_id: str, subnet_id: str, network_id: str):
+        """Register a router interface."""
+        if subnet_id not in self._router_subnets[router_id]:
+            self._router_subnets[router_id].append(subnet_id)
+            self._network_interfaces[network_id].append((router_id, subnet_id))
+
+    def get_router_subnets(self, router_id: str) -> list[str]:
+        """Get the internal subnets connected to the specified router."""
+        return list(self._router_subnets.get(router_id, []))
+
+    def get_network_router(self, network_id: str) -> tuple[str | None, str | None]:
+        """Get a router connected to the specified network.
+
+        Return a (router_id, subnet_id) tuple or (None, None) if the network
+        isn't connected to any router.
+        """
+        interfaces = self._network_interfaces.get(network_id)
+        if not interfaces:
+            return (None, None)
+        return interfaces[0]
+
+
+def build_router_interface_index(session) -> RouterInterfaceIndex:
+    """Build the router interface index using bulk listings.
+
+    The subnets are listed once, along with the router interface ports of
+    each device owner type, regardless of the number of routers.
+    """
+    subnet_networks = {
+        subnet.id: subnet.network_id for subnet in session.network.subnets()
+    }
+
+    index = RouterInterfaceIndex()
+    for device_owner in ROUTER_INTERFACE_OWNERS:
+        for port in session.network.ports(device_owner=device_owner):
+            for fixed_ip in getattr(port, "fixed_ips", []) or []:
+                subnet_id = fixed_ip.get("subnet_id")
+                network_id = subnet_networks.get(subnet_id)
+                if subnet_id and network_id:
+                    index.add_interface(port.device_id, subnet_id, network_id)
+    return index
+
+
+_ROUTER_INTERFACE_INDEXES: dict[str, RouterInterfaceIndex] = {}
+_ROUTER_INTERFACE_INDEXES_LOCK = threading.Lock()
+
+
+def get_router_interface_index(session) -> RouterInterfaceIndex:
+    """Get the router interface index of the specified cloud.
+
+    The index is built once per run and shared by the migration handlers.
+    Only use it for source clouds, which aren't expected to change during
+    the migration.
+    """
+    cloud_name = session.config.name
+    with _ROUTER_INTERFACE_INDEXES_LOCK:
+        if cloud_name not in _ROUTER_INTERFACE_INDEXES:
+            LOG.debug("Building %s router interface index.", cloud_name)
+            _ROUTER_INTERFACE_INDEXES[cloud_name] = build_router_interface_index(
+                session
+            )
+        return _ROUTER_INTERFACE_INDEXES[cloud_name]
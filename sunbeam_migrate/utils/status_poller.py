@@ -0,0 +1,534 @@
+# SPDX-FileCopyrightText: 2025 - Canonical Ltd
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Batched resource status poller.
+
+Waiting for resources using the SDK "wait_for_*" helpers requires one GET
+request per resource on every polling interval. When performing concurrent
+migrations, this adds up quickly.
+
+The status poller tracks all the resources that are being waited for and
+uses a single list request per resource type and transitional status
+(e.g. servers with the "BUILD" status) on each polling cycle. Resources that
+are no longer in a transitional status are retrieved individually, once.
+
+Each resource is polled based on its expected duration, estimated using the
+durations observed for similar resources (same type and size bucket). The
+resources are polled sparsely at first and then more often as the expected
+completion time approaches. If the expected duration is unknown, the polling
+interval is increased gradually.
+"""
+
+import logging
+import statistics
+import threading
+import time
+import typing
+from concurrent import futures
+from typing import Any, Callable, Iterable
+
+from openstack import exceptions as openstack_exc
+from openstack.dns.v2 import zone_export as _zone_export
+
+from sunbeam_migrate import config, exception
+from sunbeam_migrate.db import api as db_api
+from sunbeam_migrate.db import models
+
+CONF = config.get_config()
+LOG = logging.getLogger()
+
+# The polling interval is multiplied by this factor if the expected duration
+# is unknown or exceeded.
+BACKOFF_FACTOR = 1.5
+# When the expected duration is known, the polling interval may reach this
+# fraction of the expected duration.
+EXPECTED_DURATION_POLL_RATIO = 0.1
+# The number of recent durations used to estimate the expected duration.
+TIMING_SAMPLE_COUNT = 20
+TIMING_MIN_SAMPLE_COUNT = 3
+
+GiB = 1024**3
+
+
+class PolledResourceType(typing.NamedTuple):
+    """Describes how to poll a given type of resources."""
+
+    # Lists the resources having the specified status.
+    list_resources: Callable[[Any, str], Iterable[Any]]
+    get_resource: Callable[[Any, str], Any]
+    # The statuses of the resources that are still being processed.
+    pending_statuses: list[str]
+    attribute: str = "status"
+
+
+def _list_dns_zone_exports(session, status: str) -> list[Any]:
+    # The SDK zone export resource uses an outdated API path.
+    response = session.dns.get(
+        "/zones/tasks/exports", params={"status": status}, raise_exc=False
+    )
+    openstack_exc.raise_from_response(response)
+    return [
+        _zone_export.ZoneExport.existing(**export)
+        for export in response.json()["exports"]
+    ]
+
+
+def _get_dns_zone_export(session, export_id: str) -> Any:
+    response = session.dns.get(f"/zones/tasks/exports/{export_id}", raise_exc=False)
+    openstack_exc.raise_from_response(response)
+    return _zone_export.ZoneExport.existing(**response.json())
+
+
+POLLED_RESOURCE_TYPES: dict[str, PolledResourceType] = {
+    "dns-zone-export": PolledResourceType(
+        list_resources=_list_dns_zone_exports,
+        get_resource=_get_dns_zone_export,
+        pending_statuses=["PENDING"],
+    ),
+    "dns-zone-import": PolledResourceType(
+        list_resources=lambda session, status: session.dns.zone_imports(status=status),
+        get_resource=lambda session, id: session.dns.get_zone_import(id),
+        pending_statuses=["PENDING"],
+    ),
+    "image": PolledResourceType(
+        list_resources=lambda session, status: session.image.images(status=status),
+        get_resource=lambda session, id: session.image.get_image(id),
+        pending_statuses=["queued", "saving", "uploading", "importing"],
+    ),
+    "instance": PolledResourceType(
+        list_resources=lambda session, status: session.compute.servers(
+            all_projects=True, status=status
+        ),
+        get_resource=lambda session, id: session.compute.get_server(id),
+        pending_statuses=["BUILD"],
+    ),
+    "load-balancer": PolledResourceType(
+        list_resources=lambda session, status: session.load_balancer.load_balancers(
+            provisioning_status=status
+        ),
+        get_resource=lambda session, id: session.load_balancer.get_load_balancer(id),
+        pending_statuses=["PENDING_CREATE", "PENDING_UPDATE"],
+        attribute="provisioning_status",
+    ),
+    "share": PolledResourceType(
+        list_resources=lambda session, status: session.shared_file_system.shares(
+            all_projects=True, status=status
+        ),
+        get_resource=lambda session, id: session.shared_file_system.get_share(id),
+        pending_statuses=["creating"],
+    ),
+    "volume": PolledResourceType(
+        list_resources=lambda session, status: session.block_storage.volumes(
+            all_projects=True, status=status
+        ),
+        get_resource=lambda session, id: session.block_storage.get_volume(id),
+        pending_statuses=["creating", "downloading"],
+    ),
+}
+
+
+def _normalize_status(status: str | None) -> str | None:
+    return status.lower() if status else status
+
+
+def get_size_bucket(size: int | None) -> int:
+    """Get the size bucket of a resource, based on its size in bytes.
+
+    Bucket N covers sizes up to 2^N GiB, bucket 0 being used for resources
+    smaller than 1GiB or having an unknown size.
+    """
+    if not size:
+        return 0
+    return max(0, (size - 1).bit_length() - 30)
+
+
+def get_poll_interval(
+    elapsed: float,
+    expected: float | None,
+    previous_interval: float,
+    min_interval: float,
+    max_interval: float,
+) -> float:
+    """Get the delay until the next status check.
+
+    If the expected duration is known, the resource is polled sparsely at
+    first and then more often as the expected completion time approaches.
+    Otherwise, or if the resource is overdue, the interval is increased
+    gradually, starting from the previous interval.
+
+    :param elapsed: the number of seconds since the wait started.
+    :param expected: the expected duration, if known.
+    :param previous_interval: the previous polling interval.
+    :param min_interval: the minimum polling interval.
+    :param max_interval: the maximum polling interval used when the expected
+        duration is unknown.
+    """
+    if expected is None or elapsed >= expected:
+        return min(previous_interval * BACKOFF_FACTOR, max_interval)
+
+    remaining = expected - elapsed
+    sparse_max_interval = max(max_interval, expected * EXPECTED_DURATION_POLL_RATIO)
+    return max(min_interval, min(remaining / 2, sparse_max_interval))
+
+
+class WaitTimingHistory:
+    """Track how long the resources take to reach the requested status.
+
+    The observed durations are stored in the migration database, per
+    resource type, operation and size bucket. Only the most recent
+    durations are kept.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._samples: dict[tuple[str, str, int], list[float]] = {}
+
+    def _get_samples(
+        self, resource_type: str, operation: str, size_bucket: int
+    ) -> list[float]:
+        # The caller is expected to hold the lock.
+        key = (resource_type, operation, size_bucket)
+        if key not in self._samples:
+            self._samples[key] = [
+                timing.duration_ms / 1000
+                for timing in db_api.get_wait_timings(
+                    resource_type, operation, size_bucket, limit=TIMING_SAMPLE_COUNT
+                )
+            ]
+        return self._samples[key]
+
+    def get_expected_duration(
+        self, resource_type: str, operation: str, size_bucket: int
+    ) -> float | None:
+        """Get the median of the recent durations, if enough are available."""
+        with self._lock:
+            samples = self._get_samples(resource_type, operation, size_bucket)
+            if len(samples) < TIMING_MIN_SAMPLE_COUNT:
+                return None
+            return statistics.median(samples)
+
+    def record(
+        self, resource_type: str, operation: str, size_bucket: int, duration: float
+    ):
+        """Record an observed duration, discarding the old ones."""
+        with self._lock:
+            samples = self._get_samples(resource_type, operation, size_bucket)
+            samples.insert(0, duration)
+            del samples[TIMING_SAMPLE_COUNT:]
+        models.WaitTiming(
+            resource_type=resource_type,
+            operation=operation,
+            size_bucket=size_bucket,
+            duration_ms=int(duration * 1000),
+        ).save()
+        db_api.prune_wait_timings(
+            resource_type, operation, size_bucket, keep=TIMING_SAMPLE_COUNT
+        )
+
+
+class _Waiter:
+    def __init__(
+        self,
+        resource_id: str,
+        status: str,
+        failures: list[str],
+        wait: float | None,
+        operation: str | None,
+        size_bucket: int,
+        expected_duration: float | None,
+        interval: float,
+    ):
+        self.resource_id = resource_id
+        self.status = status
+        self.failures = failures
+        self.operation = operation
+        self.size_bucket = size_bucket
+        self.expected_duration = expected_duration
+        self.interval = interval
+        self.future: futures.Future = futures.Future()
+
+        self.started_at = time.monotonic()
+        self.deadline = self.started_at + wait if wait is not None else None
+        self.next_poll_at = self.started_at
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at
+
+
+class StatusPoller:
+    """Wait for multiple resources using batched status requests."""
+
+    def __init__(
+        self,
+        min_interval: float,
+        max_interval: float,
+        timing_history: WaitTimingHistory | None = None,
+    ):
+        """Initialize the status poller.
+
+        :param min_interval: the minimum polling interval.
+        :param max_interval: the maximum polling interval used for resources
+            having an unknown expected duration.
+        :param timing_history: used to estimate the expected durations based
+            on previous waits. If unset, the polling interval is gradually
+            increased, starting from the minimum interval.
+        """
+        self._min_interval = min_interval
+        self._max_interval = max(min_interval, max_interval)
+        self._timing_history = timing_history
+
+        self._cond = threading.Condition()
+        # The waiters, grouped by session and resource type.
+        self._waiters: dict[tuple[int, str], list[_Waiter]] = {}
+        self._sessions: dict[int, Any] = {}
+        self._thread: threading.Thread | None = None
+
+    def wait_for_status(
+        self,
+        session,
+        resource_type: str,
+        resource_id: str,
+        status: str,
+        failures: list[str] | None = None,
+        wait: float | None = None,
+        size: int | None = None,
+        operation: str | None = None,
+    ):
+        """Wait for the specified resource to reach the requested status.
+
+        :param session: the Openstack session used to retrieve the resource.
+        :param resource_type: one of the POLLED_RESOURCE_TYPES keys.
+        :param resource_id: the resource id.
+        :param status: the expected status.
+        :param failures: statuses that indicate a failed transition.
+        :param wait: the maximum number of seconds to wait, None to wait
+            forever.
+        :param size: the resource size in bytes, if applicable. Used to
+            estimate the expected duration.
+        :param operation: the operation that is waited for (e.g. "create",
+            "snapshot"). The expected duration is only estimated for the
+            specified operations, since different operations on the same
+            type of resource may take very different amounts of time.
+
+        Returns the updated resource. Raises ResourceFailure if the resource
+        transitions to a failure status or goes away and ResourceTimeout if
+        the timeout is reached.
+        """
+        return self.register(
+            session, resource_type, resource_id, status, failures, wait, size, operation
+        ).result()
+
+    def register(
+        self,
+        session,
+        resource_type: str,
+        resource_id: str,
+        status: str,
+        failures: list[str] | None = None,
+        wait: float | None = None,
+        size: int | None = None,
+        operation: str | None = None,
+    ) -> futures.Future:
+        """Register a waiter, returning a future that provides the resource."""
+        if resource_type not in POLLED_RESOURCE_TYPES:
+            raise exception.InvalidInput(
+                f"Unsupported polled resource type: {resource_type}"
+            )
+
+        size_bucket = get_size_bucket(size)
+        expected_duration = None
+        if self._timing_history and operation:
+            try:
+                expected_duration = self._timing_history.get_expected_duration(
+                    resource_type, operation, size_bucket
+                )
+            except Exception as ex:
+                LOG.debug("Unable to retrieve the wait timings: %r", ex)
+
+        waiter = _Waiter(
+            resource_id=resource_id,
+            status=status,
+            failures=[failure.lower() for failure in failures or ["error"]],
+            wait=wait,
+            operation=operation,
+            size_bucket=size_bucket,
+            expected_duration=expected_duration,
+            interval=self._min_interval / BACKOFF_FACTOR,
+        )
+        self._schedule(waiter)
+        LOG.debug(
+            "Waiting for %s %s, expected duration: %s",
+            resource_type,
+            resource_id,
+            expected_duration,
+        )
+        with self._cond:
+            self._sessions[id(session)] = session
+            self._waiters.setdefault((id(session), resource_type), []).append(waiter)
+            if self._thread:
+                self._cond.notify()
+            else:
+                self._thread = threading.Thread(
+                    target=self._run, name="status-poller", daemon=True
+                )
+                self._thread.start()
+        return waiter.future
+
+    def get_waiter_count(self) -> int:
+        """Get the number of resources that are being waited for."""
+        with self._cond:
+            return sum(len(waiters) for waiters in self._waiters.values())
+
+    def _schedule(self, waiter: _Waiter):
+        waiter.interval = get_poll_interval(
+            waiter.elapsed,
+            waiter.expected_duration,
+            waiter.interval,
+            self._min_interval,
+            self._max_interval,
+        )
+        waiter.next_poll_at = time.monotonic() + waiter.interval
+        if waiter.deadline is not None:
+            waiter.next_poll_at = min(waiter.next_poll_at, waiter.deadline)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                if not self._waiters:
+                    self._thread = None
+                    return
+
+                # Sleep until the next resource is due, new waiters
+                # wake us up.
+                next_poll_at = min(
+                    waiter.next_poll_at
+                    for waiters in self._waiters.values()
+                    for waiter in waiters
+                )
+                delay = next_poll_at - time.monotonic()
+                if delay > 0:
+                    self._cond.wait(delay)
+                    continue
+
+                # The resources of a given type are polled together as soon
+                # as one of them is due.
+                now = time.monotonic()
+                groups = [
+                    (self._sessions[session_id], resource_type, list(waiters))
+                    for (session_id, resource_type), waiters in self._waiters.items()
+                    if any(waiter.next_poll_at <= now for waiter in waiters)
+                ]
+
+            for session, resource_type, waiters in groups:
+                self._poll(session, resource_type, waiters)
+
+    def _poll(self, session, resource_type: str, waiters: list[_Waiter]):
+        """Poll the specified resources."""
+        resource_spec = POLLED_RESOURCE_TYPES[resource_type]
+
+        # Resources that are missing from the listing are retrieved
+        # individually.
+        pending_resources: dict[str, Any] = {}
+        try:
+            for pending_status in resource_spec.pending_statuses:
+                for resource in resource_spec.list_resources(session, pending_status):
+                    pending_resources[resource.id] = resource
+        except Exception as ex:
+            LOG.debug("Unable to list %s resources: %r", resource_type, ex)
+            pending_resources.clear()
+
+        # The waiters are woken up after being unregistered.
+        finished: list[tuple[_Waiter, Any, Exception | None]] = []
+        for waiter in waiters:
+            try:
+                if waiter.resource_id in pending_resources:
+                    resource = pending_resources[waiter.resource_id]
+                else:
+                    resource = resource_spec.get_resource(session, waiter.resource_id)
+                if self._check_status(
+                    resource_type, resource_spec.attribute, resource, waiter
+                ):
+                    self._record_timing(resource_type, waiter)
+                    finished.append((waiter, resource, None))
+                else:
+                    self._schedule(waiter)
+            except openstack_exc.NotFoundException:
+                failure = openstack_exc.ResourceFailure(
+                    f"{resource_type}:{waiter.resource_id} went away while "
+                    f"waiting for {waiter.status}"
+                )
+                finished.append((waiter, None, failure))
+            except Exception as ex:
+                finished.append((waiter, None, ex))
+
+        if finished:
+            with self._cond:
+                group = self._waiters[(id(session), resource_type)]
+                for waiter, _, _ in finished:
+                    group.remove(waiter)
+                if not group:
+                    self._waiters.pop((id(session), resource_type))
+                    if not any(key[0] == id(session) for key in self._waiters):
+                        self._sessions.pop(id(session))
+
+        for waiter, resource, error in finished:
+            if error:
+                waiter.future.set_exception(error)
+            else:
+                waiter.future.set_result(resource)
+
+    def _record_timing(self, resource_type: str, waiter: _Waiter):
+        if not self._timing_history or not waiter.operation:
+            return
+        try:
+            self._timing_history.record(
+                resource_type, waiter.operation, waiter.size_bucket, waiter.elapsed
+            )
+        except Exception as ex:
+            LOG.debug("Unable to record the wait timing: %r", ex)
+
+    def _check_status(
+        self, resource_type: str, attribute: str, resource, waiter: _Waiter
+    ) -> bool:
+        """Check whether the waiter is done, raising an exception on failure."""
+        name = f"{resource_type}:{waiter.resource_id}"
+        status = getattr(resource, attribute)
+        normalized_status = _normalize_status(status)
+        if normalized_status == _normalize_status(waiter.status):
+            return True
+        if normalized_status in waiter.failures:
+            raise openstack_exc.ResourceFailure(
+                f"{name} transitioned to failure state {status}"
+            )
+        if waiter.deadline is not None and time.monotonic() > waiter.deadline:
+            raise openstack_exc.ResourceTimeout(
+                f"Timeout waiting for {name} to transition to {waiter.status}"
+            )
+        LOG.debug(
+            "Still waiting for %s to reach state %s, current state is %s",
+            name,
+            waiter.status,
+            status,
+        )
+        return False
+
+
+_STATUS_POLLER: StatusPoller | None = None
+_STATUS_POLLER_LOCK = threading.Lock()
+
+
+def get_status_poller() -> StatusPoller:
+    """Retrieve the shared status poller."""
+    global _STATUS_POLLER
+    with _STATUS_POLLER_LOCK:
+        if not _STATUS_POLLER:
+            _STATUS_POLLER = StatusPoller(
+                min_interval=CONF.status_poll_interval,
+                max_interval=CONF.status_poll_max_interval,
+                timing_history=(
+                    WaitTimingHistory() if CONF.adaptive_status_polling else None
+                ),
+            )
+        return _STATUS_POLLER